@@ -0,0 +1,11 @@
+from repositories.matching_repository import backfill_proficiency_levels
+
+
+def main() -> None:
+  """One-off migration: add integer levels to existing skill relationships."""
+  updated = backfill_proficiency_levels()
+  print(f"Backfilled proficiency levels on {updated} relationships.")
+
+
+if __name__ == "__main__":
+  main()
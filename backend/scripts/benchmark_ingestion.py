@@ -0,0 +1,276 @@
+import argparse
+import functools
+import json
+import random
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from faker import Faker
+from neo4j import Session
+from shared_types.programmer_types import ProgrammerQuery
+
+from core.models.cv_models import CVSkill, CVStructure
+from core.models.project_models import ProjectStructure
+from core.models.rfp_models import RFPStructure
+from repositories.cv_repository import upsert_cv
+from repositories.programmer_repository import get_programmers
+from repositories.project_repository import upsert_project
+from repositories.rfp_repository import save_rfp
+from scripts.common import latency_summary
+from scripts.generate_cvs import (
+  generate_certifications,
+  generate_project_records,
+  generate_skills,
+)
+from scripts.generate_rfps import generate_rfps_data_dicts
+from services.admin_service import reset_database
+from services.neo4j_service import get_neo4j_graph
+
+COMPANIES = [
+  "TechCorp",
+  "DataSystems Inc",
+  "CloudNative Solutions",
+  "FinTech Innovations",
+  "HealthTech Partners",
+  "RetailMax",
+  "LogisticsPro",
+  "EduTech Solutions",
+]
+UNIVERSITIES = [
+  "MIT",
+  "Stanford University",
+  "University Of Warsaw",
+  "ETH Zurich",
+  "Carnegie Mellon University",
+]
+
+
+class TransactionCounter:
+  """Counts transactions issued through the shared Neo4jGraph or any session.
+
+  Auto-commit queries are counted at Neo4jGraph.query, managed transactions
+  at Session.execute_read/execute_write.
+  """
+
+  def __init__(self) -> None:
+    self.count = 0
+    self._lock = threading.Lock()
+    graph = get_neo4j_graph()
+    self._query = graph.query
+    graph.query = self  # type: ignore[method-assign]
+    # Neo4jGraph.query runs on Session.run, so only managed transactions are
+    # counted at the session level
+    for name in ("execute_read", "execute_write"):
+      setattr(Session, name, self._counting(getattr(Session, name)))
+
+  def _increment(self) -> None:
+    with self._lock:
+      self.count += 1
+
+  def _counting(self, method: Callable[..., Any]) -> Callable[..., Any]:
+    @functools.wraps(method)
+    def wrapper(*args: object, **kwargs: object) -> object:
+      self._increment()
+      return method(*args, **kwargs)
+
+    return wrapper
+
+  def __call__(self, *args: object, **kwargs: object) -> list[dict[str, Any]]:
+    self._increment()
+    return self._query(*args, **kwargs)
+
+
+@dataclass
+class PathStats:
+  rows: int = 0
+  transactions: int = 0
+  elapsed_s: float = 0.0
+  errors: int = 0
+  latencies_ms: list[float] = field(default_factory=list)
+
+  def report(self) -> dict[str, Any]:
+    return {
+      "rows": self.rows,
+      "errors": self.errors,
+      "transactions": self.transactions,
+      "elapsed_s": round(self.elapsed_s, 2),
+      "rows_per_s": round(self.rows / self.elapsed_s, 1) if self.elapsed_s else 0,
+      "transactions_per_row": round(self.transactions / self.rows, 2)
+      if self.rows
+      else 0,
+      "latency_ms": latency_summary(self.latencies_ms),
+    }
+
+
+def synthetic_profiles(start: int, count: int, faker: Faker) -> list[dict]:
+  """Profiles in the shape generate_cvs produces, with unique names."""
+  return [
+    {
+      "id": i,
+      "name": f"{faker.name()} {i:07d}",
+      "email": faker.email(),
+      "location": faker.city(),
+      "skills": generate_skills(),
+      "certifications": generate_certifications(),
+    }
+    for i in range(start, start + count)
+  ]
+
+
+def profile_to_cv(profile: dict) -> CVStructure:
+  return CVStructure(
+    full_name=profile["name"],
+    email=profile["email"],
+    location=profile["location"],
+    university_name=random.choice(UNIVERSITIES),
+    certifications=profile["certifications"],
+    worked_for=random.sample(COMPANIES, random.randint(1, 3)),
+    skills=[
+      CVSkill(skill_name=s["name"], proficiency=s["proficiency"])
+      for s in profile["skills"]
+    ],
+  )
+
+
+def synthetic_projects(
+  profiles: list[dict], count: int, id_offset: int, faker: Faker
+) -> list[ProjectStructure]:
+  projects = generate_project_records(profiles, count, faker)
+  for i, project in enumerate(projects):
+    project["id"] = f"PRJ-{id_offset + i + 1:07d}"
+    # generate_cvs writes the projects.json shape, which titles projects
+    project["name"] = project.pop("title")
+  return [ProjectStructure(**p) for p in projects]
+
+
+def load(
+  items: Iterable[Any],
+  write: Callable[[Any], None],
+  stats: PathStats,
+  counter: TransactionCounter,
+  workers: int,
+) -> None:
+  def timed_write(item: object) -> float | None:
+    start = time.perf_counter()
+    try:
+      write(item)
+    except Exception:
+      return None
+    return (time.perf_counter() - start) * 1000
+
+  transactions_before = counter.count
+  start = time.perf_counter()
+  with ThreadPoolExecutor(max_workers=workers) as pool:
+    for latency in pool.map(timed_write, items):
+      if latency is None:
+        stats.errors += 1
+      else:
+        stats.rows += 1
+        stats.latencies_ms.append(latency)
+  stats.elapsed_s += time.perf_counter() - start
+  stats.transactions += counter.count - transactions_before
+
+
+def check_location_filter(location: str) -> None:
+  """Fail the run if the programmer location filter misses an ingested location."""
+  location = location.lower()
+  page = get_programmers(ProgrammerQuery(location=location, limit=10))
+  if not page.items:
+    raise SystemExit(f"Location filter {location!r} returned no programmers")
+  if any(location not in (item.location or "").lower() for item in page.items):
+    raise SystemExit(f"Location filter {location!r} returned other locations")
+
+
+def chunked(total: int, size: int) -> Iterator[tuple[int, int]]:
+  for start in range(0, total, size):
+    yield start, min(size, total - start)
+
+
+def parse_args() -> argparse.Namespace:
+  parser = argparse.ArgumentParser(
+    description="Load synthetic people, projects and RFPs through the repository "
+    "write paths and report throughput. Use a dedicated database."
+  )
+  parser.add_argument("--people", type=int, default=10_000)
+  parser.add_argument(
+    "--projects", type=int, default=None, help="Defaults to one per 10 people"
+  )
+  parser.add_argument(
+    "--rfps", type=int, default=None, help="Defaults to one per 100 people"
+  )
+  parser.add_argument("--chunk-size", type=int, default=1_000)
+  parser.add_argument("--workers", type=int, default=1, help="Concurrent writers")
+  parser.add_argument("--seed", type=int, default=42)
+  parser.add_argument(
+    "--reset", action="store_true", help="Wipe the database before loading"
+  )
+  parser.add_argument("--output", type=Path, default=Path("ingestion_benchmark.json"))
+  return parser.parse_args()
+
+
+def main() -> None:
+  args = parse_args()
+  num_projects = args.projects if args.projects is not None else args.people // 10
+  num_rfps = args.rfps if args.rfps is not None else max(args.people // 100, 1)
+
+  random.seed(args.seed)
+  faker = Faker()
+  Faker.seed(args.seed)
+
+  if args.reset:
+    print("Resetting database ...")
+    reset_database()
+
+  counter = TransactionCounter()
+  stats = {"cv": PathStats(), "project": PathStats(), "rfp": PathStats()}
+
+  # People and their projects are generated and loaded chunk by chunk, so memory
+  # stays flat and project assignment stays linear in the number of people
+  projects_loaded = 0
+  first_location = None
+  for start, size in chunked(args.people, args.chunk_size):
+    profiles = synthetic_profiles(start, size, faker)
+    first_location = first_location or profiles[0]["location"]
+    load(map(profile_to_cv, profiles), upsert_cv, stats["cv"], counter, args.workers)
+
+    chunk_projects = (
+      round(num_projects * (start + size) / args.people) - projects_loaded
+    )
+    if chunk_projects > 0:
+      projects = synthetic_projects(profiles, chunk_projects, projects_loaded, faker)
+      load(projects, upsert_project, stats["project"], counter, args.workers)
+      projects_loaded += chunk_projects
+
+    print(f"Loaded {start + size}/{args.people} people, {projects_loaded} projects")
+
+  rfps = [RFPStructure(**rfp) for rfp in generate_rfps_data_dicts(num_rfps, faker)]
+  load(rfps, save_rfp, stats["rfp"], counter, args.workers)
+  if first_location:
+    check_location_filter(first_location)
+
+  report = {
+    "metadata": {
+      "run_at": datetime.now().isoformat(),
+      "people": args.people,
+      "projects": num_projects,
+      "rfps": num_rfps,
+      "workers": args.workers,
+      "seed": args.seed,
+    },
+    "paths": {name: path_stats.report() for name, path_stats in stats.items()},
+  }
+
+  with args.output.open("w", encoding="utf-8") as f:
+    json.dump(report, f, indent=2)
+
+  print(json.dumps(report["paths"], indent=2))
+
+
+if __name__ == "__main__":
+  main()
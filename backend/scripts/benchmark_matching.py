@@ -0,0 +1,368 @@
+import argparse
+import json
+import random
+import subprocess
+import sys
+import time
+from collections.abc import Callable, Iterator
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from core.scoring import PROFICIENCY_LEVELS, SCORING_PARAMS
+from repositories.matching_repository import (
+  FIND_CANDIDATES_QUERY,
+  STORED_CANDIDATES_QUERY,
+  MatchingRepository,
+  invalidate_match_store,
+)
+from scripts.common import latency_summary
+from services.admin_service import reset_database
+from services.neo4j_service import get_neo4j_graph, get_neo4j_session
+from services.query_profiler import walk_plan
+
+SKILL_POOL = [
+  "Python",
+  "Javascript",
+  "Typescript",
+  "Java",
+  "React",
+  "Aws",
+  "Docker",
+  "Postgresql",
+  "Kubernetes",
+  "Node.Js",
+  "Git",
+  "Django",
+  "Go",
+  "Fastapi",
+  "Angular",
+  "Mongodb",
+  "Redis",
+  "Microservices",
+  "Devops",
+  "Machine Learning",
+  "Data Science",
+  "Flask",
+  "Vue.Js",
+  "C++",
+  "Mysql",
+  "Jenkins",
+  "Rust",
+]
+# Popularity falls off with rank, so a few skills are very common and most are rare
+SKILL_WEIGHTS = [1 / (rank + 1) ** 0.8 for rank in range(len(SKILL_POOL))]
+PROFICIENCY_WEIGHTS = [5, 30, 40, 25]
+
+SEED_BATCH_SIZE = 1_000
+ASSIGNED_SHARE = 0.4
+MANDATORY_SHARE = 0.6
+BENCH_PROJECTS = 50
+
+SEED_PEOPLE_QUERY = """
+  UNWIND $people AS person
+  MERGE (p:Person {id: person.id})
+  SET p.name = person.id
+  WITH p, person
+  UNWIND person.skills AS skill
+  MERGE (s:Skill {id: skill.id})
+  ON CREATE SET s.name = skill.id
+  MERGE (p)-[r:HAS_SKILL]->(s)
+  SET r.proficiency = skill.proficiency,
+      r.level = skill.level
+"""
+
+SEED_ASSIGNMENTS_QUERY = """
+  UNWIND $assignments AS assignment
+  MATCH (p:Person {id: assignment.person_id})
+  MATCH (proj:Project {id: assignment.project_id})
+  MERGE (p)-[a:ASSIGNED_TO]->(proj)
+  SET a.start_date = assignment.start_date,
+      a.end_date = assignment.end_date
+"""
+
+SEED_RFPS_QUERY = """
+  UNWIND $rfps AS rfp
+  MERGE (r:RFP {id: rfp.id})
+  SET r.title = rfp.id,
+      r.deadline = rfp.start_date,
+      r.team_size = 4
+  WITH r, rfp
+  UNWIND rfp.requirements AS req
+  MERGE (s:Skill {id: req.id})
+  ON CREATE SET s.name = req.id
+  MERGE (r)-[n:NEEDS]->(s)
+  SET n.proficiency = req.proficiency,
+      n.level = req.level,
+      n.mandatory = req.mandatory
+"""
+
+SEED_INDEXES = [
+  "CREATE INDEX bench_person_id IF NOT EXISTS FOR (n:Person) ON (n.id)",
+  "CREATE INDEX bench_skill_id IF NOT EXISTS FOR (n:Skill) ON (n.id)",
+  "CREATE INDEX bench_project_id IF NOT EXISTS FOR (n:Project) ON (n.id)",
+  "CREATE INDEX bench_rfp_id IF NOT EXISTS FOR (n:RFP) ON (n.id)",
+]
+
+
+def _batches(items: list[dict], size: int) -> Iterator[list[dict]]:
+  for start in range(0, len(items), size):
+    yield items[start : start + size]
+
+
+def _weighted_sample(population: list[str], weights: list[float], k: int) -> list[str]:
+  chosen: dict[str, None] = {}
+  while len(chosen) < k:
+    chosen[random.choices(population, weights=weights)[0]] = None
+  return list(chosen)
+
+
+def _skill(skill: str, proficiency: str) -> dict[str, Any]:
+  return {
+    "id": skill,
+    "proficiency": proficiency,
+    "level": PROFICIENCY_LEVELS[proficiency],
+  }
+
+
+def seed_people(start: int, stop: int) -> None:
+  """Add people [start, stop) with popularity-weighted skills; some get assigned."""
+  graph = get_neo4j_graph()
+  today = date.today()
+
+  people = [
+    {
+      "id": f"Bench Person {i:07d}",
+      "skills": [
+        _skill(skill, random.choices(list(PROFICIENCY_LEVELS), PROFICIENCY_WEIGHTS)[0])
+        for skill in _weighted_sample(SKILL_POOL, SKILL_WEIGHTS, random.randint(5, 12))
+      ],
+    }
+    for i in range(start, stop)
+  ]
+  for batch in _batches(people, SEED_BATCH_SIZE):
+    graph.query(SEED_PEOPLE_QUERY, params={"people": batch})
+
+  assignments = [
+    {
+      "person_id": person["id"],
+      "project_id": f"BENCH-PRJ-{random.randrange(BENCH_PROJECTS):03d}",
+      "start_date": (today - timedelta(days=random.randint(30, 365))).isoformat(),
+      "end_date": (today + timedelta(days=random.randint(-30, 365))).isoformat(),
+    }
+    for person in people
+    if random.random() < ASSIGNED_SHARE
+  ]
+  for batch in _batches(assignments, SEED_BATCH_SIZE):
+    graph.query(SEED_ASSIGNMENTS_QUERY, params={"assignments": batch})
+
+
+def seed_fixtures(requirement_counts: list[int]) -> dict[int, str]:
+  """Create indexes, bench projects and one RFP per requirement count."""
+  graph = get_neo4j_graph()
+  for statement in SEED_INDEXES:
+    graph.query(statement)
+
+  graph.query(
+    """
+    UNWIND range(0, $count - 1) AS i
+    MERGE (p:Project {id: 'BENCH-PRJ-' + right('00' + toString(i), 3)})
+    SET p.title = 'Bench Project ' + toString(i), p.status = 'active'
+    """,
+    params={"count": BENCH_PROJECTS},
+  )
+
+  start_date = (date.today() + timedelta(days=60)).isoformat()
+  rfps = [
+    {
+      "id": f"RFP-BENCH-{count:02d}",
+      "start_date": start_date,
+      "requirements": [
+        {
+          **_skill(skill, random.choice(list(PROFICIENCY_LEVELS)[1:])),
+          "mandatory": random.random() < MANDATORY_SHARE,
+        }
+        for skill in random.sample(SKILL_POOL, count)
+      ],
+    }
+    for count in requirement_counts
+  ]
+  graph.query(SEED_RFPS_QUERY, params={"rfps": rfps})
+  return {count: f"RFP-BENCH-{count:02d}" for count in requirement_counts}
+
+
+def profile_db_hits(query: str, params: dict[str, Any]) -> int:
+  with get_neo4j_session() as session:
+    summary = session.run(f"PROFILE {query}", params).consume()
+  return sum(op.get("dbHits", 0) for op in walk_plan(summary.profile or {}))
+
+
+# Matching engines under test: name -> (run for an RFP id, Cypher to PROFILE or None)
+Engine = tuple[Callable[[str], Any], str | None]
+
+
+def build_engines() -> dict[str, Engine]:
+  repo = MatchingRepository()
+  return {
+    "cypher": (repo.score_candidates, FIND_CANDIDATES_QUERY),
+    # The warm-up call scores the RFP into the store; timed calls only read it
+    "store": (repo.read_stored_candidates, STORED_CANDIDATES_QUERY),
+  }
+
+
+def bench_engine(engine: Engine, rfp_id: str, repeats: int) -> dict[str, Any]:
+  run, profile_query = engine
+  response = run(rfp_id)  # warm-up, also fills the page cache
+
+  timings = []
+  for _ in range(repeats):
+    start = time.perf_counter()
+    run(rfp_id)
+    timings.append((time.perf_counter() - start) * 1000)
+
+  return {
+    "latency_ms": latency_summary(timings),
+    "db_hits": profile_db_hits(profile_query, {"rfp_id": rfp_id, **SCORING_PARAMS})
+    if profile_query
+    else None,
+    "candidates": len(response.perfect_matches)
+    + len(response.future_matches)
+    + len(response.partial_matches),
+  }
+
+
+def _git_commit() -> str | None:
+  try:
+    return subprocess.run(
+      ["git", "rev-parse", "--short", "HEAD"],  # noqa: S607
+      capture_output=True,
+      text=True,
+      check=True,
+    ).stdout.strip()
+  except (OSError, subprocess.CalledProcessError):
+    return None
+
+
+def compare_runs(
+  current: dict[str, Any], baseline: dict[str, Any], max_regression_pct: float
+) -> tuple[list[dict[str, Any]], bool]:
+  """Compare p50 latency and db-hits per scale/requirements/engine."""
+  rows = []
+  regressed = False
+  for scale, by_reqs in current["results"].items():
+    for reqs, by_engine in by_reqs.items():
+      for engine, result in by_engine.items():
+        base = baseline["results"].get(scale, {}).get(reqs, {}).get(engine)
+        if base is None:
+          continue
+        row = {"scale": scale, "requirements": reqs, "engine": engine}
+        for metric, now, before in (
+          ("p50_ms", result["latency_ms"]["p50"], base["latency_ms"]["p50"]),
+          ("db_hits", result["db_hits"], base["db_hits"]),
+        ):
+          if now is None or not before:
+            continue
+          change_pct = (now - before) / before * 100
+          row[metric] = {
+            "now": now,
+            "baseline": before,
+            "change_pct": round(change_pct, 1),
+          }
+          regressed |= change_pct > max_regression_pct
+        rows.append(row)
+  return rows, regressed
+
+
+def parse_args() -> argparse.Namespace:
+  parser = argparse.ArgumentParser(
+    description="Benchmark find_candidates on seeded graphs of growing size. "
+    "Wipes the database; use a dedicated one."
+  )
+  parser.add_argument("--scales", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+  parser.add_argument(
+    "--requirements", type=int, nargs="+", default=[2, 5, 10, 20], help="Per RFP"
+  )
+  parser.add_argument("--repeats", type=int, default=5)
+  parser.add_argument("--seed", type=int, default=42)
+  parser.add_argument("--label", default=None, help="Name of this run in the history")
+  parser.add_argument(
+    "--history", type=Path, default=Path("data/benchmarks/matching_history.json")
+  )
+  parser.add_argument(
+    "--baseline",
+    default=None,
+    help="Label of the history entry to compare with (default: the latest)",
+  )
+  parser.add_argument(
+    "--max-regression-pct",
+    type=float,
+    default=20.0,
+    help="Exit non-zero when p50 latency or db-hits regress by more than this",
+  )
+  return parser.parse_args()
+
+
+def main() -> None:
+  args = parse_args()
+  random.seed(args.seed)
+
+  print("Resetting database ...")
+  reset_database()
+  rfp_ids = seed_fixtures(args.requirements)
+  engines = build_engines()
+
+  results: dict[str, dict[str, dict[str, Any]]] = {}
+  seeded = 0
+  for scale in sorted(args.scales):
+    print(f"Seeding people {seeded} -> {scale} ...")
+    seed_people(seeded, scale)
+    seeded = scale
+    # Seeding bypasses the repositories, so stored match scores are now stale
+    invalidate_match_store()
+
+    results[str(scale)] = {}
+    for count, rfp_id in rfp_ids.items():
+      results[str(scale)][str(count)] = {
+        name: bench_engine(engine, rfp_id, args.repeats)
+        for name, engine in engines.items()
+      }
+      print(
+        f"  {scale} people, {count} requirements: {results[str(scale)][str(count)]}"
+      )
+
+  run = {
+    "label": args.label or datetime.now().strftime("%Y%m%d-%H%M%S"),
+    "run_at": datetime.now().isoformat(),
+    "git_commit": _git_commit(),
+    "repeats": args.repeats,
+    "seed": args.seed,
+    "results": results,
+  }
+
+  history: list[dict[str, Any]] = []
+  if args.history.exists():
+    history = json.loads(args.history.read_text(encoding="utf-8"))
+
+  baseline = next(
+    (h for h in reversed(history) if args.baseline in (None, h["label"])), None
+  )
+
+  history.append(run)
+  args.history.parent.mkdir(parents=True, exist_ok=True)
+  args.history.write_text(json.dumps(history, indent=2), encoding="utf-8")
+
+  if baseline is None:
+    print("No baseline in history yet; this run becomes the baseline.")
+    return
+
+  rows, regressed = compare_runs(run, baseline, args.max_regression_pct)
+  print(f"\nComparison with baseline '{baseline['label']}' ({baseline['git_commit']}):")
+  print(json.dumps(rows, indent=2))
+
+  if regressed:
+    print(f"Regression above {args.max_regression_pct}% detected.")
+    sys.exit(1)
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,87 @@
+import argparse
+import json
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from core.utils import _extract_text_layer, _partition_pdf, extract_text_from_pdf
+from scripts.common import latency_summary
+
+DEFAULT_DIRS = [Path("example_data/programmers"), Path("example_data/RFP")]
+
+
+def _timed_serial(
+  extract: Callable[[Path], str | None], pdfs: list[Path]
+) -> tuple[list[float], float]:
+  timings = []
+  start = time.perf_counter()
+  for pdf in pdfs:
+    doc_start = time.perf_counter()
+    extract(pdf)
+    timings.append((time.perf_counter() - doc_start) * 1000)
+  return timings, time.perf_counter() - start
+
+
+def _timed_pool(pdfs: list[Path], workers: int | None) -> float:
+  with ProcessPoolExecutor(max_workers=workers) as pool:
+    # Start every worker before the clock, as the server's pool is long-lived
+    list(pool.map(len, [""] * (workers or 1)))
+    start = time.perf_counter()
+    list(pool.map(extract_text_from_pdf, pdfs))
+    return time.perf_counter() - start
+
+
+def _result(timings: list[float] | None, wall_s: float, docs: int) -> dict[str, Any]:
+  return {
+    "latency_ms": latency_summary(timings) if timings is not None else None,
+    "wall_s": round(wall_s, 3),
+    "docs_per_s": round(docs / wall_s, 2) if wall_s else None,
+  }
+
+
+def parse_args() -> argparse.Namespace:
+  parser = argparse.ArgumentParser(
+    description="Compare PDF text extraction: unstructured only, tiered, and "
+    "tiered in a process pool."
+  )
+  parser.add_argument("--dirs", type=Path, nargs="+", default=DEFAULT_DIRS)
+  parser.add_argument("--repeats", type=int, default=3, help="Passes over the set")
+  parser.add_argument("--workers", type=int, default=None, help="Default: CPU count")
+  parser.add_argument(
+    "--skip-partition",
+    action="store_true",
+    help="Skip the slow unstructured-only baseline",
+  )
+  return parser.parse_args()
+
+
+def main() -> None:
+  args = parse_args()
+  pdfs = sorted(pdf for directory in args.dirs for pdf in directory.glob("*.pdf"))
+  if not pdfs:
+    raise SystemExit(f"No PDFs found in {', '.join(map(str, args.dirs))}")
+  corpus = pdfs * args.repeats
+
+  fast_path_hits = sum(_extract_text_layer(pdf) is not None for pdf in pdfs)
+  print(f"{len(pdfs)} PDFs, {fast_path_hits} with a usable text layer.")
+
+  results: dict[str, Any] = {}
+  if not args.skip_partition:
+    _partition_pdf(pdfs[0])  # warm-up: loads the layout models once
+    timings, wall_s = _timed_serial(_partition_pdf, corpus)
+    results["partition_pdf"] = _result(timings, wall_s, len(corpus))
+
+  extract_text_from_pdf(pdfs[0])
+  timings, wall_s = _timed_serial(extract_text_from_pdf, corpus)
+  results["tiered"] = _result(timings, wall_s, len(corpus))
+
+  wall_s = _timed_pool(corpus, args.workers)
+  results["tiered_pool"] = _result(None, wall_s, len(corpus))
+
+  print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,109 @@
+import argparse
+import json
+import re
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from typing import Any
+
+from scripts.common import latency_summary
+
+# Modules a worker serving only reads should never import at boot
+HEAVY_MODULES = ("unstructured", "langchain_experimental", "langchain_openai")
+
+# One -X importtime line: self us, cumulative us, then the indented module name
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def import_once(module: str) -> tuple[float, list[tuple[int, int, str]]]:
+  """Import `module` in a fresh interpreter under -X importtime.
+
+  Returns the wall time in ms and (self us, cumulative us, module) per import.
+  """
+  start = time.perf_counter()
+  result = subprocess.run(  # noqa: S603
+    [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+    capture_output=True,
+    text=True,
+    check=True,
+  )
+  wall_ms = (time.perf_counter() - start) * 1000
+
+  entries = []
+  for line in result.stderr.splitlines():
+    if match := IMPORTTIME_LINE.match(line):
+      self_us, cumulative_us, _, name = match.groups()
+      entries.append((int(self_us), int(cumulative_us), name))
+  return wall_ms, entries
+
+
+def summarize_imports(
+  entries: list[tuple[int, int, str]], module: str, top: int
+) -> dict[str, Any]:
+  by_package: dict[str, int] = defaultdict(int)
+  for self_us, _, name in entries:
+    by_package[name.split(".")[0]] += self_us
+
+  imported = {name for _, _, name in entries}
+  return {
+    "import_ms": round(
+      next((cum for _, cum, name in entries if name == module), 0) / 1000, 1
+    ),
+    "top_packages_ms": {
+      package: round(self_us / 1000, 1)
+      for package, self_us in sorted(
+        by_package.items(), key=lambda item: item[1], reverse=True
+      )[:top]
+    },
+    "heavy_modules_loaded": sorted(
+      heavy for heavy in HEAVY_MODULES if heavy in imported
+    ),
+  }
+
+
+def parse_args() -> argparse.Namespace:
+  parser = argparse.ArgumentParser(
+    description="Measure API boot time and which packages it spends it on."
+  )
+  parser.add_argument("--module", default="main", help="Module a worker imports")
+  parser.add_argument("--repeats", type=int, default=5)
+  parser.add_argument("--top", type=int, default=15, help="Packages to list")
+  parser.add_argument(
+    "--target-ms",
+    type=float,
+    default=2000.0,
+    help="Exit non-zero when the p50 boot time exceeds this",
+  )
+  return parser.parse_args()
+
+
+def main() -> None:
+  args = parse_args()
+
+  timings = []
+  entries: list[tuple[int, int, str]] = []
+  for _ in range(args.repeats):
+    wall_ms, entries = import_once(args.module)
+    timings.append(wall_ms)
+
+  # Import details come from the last, warmest run
+  report = {
+    "module": args.module,
+    "boot_ms": latency_summary(timings),
+    **summarize_imports(entries, args.module, args.top),
+  }
+  print(json.dumps(report, indent=2))
+
+  failures = []
+  if report["boot_ms"]["p50"] > args.target_ms:
+    failures.append(f"p50 boot time above the {args.target_ms:.0f} ms target")
+  if report["heavy_modules_loaded"]:
+    failures.append(f"heavy modules loaded: {report['heavy_modules_loaded']}")
+  if failures:
+    print("; ".join(failures))
+    sys.exit(1)
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,16 @@
+from repositories.skill_repository import rebuild_skill_similarity, sync_skill_relations
+
+
+def main() -> None:
+  """Load the skill taxonomy and precompute the similarity used for partial credit.
+
+  Only skills already in the graph are linked, so rerun it after ingesting new ones.
+  """
+  relations = sync_skill_relations()
+  print(f"Synced {relations} RELATED_TO edges.")
+  pairs = rebuild_skill_similarity()
+  print(f"Wrote {pairs} SIMILAR_TO edges.")
+
+
+if __name__ == "__main__":
+  main()
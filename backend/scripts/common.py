@@ -1,12 +1,32 @@
+import statistics
 from pathlib import Path
 
-import markdown
-from weasyprint import CSS, HTML
+
+def latency_summary(times_ms: list[float]) -> dict[str, float]:
+  """Summarize latencies as average and p50/p95/p99, in milliseconds."""
+  if not times_ms:
+    return {"average": 0.0, "p50": 0.0, "p95": 0.0, "p99": 0.0}
+  if len(times_ms) > 1:
+    cuts = statistics.quantiles(times_ms, n=100, method="inclusive")
+    p50, p95, p99 = cuts[49], cuts[94], cuts[98]
+  else:
+    p50 = p95 = p99 = times_ms[0]
+  return {
+    "average": round(statistics.mean(times_ms), 2),
+    "p50": round(p50, 2),
+    "p95": round(p95, 2),
+    "p99": round(p99, 2),
+  }
 
 
 def save_markdown_as_pdf(
   markdown_content: str, filename: str, output_dir: Path
 ) -> Path:
+  # Imported lazily: WeasyPrint needs native libraries that the synthetic
+  # data benchmarks do not
+  import markdown  # noqa: PLC0415
+  from weasyprint import CSS, HTML  # noqa: PLC0415
+
   output_dir.mkdir(parents=True, exist_ok=True)
 
   html_content = markdown.markdown(markdown_content)
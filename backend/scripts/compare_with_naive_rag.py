@@ -1,15 +1,19 @@
+from __future__ import annotations
+
+import argparse
 import asyncio
+import hashlib
 import json
-import statistics
 import textwrap
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Sequence
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Sequence
 
 import aiofiles
 from langchain_community.document_loaders import PyPDFLoader
 from langchain_community.vectorstores import Chroma
+from langchain_core.embeddings import DeterministicFakeEmbedding
 from langchain_core.output_parsers import StrOutputParser
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.runnables import RunnablePassthrough
@@ -18,8 +22,11 @@ from langchain_text_splitters import RecursiveCharacterTextSplitter
 from pydantic import BaseModel, Field
 from result import Err
 
-from staffing_graphrag.services.openai_service import get_openai_chat
-from staffing_graphrag.services.query_service import process_query
+from core.config import config
+from scripts.common import latency_summary
+from services.llm_service import get_chat_model
+from services.openai_service import get_openai_chat
+from services.query_service import process_query
 
 if TYPE_CHECKING:
   from langchain_core.documents import Document
@@ -69,28 +76,94 @@ def load_ground_truths(path: Path) -> list[dict[str, Any]]:
     return json.load(f)
 
 
-def build_naive_rag() -> Runnable[object, str]:
-  pdf_paths = []
-  for folder in ["data/programmers", "data/RFP"]:
-    pdf_paths.extend(Path(folder).glob("*.pdf"))
+NAIVE_RAG_SOURCE_DIRS = [Path("data/programmers"), Path("data/RFP")]
+NAIVE_RAG_INDEX_DIR = Path(".chroma_naive_rag")
+# Fake embeddings get their own index, as their vectors are not comparable
+NAIVE_RAG_FAKE_INDEX_DIR = Path(".chroma_naive_rag_fake")
+EMBEDDING_BATCH_SIZE = 256
+FAKE_EMBEDDING_SIZE = 256
+
+
+def _file_digest(path: Path) -> str:
+  return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def build_naive_index() -> Chroma:
+  """Bring the persistent Chroma index in line with the PDFs on disk.
+
+  A manifest maps each PDF to its content hash and chunk ids. Only new or
+  changed files are loaded, split and embedded (in batches); chunks of changed
+  and removed files are deleted. An unchanged data set costs no embedding calls.
+  With LLM_BACKEND=fake, deterministic local embeddings replace OpenAI's.
+  """
+  fake = config.LLM_BACKEND == "fake"
+  index_dir = NAIVE_RAG_FAKE_INDEX_DIR if fake else NAIVE_RAG_INDEX_DIR
+  manifest_path = index_dir / "manifest.json"
+  vectordb = Chroma(
+    collection_name="naive_rag",
+    embedding_function=DeterministicFakeEmbedding(size=FAKE_EMBEDDING_SIZE)
+    if fake
+    else OpenAIEmbeddings(),
+    persist_directory=str(index_dir),
+  )
+
+  manifest: dict[str, dict[str, Any]] = {}
+  if manifest_path.exists():
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+
+  current = {
+    str(pdf): _file_digest(pdf)
+    for folder in NAIVE_RAG_SOURCE_DIRS
+    for pdf in sorted(folder.glob("*.pdf"))
+  }
 
-  documents = []
-  for pdf in pdf_paths:
-    loader = PyPDFLoader(str(pdf))
-    documents.extend(loader.load())
+  stale_ids = [
+    chunk_id
+    for source, entry in manifest.items()
+    if current.get(source) != entry["sha256"]
+    for chunk_id in entry["chunk_ids"]
+  ]
+  if stale_ids:
+    vectordb.delete(ids=stale_ids)
+  manifest = {
+    source: entry
+    for source, entry in manifest.items()
+    if current.get(source) == entry["sha256"]
+  }
 
   splitter = RecursiveCharacterTextSplitter(
     chunk_size=1000,
     chunk_overlap=150,
   )
-  chunks = splitter.split_documents(documents)
 
-  vectordb = Chroma.from_documents(
-    documents=chunks,
-    embedding=OpenAIEmbeddings(),
-    persist_directory=".chroma_naive_rag",
+  new_chunks: list[Document] = []
+  new_ids: list[str] = []
+  for source, digest in current.items():
+    if source in manifest:
+      continue
+    chunks = splitter.split_documents(PyPDFLoader(source).load())
+    chunk_ids = [f"{digest}:{i}" for i in range(len(chunks))]
+    manifest[source] = {"sha256": digest, "chunk_ids": chunk_ids}
+    new_chunks.extend(chunks)
+    new_ids.extend(chunk_ids)
+
+  for start in range(0, len(new_chunks), EMBEDDING_BATCH_SIZE):
+    end = start + EMBEDDING_BATCH_SIZE
+    vectordb.add_documents(new_chunks[start:end], ids=new_ids[start:end])
+
+  print(
+    f"Naive RAG index: {len(new_chunks)} chunks embedded, "
+    f"{len(stale_ids)} removed, {len(manifest)} files indexed."
   )
 
+  index_dir.mkdir(parents=True, exist_ok=True)
+  manifest_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+  return vectordb
+
+
+def build_naive_rag() -> Runnable[object, str]:
+  vectordb = build_naive_index()
+
   retriever = vectordb.as_retriever(search_kwargs={"k": 5})
 
   prompt = ChatPromptTemplate.from_messages(
@@ -110,7 +183,13 @@ def build_naive_rag() -> Runnable[object, str]:
     ]
   )
 
-  llm = ChatOpenAI(temperature=0)
+  if config.LLM_BACKEND == "fake":
+    llm_result = get_chat_model(temperature=0)
+    if isinstance(llm_result, Err):
+      raise RuntimeError("Failed to initialize the naive RAG LLM")
+    llm = llm_result.ok()
+  else:
+    llm = ChatOpenAI(temperature=0)
 
   def format_docs(docs: Sequence[Document]) -> str:
     return "\n\n".join(
@@ -153,90 +232,189 @@ async def judge_answer(
   return JudgeResult.model_validate(result)
 
 
-async def main() -> None:
-  graph_times = []
-  rag_times = []
-  ground_truths = load_ground_truths(
-    Path("./example_data/naive_rag_comparison/questions_ground_truths.json")
-  )
+def judge_answer_offline(ground_truth: str, system_answer: str) -> JudgeResult:
+  """Deterministic judge for fake-LLM runs: the ground truth must appear verbatim."""
+  passed = ground_truth.strip().lower() in system_answer.lower()
+  return JudgeResult(passed=passed, reason="offline substring judge")
+
+
+# A system under evaluation: question -> response dict with at least "answer"
+System = Callable[[str], Awaitable[dict[str, Any]]]
+
+
+class RateLimiter:
+  """Spaces out calls so that at most `rate` of them start per second."""
+
+  def __init__(self, rate: float) -> None:
+    self._interval = 1 / rate if rate > 0 else 0.0
+    self._next_slot = 0.0
+    self._lock = asyncio.Lock()
+
+  async def wait(self) -> None:
+    if not self._interval:
+      return
+    async with self._lock:
+      now = time.monotonic()
+      delay = self._next_slot - now
+      self._next_slot = max(now, self._next_slot) + self._interval
+    if delay > 0:
+      await asyncio.sleep(delay)
+
+
+def build_systems() -> dict[str, System]:
   rag_chain = build_naive_rag()
 
-  results = []
-  graph_passed = 0
-  rag_passed = 0
+  async def graph_rag(question: str) -> dict[str, Any]:
+    return await process_query(question, full_answer=True)
 
-  for item in ground_truths:
-    question = item["question"]
-    truth = str(item["answer"])
+  async def graph_rag_direct(question: str) -> dict[str, Any]:
+    return await process_query(question)
 
-    start = time.perf_counter()
-    graph_result = await process_query(question)
-    graph_time_ms = (time.perf_counter() - start) * 1000
-    graph_answer = graph_result.get("answer", "No answer")
+  async def naive_rag(question: str) -> dict[str, Any]:
+    return {"answer": await rag_chain.ainvoke(question)}
 
+  return {
+    "graph_rag": graph_rag,
+    "graph_rag_direct": graph_rag_direct,
+    "naive_rag": naive_rag,
+  }
+
+
+async def evaluate_question(
+  item: dict[str, Any],
+  systems: dict[str, System],
+  limiter: RateLimiter,
+  offline: bool,
+) -> dict[str, Any]:
+  question = item["question"]
+  truth = str(item["answer"])
+
+  async def run_system(system: System) -> tuple[dict[str, Any], float]:
+    await limiter.wait()
     start = time.perf_counter()
-    rag_answer = rag_chain.invoke(question)
-    rag_time_ms = (time.perf_counter() - start) * 1000
-
-    graph_judge = await judge_answer(question, truth, graph_answer)
-    rag_judge = await judge_answer(question, truth, rag_answer)
-
-    graph_passed += int(graph_judge.passed)
-    rag_passed += int(rag_judge.passed)
-
-    graph_times.append(graph_time_ms)
-    rag_times.append(rag_time_ms)
-
-    results.append(
-      {
-        "question": question,
-        "ground_truth": truth,
-        "graph_rag": {
-          "answer": graph_answer,
-          "passed": graph_judge.passed,
-          "reason": graph_judge.reason,
-          "response_time_ms": round(graph_time_ms, 2),
-        },
-        "naive_rag": {
-          "answer": rag_answer,
-          "passed": rag_judge.passed,
-          "reason": rag_judge.reason,
-          "response_time_ms": round(rag_time_ms, 2),
-        },
-      }
-    )
+    response = await system(question)
+    return response, (time.perf_counter() - start) * 1000
+
+  async def judge(answer: str) -> JudgeResult:
+    if offline:
+      return judge_answer_offline(truth, answer)
+    await limiter.wait()
+    return await judge_answer(question, truth, answer)
+
+  # Systems run one after another so their latencies do not interfere
+  runs = {}
+  for name, system in systems.items():
+    runs[name] = await run_system(system)
+
+  verdicts = await asyncio.gather(
+    *[judge(response.get("answer", "No answer")) for response, _ in runs.values()]
+  )
+
+  result: dict[str, Any] = {"question": question, "ground_truth": truth}
+  for (name, (response, elapsed_ms)), verdict in zip(
+    runs.items(), verdicts, strict=True
+  ):
+    result[name] = {
+      "answer": response.get("answer", "No answer"),
+      "direct_answer": bool(response.get("direct_answer")),
+      "passed": verdict.passed,
+      "reason": verdict.reason,
+      "response_time_ms": round(elapsed_ms, 2),
+    }
+  return result
 
-  graph_avg = statistics.mean(graph_times)
-  graph_median = statistics.median(graph_times)
 
-  rag_avg = statistics.mean(rag_times)
-  rag_median = statistics.median(rag_times)
+def parse_args() -> argparse.Namespace:
+  parser = argparse.ArgumentParser(description="Compare GraphRAG with naive RAG.")
+  parser.add_argument(
+    "--questions",
+    type=Path,
+    default=Path("./example_data/naive_rag_comparison/questions_ground_truths.json"),
+  )
+  parser.add_argument("--output", type=Path, default=Path("rag_comparison_report.json"))
+  parser.add_argument(
+    "--workers", type=int, default=4, help="Questions evaluated concurrently"
+  )
+  parser.add_argument(
+    "--rate",
+    type=float,
+    default=0,
+    help="Maximum LLM-bound calls started per second (0 = unlimited)",
+  )
+  parser.add_argument(
+    "--fake-llm",
+    action="store_true",
+    help="Run the real systems with LLM_BACKEND=fake, fake embeddings and a "
+    "substring judge; measures the pipeline without OpenAI, not accuracy",
+  )
+  parser.add_argument(
+    "--fake-llm-latency-ms",
+    type=float,
+    default=200,
+    help="Simulated latency of each fake LLM call",
+  )
+  return parser.parse_args()
+
+
+async def main() -> None:
+  args = parse_args()
+  ground_truths = load_ground_truths(args.questions)
+
+  # The questions are distinct, but both graph modes ask each of them; keep the
+  # Cypher cache out of the comparison so neither mode gets a warm cache
+  config.CYPHER_CACHE_ENABLED = False
+  if args.fake_llm:
+    config.LLM_BACKEND = "fake"
+    config.FAKE_LLM_LATENCY_MS = args.fake_llm_latency_ms
+
+  systems = build_systems()
+  limiter = RateLimiter(args.rate)
+  semaphore = asyncio.Semaphore(max(args.workers, 1))
+
+  async def bounded(item: dict[str, Any]) -> dict[str, Any]:
+    async with semaphore:
+      return await evaluate_question(item, systems, limiter, offline=args.fake_llm)
+
+  run_start = time.perf_counter()
+  results = await asyncio.gather(*[bounded(item) for item in ground_truths])
+  wall_time_s = time.perf_counter() - run_start
+
+  total = len(ground_truths)
+  passed = {name: sum(r[name]["passed"] for r in results) for name in systems}
+  latencies = {
+    name: latency_summary([r[name]["response_time_ms"] for r in results])
+    for name in systems
+  }
 
   report = {
     "metadata": {
       "run_at": datetime.now().isoformat(),
-      "total_questions": len(ground_truths),
+      "total_questions": total,
+      "workers": args.workers,
+      "rate_limit_per_second": args.rate,
+      "llm_backend": config.LLM_BACKEND,
+      "wall_time_s": round(wall_time_s, 2),
     },
     "summary": {
-      "graph_rag_passed": graph_passed,
-      "naive_rag_passed": rag_passed,
-      "graph_rag_pass_rate": graph_passed / len(ground_truths),
-      "naive_rag_pass_rate": rag_passed / len(ground_truths),
-      "latency_ms": {
-        "graph_rag": {
-          "average": round(graph_avg, 2),
-          "median": round(graph_median, 2),
-        },
-        "naive_rag": {
-          "average": round(rag_avg, 2),
-          "median": round(rag_median, 2),
-        },
+      **{f"{name}_passed": count for name, count in passed.items()},
+      **{f"{name}_pass_rate": count / total for name, count in passed.items()},
+      "direct_answer_impact": {
+        "direct_answers": sum(r["graph_rag_direct"]["direct_answer"] for r in results),
+        "pass_rate_delta": (passed["graph_rag_direct"] - passed["graph_rag"]) / total,
+        "average_latency_drop_ms": round(
+          latencies["graph_rag"]["average"] - latencies["graph_rag_direct"]["average"],
+          2,
+        ),
+        "p50_latency_drop_ms": round(
+          latencies["graph_rag"]["p50"] - latencies["graph_rag_direct"]["p50"], 2
+        ),
       },
+      "latency_ms": latencies,
     },
     "results": results,
   }
 
-  async with aiofiles.open("rag_comparison_report.json", "w", encoding="utf-8") as f:
+  async with aiofiles.open(args.output, "w", encoding="utf-8") as f:
     await f.write(json.dumps(report, indent=2))
 
   print("Comparison complete.")
@@ -0,0 +1,26 @@
+import argparse
+
+from repositories.person_repository import merge_duplicate_people
+
+
+def main() -> None:
+  parser = argparse.ArgumentParser(
+    description="Collapse Person nodes that resolve to the same person."
+  )
+  parser.add_argument(
+    "--dry-run", action="store_true", help="Only list the groups that would merge"
+  )
+  args = parser.parse_args()
+
+  groups = merge_duplicate_people(dry_run=args.dry_run)
+  if not groups:
+    print("No duplicate people found.")
+    return
+
+  verb = "Would merge" if args.dry_run else "Merged"
+  for canonical, duplicates in sorted(groups.items()):
+    print(f"{verb} {', '.join(duplicates)} -> {canonical}")
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,26 @@
+import argparse
+
+from repositories.skill_repository import merge_duplicate_skills
+
+
+def main() -> None:
+  parser = argparse.ArgumentParser(
+    description="Collapse Skill nodes that are spellings of the same skill."
+  )
+  parser.add_argument(
+    "--dry-run", action="store_true", help="Only list the groups that would merge"
+  )
+  args = parser.parse_args()
+
+  groups = merge_duplicate_skills(dry_run=args.dry_run)
+  if not groups:
+    print("No duplicate skills found.")
+    return
+
+  verb = "Would merge" if args.dry_run else "Merged"
+  for canonical, duplicates in sorted(groups.items()):
+    print(f"{verb} {', '.join(duplicates)} -> {canonical}")
+
+
+if __name__ == "__main__":
+  main()
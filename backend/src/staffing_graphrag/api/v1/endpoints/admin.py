@@ -3,12 +3,15 @@ import logging
 from fastapi import APIRouter, HTTPException, status
 
 from services.admin_service import reset_database
+from services.query_profiler import profile_store
 
 router = APIRouter(prefix="/admin")
+# Routes that write to the graph, mounted only by roles that ingest
+write_router = APIRouter(prefix="/admin")
 logger = logging.getLogger(__name__)
 
 
-@router.delete("/db/reset", status_code=status.HTTP_200_OK)
+@write_router.delete("/db/reset", status_code=status.HTTP_200_OK)
 async def reset_db_endpoint() -> dict:
   """DANGER: Completely wipes the Neo4j database.
 
@@ -23,3 +26,26 @@ async def reset_db_endpoint() -> dict:
       status_code=500,
       detail="Failed to reset database",
     ) from None
+
+
+@router.get("/profiles", status_code=status.HTTP_200_OK)
+async def get_query_profiles() -> dict:
+  """Latest PROFILE summary of each named repository query.
+
+  Populated only while QUERY_PROFILING_ENABLED is set.
+  """
+  return profile_store.all()
+
+
+@router.get("/profiles/{name}", status_code=status.HTTP_200_OK)
+async def get_query_profile(name: str) -> dict:
+  profile = profile_store.get(name)
+  if profile is None:
+    raise HTTPException(status_code=404, detail=f"No profile captured for '{name}'")
+  return profile
+
+
+@router.delete("/profiles", status_code=status.HTTP_200_OK)
+async def clear_query_profiles() -> dict:
+  profile_store.clear()
+  return {"status": "success", "message": "Query profiles cleared"}
@@ -1,41 +1,50 @@
-from typing import Literal
+from typing import Annotated
 
-from fastapi import APIRouter, HTTPException, Query
-from shared_types.programmer_types import ProgrammerRead
-from shared_types.project_types import ProjectRead
-from shared_types.rfp_types import RFPRead
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from shared_types.programmer_types import ProgrammerPage, ProgrammerQuery
+from shared_types.project_types import ProjectPage, ProjectQuery
+from shared_types.rfp_types import RFPPage, RFPQuery
 
+from api.v1.http_cache import cached_json_response
 from repositories import programmer_repository, project_repository, rfp_repository
 
 router = APIRouter(prefix="/entities")
 
 
-@router.get("/programmers", response_model=list[ProgrammerRead])
+@router.get("/programmers", response_model=ProgrammerPage)
 async def get_programmers(
-  status: Literal["available", "assigned"] | None = Query(
-    None, description="Filter by assignment status"
-  ),
-) -> list[ProgrammerRead]:
-  """Get all programmers based on status."""
+  request: Request, query: Annotated[ProgrammerQuery, Query()]
+) -> Response:
+  """Get a page of programmers, filtered by status, skill and location."""
   try:
-    return programmer_repository.get_programmers(status)
+    return cached_json_response(
+      request, lambda: programmer_repository.get_programmers(query)
+    )
+  except ValueError as e:
+    raise HTTPException(status_code=400, detail=str(e)) from None
   except Exception as e:
     raise HTTPException(status_code=500, detail=str(e)) from None
 
 
-@router.get("/projects", response_model=list[ProjectRead])
-async def get_projects() -> list[ProjectRead]:
-  """Get all projects (historical and active) with their team and tech stack."""
+@router.get("/projects", response_model=ProjectPage)
+async def get_projects(
+  request: Request, query: Annotated[ProjectQuery, Query()]
+) -> Response:
+  """Get a page of projects (historical and active) with their team and tech stack."""
   try:
-    return project_repository.get_projects()
+    return cached_json_response(request, lambda: project_repository.get_projects(query))
+  except ValueError as e:
+    raise HTTPException(status_code=400, detail=str(e)) from None
   except Exception as e:
     raise HTTPException(status_code=500, detail=str(e)) from None
 
 
-@router.get("/rfps", response_model=list[RFPRead])
-async def get_rfps() -> list[RFPRead]:
-  """Get all active RFPs and their specific skill requirements."""
+@router.get("/rfps", response_model=RFPPage)
+async def get_rfps(request: Request, query: Annotated[RFPQuery, Query()]) -> Response:
+  """Get a page of active RFPs and their specific skill requirements."""
   try:
-    return rfp_repository.get_rfps()
+    return cached_json_response(request, lambda: rfp_repository.get_rfps(query))
+  except ValueError as e:
+    raise HTTPException(status_code=400, detail=str(e)) from None
   except Exception as e:
     raise HTTPException(status_code=500, detail=str(e)) from None
@@ -4,11 +4,14 @@ from pathlib import Path
 from typing import Annotated, Any
 
 from fastapi import APIRouter, File, HTTPException, UploadFile, status
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 
+from core.config import config
 from services.ingest_cv import ingest_cv
 from services.ingest_projects import process_projects_json
 from services.ingest_rfp import ingest_rfp
+from services.job_queue import IngestJob, ingest_queue
 
 router = APIRouter(prefix="/ingest")
 
@@ -19,12 +22,53 @@ class IngestRequest(BaseModel):
   file_path: str
 
 
+def _queued(kind: str, path: Path, *, delete_after: bool) -> JSONResponse:
+  """Hand the file to the ingest workers; the client polls /ingest/jobs/{id}."""
+  job = ingest_queue.enqueue(
+    kind, {"path": str(path.resolve()), "delete_after": delete_after}
+  )
+  return JSONResponse(
+    status_code=status.HTTP_202_ACCEPTED, content=job.model_dump(mode="json")
+  )
+
+
+def _queue_path(kind: str, file_path: str, *, not_found: str) -> JSONResponse:
+  path = Path(file_path)
+  if not path.exists():
+    raise HTTPException(status_code=404, detail=not_found)
+  return _queued(kind, path, delete_after=False)
+
+
+async def _spool_upload(file: UploadFile, suffix: str) -> Path:
+  # Kept until a worker has ingested it, so it cannot be a request temp file
+  config.INGEST_SPOOL_DIR.mkdir(parents=True, exist_ok=True)
+  with tempfile.NamedTemporaryFile(
+    delete=False, suffix=suffix, dir=config.INGEST_SPOOL_DIR
+  ) as tmp:
+    tmp.write(await file.read())
+    return Path(tmp.name)
+
+
+@router.get("/jobs/{job_id}")
+def get_ingest_job(job_id: str) -> IngestJob:
+  """Status, and once done the result, of a queued ingestion."""
+  job = ingest_queue.get(job_id)
+  if job is None:
+    raise HTTPException(status_code=404, detail="Ingest job not found")
+  return job
+
+
 # --- File path endpoints ---
 
 
-@router.post("/cv")
-async def ingest_cv_endpoint(request: IngestRequest) -> dict:
+@router.post("/cv", response_model=dict)
+async def ingest_cv_endpoint(request: IngestRequest) -> dict | JSONResponse:
   """Ingest a single CV PDF or every PDF inside a directory (non-recursive)."""
+  if config.INGEST_MODE == "queue":
+    return _queue_path(
+      "cv", request.file_path, not_found="CV file or directory not found"
+    )
+
   try:
     results: list[dict] = await ingest_cv(Path(request.file_path))
     return results[0]  # TODO: handle multiple retrun values
@@ -39,9 +83,14 @@ async def ingest_cv_endpoint(request: IngestRequest) -> dict:
     raise HTTPException(status_code=500, detail="Internal processing error") from None
 
 
-@router.post("/rfp")
-async def ingest_rfp_endpoint(request: IngestRequest) -> dict:
+@router.post("/rfp", response_model=dict)
+async def ingest_rfp_endpoint(request: IngestRequest) -> dict | JSONResponse:
   """Ingest a single RFP PDF or every RFP PDF inside a directory."""
+  if config.INGEST_MODE == "queue":
+    return _queue_path(
+      "rfp", request.file_path, not_found="RFP file or directory not found"
+    )
+
   try:
     results: list[dict] = await ingest_rfp(Path(request.file_path))
     return results[0]  # TODO: handle multiple retrun values
@@ -56,12 +105,15 @@ async def ingest_rfp_endpoint(request: IngestRequest) -> dict:
     raise HTTPException(status_code=500, detail="Internal processing error") from None
 
 
-@router.post("/projects")
-async def ingest_projects_endpoint(request: IngestRequest) -> dict:
+@router.post("/projects", response_model=dict)
+async def ingest_projects_endpoint(request: IngestRequest) -> dict | JSONResponse:
   """Trigger the ingestion of the projects file into Neo4j.
 
   This parses the file and creates Project nodes, Requirement links, and Assignments.
   """
+  if config.INGEST_MODE == "queue":
+    return _queue_path("projects", request.file_path, not_found="File not found")
+
   try:
     return await process_projects_json(Path(request.file_path))
   except FileNotFoundError:
@@ -74,13 +126,15 @@ async def ingest_projects_endpoint(request: IngestRequest) -> dict:
 # --- File upload endpoints ---
 
 
-@router.post("/cv/upload")
+@router.post("/cv/upload", response_model=list[dict[str, Any]])
 async def ingest_cv_upload(
   file: Annotated[UploadFile, File(...)],
-) -> list[dict[str, Any]]:
+) -> list[dict[str, Any]] | JSONResponse:
   """Upload and ingest a CV PDF."""
   if not (file.filename and file.filename.lower().endswith(".pdf")):
     raise HTTPException(status_code=400, detail="File must be a PDF")
+  if config.INGEST_MODE == "queue":
+    return _queued("cv", await _spool_upload(file, ".pdf"), delete_after=True)
 
   tmp_path: Path | None = None
   try:
@@ -100,16 +154,20 @@ async def ingest_cv_upload(
       Path(tmp_path).unlink(missing_ok=True)
 
 
-@router.post("/rfp/upload", status_code=status.HTTP_201_CREATED)
+@router.post(
+  "/rfp/upload", status_code=status.HTTP_201_CREATED, response_model=dict[str, str]
+)
 async def ingest_rfp_upload(
   file: Annotated[UploadFile, File(description="RFP PDF document")],
-) -> dict[str, str]:
+) -> dict[str, str] | JSONResponse:
   """Upload and ingest an RFP PDF."""
   if not file.filename or not file.filename.lower().endswith(".pdf"):
     raise HTTPException(
       status_code=status.HTTP_400_BAD_REQUEST,
       detail="File must be a PDF",
     )
+  if config.INGEST_MODE == "queue":
+    return _queued("rfp", await _spool_upload(file, ".pdf"), delete_after=True)
 
   tmp_path: Path | None = None
   try:
@@ -139,13 +197,15 @@ async def ingest_rfp_upload(
       tmp_path.unlink(missing_ok=True)
 
 
-@router.post("/projects/upload")
+@router.post("/projects/upload", response_model=dict[str, Any])
 async def ingest_projects_upload(
   file: Annotated[UploadFile, File(...)],
-) -> dict[str, Any]:
+) -> dict[str, Any] | JSONResponse:
   """Upload and ingest a projects JSON file."""
   if not (file.filename and file.filename.lower().endswith(".json")):
     raise HTTPException(status_code=400, detail="File must be a JSON file")
+  if config.INGEST_MODE == "queue":
+    return _queued("projects", await _spool_upload(file, ".json"), delete_after=True)
 
   tmp_path: str | None = None
   try:
@@ -1,6 +1,9 @@
+import json
+from collections.abc import AsyncIterator
 from typing import Any
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from services import query_service
@@ -10,12 +13,14 @@ router = APIRouter(prefix="/query")
 
 class QueryRequest(BaseModel):
   question: str
+  full_answer: bool = False
 
 
 class QueryResponse(BaseModel):
   question: str
   answer: str
   cypher_query: str = ""
+  direct_answer: bool = False
   success: bool
   error: str | None = None
 
@@ -26,7 +31,32 @@ async def query_knowledge_graph(request: QueryRequest) -> dict[str, Any]:
   if not request.question.strip():
     raise HTTPException(status_code=400, detail="Question cannot be empty")
 
-  return await query_service.process_query(request.question)
+  return await query_service.process_query(request.question, request.full_answer)
+
+
+@router.post("/stream")
+async def stream_knowledge_graph_query(request: QueryRequest) -> StreamingResponse:
+  """Ask a natural language question and receive the answer as Server-Sent Events.
+
+  Emits the generated Cypher as soon as it exists, then the row count, then the
+  answer tokens as they are generated, and finally a `done`, `rejected` or
+  `error` event.
+  """
+  if not request.question.strip():
+    raise HTTPException(status_code=400, detail="Question cannot be empty")
+
+  async def event_source() -> AsyncIterator[str]:
+    async for event in query_service.stream_query(
+      request.question, request.full_answer
+    ):
+      name = event.pop("event")
+      yield f"event: {name}\ndata: {json.dumps(event)}\n\n"
+
+  return StreamingResponse(
+    event_source(),
+    media_type="text/event-stream",
+    headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+  )
 
 
 @router.get("/examples", response_model=dict[str, list[str]])
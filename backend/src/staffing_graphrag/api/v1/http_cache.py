@@ -0,0 +1,35 @@
+from collections.abc import Callable
+
+from fastapi import Request, Response, status
+from pydantic import BaseModel
+
+from services.graph_version import graph_version
+from services.response_cache import response_cache
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+  if not if_none_match:
+    return False
+  candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+  return "*" in candidates or etag in candidates
+
+
+def cached_json_response(request: Request, build: Callable[[], BaseModel]) -> Response:
+  """Serve a read endpoint with an ETag derived from the graph version.
+
+  Answers a matching If-None-Match with 304, and otherwise reuses the body
+  rendered at the current version for the same path and query string.
+  """
+  etag = graph_version.etag()
+  headers = {"ETag": etag, "Cache-Control": "no-cache"}
+
+  if _etag_matches(request.headers.get("if-none-match"), etag):
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+  key = f"{request.url.path}?{request.url.query}"
+  body = response_cache.get(key, etag)
+  if body is None:
+    body = build().model_dump_json(exclude_unset=True).encode("utf-8")
+    response_cache.set(key, etag, body)
+
+  return Response(content=body, media_type="application/json", headers=headers)
@@ -1,18 +1,25 @@
 from fastapi import APIRouter
 
 from api.v1.endpoints.admin import router as admin_router
+from api.v1.endpoints.admin import write_router as admin_write_router
 from api.v1.endpoints.entities import router as entities_router
 from api.v1.endpoints.info import router as info_router
-from api.v1.endpoints.ingest import router as ingest_router
 from api.v1.endpoints.matching import router as matching_router
 from api.v1.endpoints.query import router as query_router
 from core.config import config
 
 router = APIRouter(prefix=config.API_V1_STR)
 
-router.include_router(entities_router, tags=["Get Entities Operations"])
-router.include_router(info_router, tags=["Info Operations"])
-router.include_router(ingest_router, tags=["Ingest Operations"])
-router.include_router(matching_router, tags=["Matching Operations"])
-router.include_router(query_router, tags=["Query Operations"])
+# Read and ingest replicas scale apart; see SERVER_ROLE
+if config.SERVER_ROLE in ("all", "read"):
+  router.include_router(entities_router, tags=["Get Entities Operations"])
+  router.include_router(info_router, tags=["Info Operations"])
+  router.include_router(matching_router, tags=["Matching Operations"])
+  router.include_router(query_router, tags=["Query Operations"])
+if config.SERVER_ROLE in ("all", "ingest"):
+  # Imported only here so a read replica never loads the PDF and LLM stack
+  from api.v1.endpoints.ingest import router as ingest_router
+
+  router.include_router(ingest_router, tags=["Ingest Operations"])
+  router.include_router(admin_write_router, tags=["Admin Operations"])
 router.include_router(admin_router, tags=["Admin Operations"])
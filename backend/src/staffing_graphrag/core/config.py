@@ -1,3 +1,6 @@
+from pathlib import Path
+from typing import Literal
+
 from pydantic import SecretStr, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -10,6 +13,9 @@ class Config(BaseSettings):
   SERVER_HOST: str = "127.0.0.1"
   SERVER_PORT: int = 8032
   SERVER_DEBUG_MODE: bool = True
+  # "read" mounts only the read routers (entities, info, match, query), "ingest"
+  # only ingestion; "all" serves both from one process
+  SERVER_ROLE: Literal["all", "read", "ingest"] = "all"
 
   NEO4J_URI: str = "bolt://localhost:7687"
   NEO4J_USERNAME: str = "neo4j"
@@ -20,8 +26,74 @@ class Config(BaseSettings):
   OPENAI_DEFAULT_TEMPERATURE: float = 0
   OPENAI_GRAPH_QUERY_MODEL: str = "gpt-4o"
 
+  # "fake" swaps OpenAI for a deterministic offline model (benchmarks, CI)
+  LLM_BACKEND: Literal["openai", "fake"] = "openai"
+  FAKE_LLM_LATENCY_MS: float = 0
+
   USE_LANGCHAIN_LLM_GRAPH_TRANSFORMER: bool = False
 
+  CYPHER_CACHE_ENABLED: bool = True
+  CYPHER_CACHE_MAX_SIZE: int = 512
+
+  QUERY_DIRECT_ANSWER_ENABLED: bool = True
+  QUERY_DIRECT_ANSWER_MAX_ROWS: int = 20
+
+  CYPHER_GUARD_MAX_ROWS: int = 1000
+  CYPHER_GUARD_MAX_ESTIMATED_ROWS: int = 1_000_000
+  CYPHER_GUARD_TIMEOUT_SECONDS: float = 10.0
+  QA_CONTEXT_MAX_BYTES: int = 16_000
+
+  # Run named repository queries under PROFILE and keep the plans (debug only)
+  QUERY_PROFILING_ENABLED: bool = False
+
+  # Max age of the System Info graph stats before a background refresh
+  GRAPH_STATS_TTL_SECONDS: float = 60
+
+  # Serve /match from precomputed MATCH_SCORE relationships kept up to date by
+  # the write paths, instead of scoring everyone on every request
+  MATCH_STORE_ENABLED: bool = True
+
+  # Rendered entity pages kept per URL until the graph version changes
+  RESPONSE_CACHE_MAX_SIZE: int = 256
+
+  # Similarity (0-1) above which an unknown skill name folds into a known one;
+  # None limits canonicalization to exact alias lookups
+  SKILL_FUZZY_CUTOFF: float | None = 0.9
+
+  # PDFs whose text layer has fewer characters than this per page are parsed
+  # with unstructured instead; PDF_WORKERS=None sizes the pool to the CPUs
+  PDF_FAST_PATH_ENABLED: bool = True
+  PDF_MIN_CHARS_PER_PAGE: int = 200
+  PDF_WORKERS: int | None = None
+
+  # "queue" hands ingestion to workers through a SQLite job queue and answers
+  # 202 with a job id, instead of processing inside the request
+  INGEST_MODE: Literal["inline", "queue"] = "inline"
+  # With a split SERVER_ROLE or in queue mode this file also holds the graph
+  # version behind ETags and caches, so every role must share its host
+  INGEST_QUEUE_PATH: Path = Path("data/ingest_queue.sqlite3")
+  # Uploads wait here for a worker; workers must run on the same host
+  INGEST_SPOOL_DIR: Path = Path("data/ingest_spool")
+  # Worker threads an "all"/"ingest" process runs in queue mode; with 0, run
+  # `python -m services.ingest_worker` processes instead
+  INGEST_WORKERS: int = 1
+  INGEST_POLL_INTERVAL_SECONDS: float = 1.0
+  # Running jobs older than this are requeued when a worker starts
+  INGEST_JOB_TIMEOUT_SECONDS: float = 1800
+
+  # Name similarity (0-1) from which a CV resolves to a known person sharing a
+  # company or location; without one only the exact name (or email) resolves,
+  # and differing emails always keep people apart
+  PERSON_MATCH_THRESHOLD: float = 0.9
+
+  # Skill pairs less similar than this earn no partial credit in matching
+  SKILL_SIMILARITY_MIN_WEIGHT: float = 0.2
+
+  # Request and span latency histograms, and the /metrics endpoint serving them
+  METRICS_ENABLED: bool = True
+  # Log requests slower than this at WARNING; None disables the slow-request log
+  SLOW_REQUEST_LOG_MS: float | None = None
+
   model_config = SettingsConfigDict(env_file=".env", extra="ignore")
 
   @field_validator("NEO4J_PASSWORD")
@@ -28,3 +28,7 @@ ALLOWED_RELATIONSHIPS = [
 ]
 
 NODE_PROPERTIES = ["start_date", "end_date", "proficiency"]
+
+# Relationships the app derives from the domain data (precomputed match scores,
+# the skill similarity matrix); kept out of the QA schema and the graph stats
+DERIVED_RELATIONSHIPS = ["MATCH_SCORE", "SIMILAR_TO"]
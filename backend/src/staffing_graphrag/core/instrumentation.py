@@ -0,0 +1,184 @@
+import functools
+import inspect
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Any, ParamSpec, TypeVar
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+from core.config import config
+
+logger = logging.getLogger(__name__)
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+DEFAULT_BUCKETS = (
+  0.005,
+  0.01,
+  0.025,
+  0.05,
+  0.1,
+  0.25,
+  0.5,
+  1.0,
+  2.5,
+  5.0,
+  10.0,
+  30.0,
+  60.0,
+)
+
+
+def _escape(value: str) -> str:
+  return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class Histogram:
+  """Minimal Prometheus histogram with labels, safe to observe from threads."""
+
+  def __init__(
+    self,
+    name: str,
+    documentation: str,
+    label_names: tuple[str, ...],
+    buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+  ) -> None:
+    self.name = name
+    self.documentation = documentation
+    self.label_names = label_names
+    self.buckets = buckets
+    self._series: dict[tuple[str, ...], list[float]] = {}
+    self._lock = threading.Lock()
+
+  def observe(self, seconds: float, *label_values: str) -> None:
+    with self._lock:
+      # Per series: one cumulative count per bucket, then +Inf count, then sum
+      series = self._series.setdefault(label_values, [0.0] * (len(self.buckets) + 2))
+      for i, bound in enumerate(self.buckets):
+        if seconds <= bound:
+          series[i] += 1
+      series[-2] += 1
+      series[-1] += seconds
+
+  def render(self) -> list[str]:
+    lines = [
+      f"# HELP {self.name} {self.documentation}",
+      f"# TYPE {self.name} histogram",
+    ]
+    with self._lock:
+      series = {labels: list(values) for labels, values in self._series.items()}
+
+    for label_values, values in sorted(series.items()):
+      labels = ",".join(
+        f'{name}="{_escape(value)}"'
+        for name, value in zip(self.label_names, label_values, strict=True)
+      )
+      prefix = f"{labels}," if labels else ""
+      for bound, count in zip(self.buckets, values, strict=False):
+        lines.append(f'{self.name}_bucket{{{prefix}le="{bound}"}} {count:.0f}')
+      lines.append(f'{self.name}_bucket{{{prefix}le="+Inf"}} {values[-2]:.0f}')
+      lines.append(f"{self.name}_count{{{labels}}} {values[-2]:.0f}")
+      lines.append(f"{self.name}_sum{{{labels}}} {values[-1]}")
+    return lines
+
+
+REQUEST_LATENCY = Histogram(
+  "http_request_duration_seconds",
+  "HTTP request latency by route.",
+  ("method", "route", "status"),
+)
+SPAN_LATENCY = Histogram(
+  "span_duration_seconds",
+  "Latency of named spans: neo4j queries, LLM calls, PDF parsing, repositories.",
+  ("kind", "name"),
+)
+
+
+def render_metrics() -> str:
+  lines = REQUEST_LATENCY.render() + SPAN_LATENCY.render()
+  return "\n".join(lines) + "\n"
+
+
+@contextmanager
+def span(kind: str, name: str) -> Iterator[None]:
+  """Time a block and record it in the span histogram, if metrics are enabled."""
+  if not config.METRICS_ENABLED:
+    yield
+    return
+
+  start = time.perf_counter()
+  try:
+    yield
+  finally:
+    SPAN_LATENCY.observe(time.perf_counter() - start, kind, name)
+
+
+def timed(kind: str) -> Callable[[Callable[P, R]], Callable[P, R]]:
+  """Record every call of the decorated (sync or async) function as a span.
+
+  The span is named `<module>.<qualname>`, e.g. `cv_repository.upsert_cv`.
+  """
+
+  def decorator(func: Callable[P, R]) -> Callable[P, R]:
+    name = f"{func.__module__.rsplit('.', maxsplit=1)[-1]}.{func.__qualname__}"
+
+    if inspect.iscoroutinefunction(func):
+
+      @functools.wraps(func)
+      async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> object:
+        with span(kind, name):
+          return await func(*args, **kwargs)
+
+      return async_wrapper  # type: ignore[return-value]
+
+    @functools.wraps(func)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+      with span(kind, name):
+        return func(*args, **kwargs)
+
+    return wrapper
+
+  return decorator
+
+
+class LLMTimingCallback(BaseCallbackHandler):
+  """LangChain callback recording each chat model call as an `llm` span."""
+
+  run_inline = True
+
+  def __init__(self, model_name: str) -> None:
+    self.model_name = model_name
+    self._starts: dict[UUID, float] = {}
+
+  def on_chat_model_start(
+    self, serialized: dict[str, Any], messages: list, *, run_id: UUID, **kwargs: object
+  ) -> None:
+    self._starts[run_id] = time.perf_counter()
+
+  def on_llm_start(
+    self,
+    serialized: dict[str, Any],
+    prompts: list[str],
+    *,
+    run_id: UUID,
+    **kwargs: object,
+  ) -> None:
+    self._starts[run_id] = time.perf_counter()
+
+  def _finish(self, run_id: UUID) -> None:
+    start = self._starts.pop(run_id, None)
+    if start is not None and config.METRICS_ENABLED:
+      SPAN_LATENCY.observe(time.perf_counter() - start, "llm", self.model_name)
+
+  def on_llm_end(self, response: object, *, run_id: UUID, **kwargs: object) -> None:
+    self._finish(run_id)
+
+  def on_llm_error(
+    self, error: BaseException, *, run_id: UUID, **kwargs: object
+  ) -> None:
+    self._finish(run_id)
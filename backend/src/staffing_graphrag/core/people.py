@@ -0,0 +1,64 @@
+import re
+import unicodedata
+import uuid
+from difflib import SequenceMatcher
+
+_NON_WORD = re.compile(r"[^a-z0-9 ]+")
+
+# Characters of the surname-like token in a blocking key
+BLOCK_PREFIX_LENGTH = 4
+# Blocks larger than this (a very common name) are too costly to score
+MAX_BLOCK_SIZE = 200
+
+
+def normalize_name(name: str) -> str:
+  """Lowercase ASCII name with punctuation dropped: "José  O'Neil" -> "jose oneil"."""
+  ascii_name = (
+    unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode("ascii")
+  )
+  return " ".join(_NON_WORD.sub("", ascii_name.lower()).split())
+
+
+def normalize_email(email: str | None) -> str | None:
+  return email.strip().lower() or None if email else None
+
+
+def blocking_keys(normalized_name: str) -> set[str]:
+  """Cheap keys two spellings of a name are likely to share.
+
+  Each key pairs one token's prefix with another token's initial, e.g.
+  "john smith" -> {"john s", "smit j"}, so it survives a typo in the other
+  token and a swapped token order. All-digit tokens are skipped. Only people
+  sharing a key are compared, so resolution never scores the whole population.
+  """
+  tokens = [token for token in normalized_name.split() if not token.isdigit()]
+  if len(tokens) == 1:
+    return {tokens[0][:BLOCK_PREFIX_LENGTH]}
+  return {
+    f"{token[:BLOCK_PREFIX_LENGTH]} {other[0]}"
+    for i, token in enumerate(tokens)
+    if len(token) > 1
+    for j, other in enumerate(tokens)
+    if i != j
+  }
+
+
+def name_similarity(a: str, b: str, cutoff: float = 0.0) -> float:
+  """Similarity (0-1) of two normalized names, insensitive to token order.
+
+  Pairs that cannot reach `cutoff` return 0 without the full comparison.
+  """
+  matcher = SequenceMatcher(None, a, b)
+  # Reordering tokens keeps the characters, so this bounds both ratios
+  if matcher.real_quick_ratio() < cutoff or matcher.quick_ratio() < cutoff:
+    return 0.0
+  direct = matcher.ratio()
+  reordered = SequenceMatcher(
+    None, " ".join(sorted(a.split())), " ".join(sorted(b.split()))
+  ).ratio()
+  return max(direct, reordered)
+
+
+def new_person_id() -> str:
+  """Surrogate Person id; assigned once and never derived from the name again."""
+  return f"person-{uuid.uuid4().hex[:12]}"
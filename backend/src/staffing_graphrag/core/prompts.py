@@ -9,6 +9,8 @@ CYPHER_GENERATION_TEMPLATE = textwrap.dedent("""
   Do not use any other relationship types or properties that are not provided.
   For skill matching, always use case-insensitive comparison using toLower() function.
   For count queries, ensure you return meaningful column names.
+  A Person's name is in its `name` property; its `id` is an opaque identifier
+  (e.g. "person-3f2a9c1b7d4e"), so find and return people by `name`.
 
   Schema:
   {schema}
@@ -27,12 +29,17 @@ CYPHER_GENERATION_TEMPLATE = textwrap.dedent("""
   # Who has React skills?
   MATCH (p:Person)-[:HAS_SKILL]->(s:Skill)
   WHERE toLower(s.id) = toLower("React")
-  RETURN p.id AS name
+  RETURN p.name AS name
 
   # Find people with both Python and Django skills
   MATCH (p:Person)-[:HAS_SKILL]->(s1:Skill), (p)-[:HAS_SKILL]->(s2:Skill)
   WHERE toLower(s1.id) = toLower("Python") AND toLower(s2.id) = toLower("Django")
-  RETURN p.id AS name
+  RETURN p.name AS name
+
+  # Which skills does John Smith have?
+  MATCH (p:Person)-[:HAS_SKILL]->(s:Skill)
+  WHERE toLower(p.name) = toLower("John Smith")
+  RETURN s.id AS skill
 
   The question is:
   {question}
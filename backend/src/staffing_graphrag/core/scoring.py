@@ -0,0 +1,43 @@
+PROFICIENCY_LEVELS = {"Beginner": 1, "Intermediate": 2, "Advanced": 3, "Expert": 4}
+MAX_LEVEL = max(PROFICIENCY_LEVELS.values())
+
+# Points for a requirement the person has: (meets it, one level short, further short)
+MANDATORY_POINTS = (10, 6, 3)
+OPTIONAL_POINTS = (5, 3, 1)
+
+# Gaps (person level - required level) run from -MAX_LEVEL to MAX_LEVEL, unknown
+# proficiencies counting as level 0; index a gap table with gap + GAP_OFFSET.
+GAP_OFFSET = MAX_LEVEL
+
+
+def proficiency_level(proficiency: str | None) -> int:
+  """Integer level of a proficiency name, 0 when missing or unknown."""
+  if not proficiency:
+    return 0
+  return PROFICIENCY_LEVELS.get(proficiency.strip().title(), 0)
+
+
+def _gap_table(points: tuple[int, int, int]) -> list[int]:
+  meets, one_short, further_short = points
+  return [
+    meets if gap >= 0 else one_short if gap == -1 else further_short
+    for gap in range(-GAP_OFFSET, MAX_LEVEL + 1)
+  ]
+
+
+MANDATORY_GAP_POINTS = _gap_table(MANDATORY_POINTS)
+OPTIONAL_GAP_POINTS = _gap_table(OPTIONAL_POINTS)
+
+
+def gap_points(person_level: int, required_level: int, *, mandatory: bool) -> int:
+  """Points a held skill earns against a requirement, from the gap table."""
+  table = MANDATORY_GAP_POINTS if mandatory else OPTIONAL_GAP_POINTS
+  return table[person_level - required_level + GAP_OFFSET]
+
+
+# Query parameters every scoring query takes, so Cypher reads the same table
+SCORING_PARAMS = {
+  "mandatory_gap_points": MANDATORY_GAP_POINTS,
+  "optional_gap_points": OPTIONAL_GAP_POINTS,
+  "gap_offset": GAP_OFFSET,
+}
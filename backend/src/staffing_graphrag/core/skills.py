@@ -0,0 +1,192 @@
+import difflib
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+
+from core.config import config
+
+# Canonical skill id -> known spellings. Canonical ids keep the title-cased form
+# the graph already uses ("Postgresql", "Node.Js").
+SKILL_ALIASES: dict[str, tuple[str, ...]] = {
+  "Javascript": ("JS", "ECMAScript", "ES6"),
+  "Typescript": ("TS",),
+  "Node.Js": ("Node",),
+  "React": ("ReactJS",),
+  "Angular": ("AngularJS",),
+  "Vue.Js": ("Vue",),
+  "Python": ("Python3", "Py"),
+  "Go": ("Golang",),
+  "C++": ("CPP",),
+  "C#": ("CSharp", "C Sharp"),
+  "Postgresql": ("Postgres", "PSQL"),
+  "Mongodb": ("Mongo",),
+  "Mysql": (),
+  "Redis": (),
+  "Aws": ("Amazon Web Services",),
+  "Gcp": ("Google Cloud", "Google Cloud Platform"),
+  "Azure": ("Microsoft Azure",),
+  "Kubernetes": ("K8s", "Kube"),
+  "Docker": (),
+  "Ci/Cd": ("CICD", "Continuous Integration"),
+  "Machine Learning": ("ML",),
+  "Data Science": (),
+  "Devops": ("Dev Ops",),
+  "Fastapi": (),
+  "Django": (),
+  "Flask": (),
+  "Git": (),
+  "Jenkins": (),
+  "Java": (),
+  "Rust": (),
+  "Microservices": ("Micro Services",),
+}
+
+# Adjacent skills, with how much of a requirement for one the other covers (0-1)
+SKILL_RELATIONS: tuple[tuple[str, str, float], ...] = (
+  ("Kubernetes", "Docker", 0.6),
+  ("Kubernetes", "Devops", 0.5),
+  ("Docker", "Devops", 0.5),
+  ("Ci/Cd", "Devops", 0.6),
+  ("Jenkins", "Ci/Cd", 0.7),
+  ("Microservices", "Kubernetes", 0.4),
+  ("Microservices", "Docker", 0.4),
+  ("Typescript", "Javascript", 0.8),
+  ("Node.Js", "Javascript", 0.6),
+  ("React", "Javascript", 0.5),
+  ("Vue.Js", "Javascript", 0.5),
+  ("Angular", "Typescript", 0.5),
+  ("React", "Vue.Js", 0.5),
+  ("React", "Angular", 0.4),
+  ("Fastapi", "Python", 0.5),
+  ("Django", "Python", 0.5),
+  ("Flask", "Python", 0.5),
+  ("Fastapi", "Flask", 0.6),
+  ("Django", "Flask", 0.5),
+  ("Postgresql", "Mysql", 0.7),
+  ("Mongodb", "Redis", 0.3),
+  ("Aws", "Gcp", 0.6),
+  ("Aws", "Azure", 0.6),
+  ("Gcp", "Azure", 0.6),
+  ("Machine Learning", "Data Science", 0.7),
+  ("Data Science", "Python", 0.4),
+  ("Java", "C#", 0.5),
+  ("C++", "Rust", 0.5),
+)
+
+# Fuzzy matching short keys mostly finds false friends ("Go" vs "Git")
+FUZZY_MIN_KEY_LENGTH = 5
+
+# Lookups of names that are not written to the graph (read filters) kept per process
+LOOKUP_CACHE_MAX_SIZE = 1024
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+def normalize_key(name: str) -> str:
+  """Lookup key for a skill name: lowercase alphanumerics, `+`/`#` spelled out."""
+  key = name.strip().lower().replace("+", "plus").replace("#", "sharp")
+  return _NON_ALNUM.sub("", key)
+
+
+class SkillCanonicalizer:
+  """Map skill name variants to one canonical Skill id.
+
+  Exact lookups go through a hash of normalized keys; a miss falls back to
+  fuzzy matching against the known keys, and otherwise the title-cased name
+  becomes a new canonical id. Names being written (`learn=True`) join the
+  known keys; other lookups, e.g. user-typed filters, only go to a bounded LRU
+  cache, so free text cannot grow the index.
+  """
+
+  def __init__(
+    self, aliases: dict[str, tuple[str, ...]], fuzzy_cutoff: float | None
+  ) -> None:
+    self.fuzzy_cutoff = fuzzy_cutoff
+    self._index: dict[str, str] = {}
+    self._lookups: OrderedDict[str, str] = OrderedDict()
+    self._lock = threading.Lock()
+    for canonical, names in aliases.items():
+      for name in (canonical, *names):
+        self._index[normalize_key(name)] = canonical
+
+  def canonicalize(self, name: str, *, learn: bool = False) -> str:
+    """Canonical id for `name`; `learn` when the answer is written to the graph."""
+    key = normalize_key(name)
+    if not key:
+      return name.strip()
+
+    with self._lock:
+      canonical = self._index.get(key)
+      if canonical is not None:
+        return canonical
+      canonical = self._lookups.get(key)
+      if canonical is None:
+        canonical = self._fuzzy_lookup(key) or name.strip().title()
+
+      if learn:
+        self._index[key] = canonical
+        self._lookups.pop(key, None)
+      else:
+        self._lookups[key] = canonical
+        self._lookups.move_to_end(key)
+        if len(self._lookups) > LOOKUP_CACHE_MAX_SIZE:
+          self._lookups.popitem(last=False)
+      return canonical
+
+  def learn(self, names: Iterable[str]) -> None:
+    """Make existing Skill ids known, without overriding the aliases.
+
+    An id close enough to a known one folds into it, as it would at ingest,
+    so pass the most connected ids first.
+    """
+    with self._lock:
+      for name in names:
+        key = normalize_key(name)
+        if key and key not in self._index:
+          self._index[key] = self._fuzzy_lookup(key) or name
+      self._lookups.clear()
+
+  def _fuzzy_lookup(self, key: str) -> str | None:
+    if self.fuzzy_cutoff is None or len(key) < FUZZY_MIN_KEY_LENGTH:
+      return None
+    close = difflib.get_close_matches(key, self._index, n=1, cutoff=self.fuzzy_cutoff)
+    return self._index[close[0]] if close else None
+
+
+skill_canonicalizer = SkillCanonicalizer(SKILL_ALIASES, config.SKILL_FUZZY_CUTOFF)
+
+
+def canonical_skill(name: str, *, learn: bool = False) -> str:
+  return skill_canonicalizer.canonicalize(name, learn=learn)
+
+
+def similarity_matrix(
+  relations: Iterable[tuple[str, str, float]],
+) -> tuple[list[str], list[list[float]]]:
+  """Dense skill-by-skill similarity from weighted RELATED_TO edges.
+
+  Similarity is the strongest link of at most two hops, weights multiplied,
+  so "Kubernetes" -> "Docker" -> "Devops" still earns a little. Returns the
+  skill ids and the symmetric matrix indexed in the same order.
+  """
+  direct: dict[tuple[str, str], float] = {}
+  for a, b, weight in relations:
+    for pair in ((a, b), (b, a)):
+      direct[pair] = max(direct.get(pair, 0.0), weight)
+
+  skills = sorted({a for a, _ in direct})
+  index = {skill: i for i, skill in enumerate(skills)}
+  matrix = [[0.0] * len(skills) for _ in skills]
+  neighbours: dict[str, list[tuple[str, float]]] = {}
+  for (a, b), weight in direct.items():
+    matrix[index[a]][index[b]] = weight
+    neighbours.setdefault(a, []).append((b, weight))
+
+  for via, links in neighbours.items():
+    for a, weight_a in links:
+      for b, weight_b in links:
+        if a != b and via not in (a, b):
+          i, j = index[a], index[b]
+          matrix[i][j] = max(matrix[i][j], weight_a * weight_b)
+  return skills, matrix
@@ -1,19 +1,83 @@
+import asyncio
 import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
-from unstructured.partition.pdf import partition_pdf
+from pypdf import PdfReader
+
+from core.config import config
+from core.instrumentation import span
 
 logger = logging.getLogger(__name__)
 
+# A text layer with less than this share of letters and digits is garbled,
+# e.g. a font without a Unicode map
+MIN_ALNUM_RATIO = 0.6
+
+
+def _text_layer_is_usable(text: str, page_count: int) -> bool:
+  chars = "".join(text.split())
+  if len(chars) < config.PDF_MIN_CHARS_PER_PAGE * max(page_count, 1):
+    return False
+  return sum(char.isalnum() for char in chars) / len(chars) >= MIN_ALNUM_RATIO
+
+
+def _extract_text_layer(pdf_path: Path) -> str | None:
+  """Text of the PDF's own text layer, or None when it is missing or poor."""
+  try:
+    reader = PdfReader(pdf_path)
+    text = "\n\n".join(page.extract_text() or "" for page in reader.pages)
+  except Exception:
+    logger.warning("Reading the text layer of %s failed.", pdf_path, exc_info=True)
+    return None
+  return text if _text_layer_is_usable(text, len(reader.pages)) else None
+
+
+def _partition_pdf(pdf_path: Path) -> str:
+  # Imported on demand: unstructured loads layout models, which a worker that
+  # only sees text-layer PDFs never needs
+  from unstructured.partition.pdf import partition_pdf  # noqa: PLC0415
+
+  elements = partition_pdf(filename=str(pdf_path))
+  return "\n\n".join([str(element) for element in elements])
+
 
 def extract_text_from_pdf(pdf_path: Path) -> str:
-  """Extract text content from a PDF file using unstructured.
+  """Extract text content from a PDF file.
 
-  Shared utility for CVs and RFPs.
+  Shared utility for CVs and RFPs. The PDF's text layer is used when it looks
+  complete; scanned or garbled documents fall back to unstructured.
   """
   try:
-    elements = partition_pdf(filename=str(pdf_path))
-    return "\n\n".join([str(element) for element in elements])
+    if config.PDF_FAST_PATH_ENABLED:
+      with span("pdf", "text_layer"):
+        text = _extract_text_layer(pdf_path)
+      if text is not None:
+        return text
+      logger.info("No usable text layer in %s, partitioning it.", pdf_path.name)
+
+    with span("pdf", "partition_pdf"):
+      return _partition_pdf(pdf_path)
   except Exception as e:
     logger.exception("Failed to extract text from %s.", pdf_path)
     raise ValueError(f"Could not extract text from PDF: {e}") from None
+
+
+@lru_cache(maxsize=1)
+def _get_pdf_pool() -> ProcessPoolExecutor:
+  # Spawned, not forked: the server process runs threads (stats refresh, pools)
+  return ProcessPoolExecutor(
+    max_workers=config.PDF_WORKERS, mp_context=multiprocessing.get_context("spawn")
+  )
+
+
+async def aextract_text_from_pdf(pdf_path: Path) -> str:
+  """`extract_text_from_pdf` in the PDF process pool, off the event loop.
+
+  Spans recorded inside the workers stay there; this one covers the whole call.
+  """
+  loop = asyncio.get_running_loop()
+  with span("pdf", "extract_text"):
+    return await loop.run_in_executor(_get_pdf_pool(), extract_text_from_pdf, pdf_path)
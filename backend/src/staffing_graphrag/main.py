@@ -1,17 +1,101 @@
-from fastapi import FastAPI
+import logging
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import PlainTextResponse
 
 from api.v1.master_router import router
 from core.config import config
+from core.instrumentation import REQUEST_LATENCY, render_metrics
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+  from repositories.skill_repository import learn_existing_skills  # noqa: PLC0415
+
+  # Read filters canonicalize skills too, so every role learns the graph's ids
+  learn_existing_skills()
+  stop = None
+  if (
+    config.SERVER_ROLE in ("all", "ingest")
+    and config.INGEST_MODE == "queue"
+    and config.INGEST_WORKERS > 0
+  ):
+    from services.ingest_worker import start_workers  # noqa: PLC0415
+
+    stop = start_workers(config.INGEST_WORKERS)
+  yield
+  if stop is not None:
+    stop.set()
+
 
 app = FastAPI(
   title=config.PROJECT_NAME,
   version=config.API_VERSION,
   openapi_url=f"{config.API_V1_STR}/openapi.json",
+  lifespan=lifespan,
 )
 
 app.include_router(router)
 
 
+def _record_request(request: Request, status: int, start: float) -> None:
+  elapsed = time.perf_counter() - start
+  # Label by route template, not raw path, to keep the series bounded
+  route = request.scope.get("route")
+  route_path = getattr(route, "path", "unmatched")
+  if config.METRICS_ENABLED:
+    REQUEST_LATENCY.observe(elapsed, request.method, route_path, str(status))
+  if (
+    config.SLOW_REQUEST_LOG_MS is not None
+    and elapsed * 1000 > config.SLOW_REQUEST_LOG_MS
+  ):
+    logger.warning(
+      "Slow request: %s %s -> %s in %.0f ms",
+      request.method,
+      request.url.path,
+      status,
+      elapsed * 1000,
+    )
+
+
+@app.middleware("http")
+async def record_request_latency(
+  request: Request, call_next: Callable[[Request], Awaitable[Response]]
+) -> Response:
+  start = time.perf_counter()
+  try:
+    response = await call_next(request)
+  except Exception:
+    _record_request(request, 500, start)
+    raise
+
+  # call_next returns once the headers are ready; the clock stops after the
+  # last body chunk, so streamed responses (/query/stream) count in full
+  body_iterator = response.body_iterator  # type: ignore[attr-defined]
+
+  async def timed_body() -> AsyncIterator[bytes]:
+    try:
+      async for chunk in body_iterator:
+        yield chunk
+    finally:
+      _record_request(request, response.status_code, start)
+
+  response.body_iterator = timed_body()  # type: ignore[attr-defined]
+  return response
+
+
+if config.METRICS_ENABLED:
+
+  @app.get("/metrics", include_in_schema=False)
+  def metrics() -> PlainTextResponse:
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
+
+
 if __name__ == "__main__":
   import uvicorn
 
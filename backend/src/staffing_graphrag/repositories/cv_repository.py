@@ -1,20 +1,37 @@
+from core.instrumentation import timed
 from core.models.cv_models import CVStructure
+from core.scoring import proficiency_level
+from core.skills import canonical_skill
+from repositories.matching_repository import rescore_matches
+from repositories.person_repository import person_index
+from services.graph_version import mutates_graph
 from services.neo4j_service import get_neo4j_graph
 
 
-def upsert_cv(cv: CVStructure) -> None:
+@timed("repository")
+@mutates_graph
+def upsert_cv(cv: CVStructure) -> str:
+  """Write a CV to the graph and return the resolved Person id.
+
+  The person is resolved by email, name, or a similar name with a shared
+  company or location, so a re-ingested CV updates the existing node.
+  """
   graph = get_neo4j_graph()
+  person_id = person_index.resolve_or_create(
+    cv.full_name, cv.email, [cv.location, *cv.worked_for]
+  )
 
   def merge_person() -> None:
     cypher = """
-      MERGE (p:Person {id: $full_name})
+      MERGE (p:Person {id: $person_id})
       SET p.name = $full_name,
-          p.email = $email,
-          p.bio = $summary
+          p.email = coalesce($email, p.email),
+          p.bio = coalesce($summary, p.bio)
     """
     graph.query(
       cypher,
       params={
+        "person_id": person_id,
         "full_name": cv.full_name,
         "email": cv.email,
         "summary": cv.summary,
@@ -23,26 +40,28 @@ def upsert_cv(cv: CVStructure) -> None:
 
   def merge_skills() -> None:
     cypher = """
-      MATCH (p:Person {id: $person_name})
+      MATCH (p:Person {id: $person_id})
       MERGE (s:Skill {id: $skill_name})
       ON CREATE SET s.name = $skill_name
 
       MERGE (p)-[r:HAS_SKILL]->(s)
-      SET r.proficiency = $proficiency
+      SET r.proficiency = $proficiency,
+          r.level = $level
     """
     for skill in cv.skills:
       graph.query(
         cypher,
         params={
-          "person_name": cv.full_name,
-          "skill_name": skill.skill_name.strip().title(),
+          "person_id": person_id,
+          "skill_name": canonical_skill(skill.skill_name, learn=True),
           "proficiency": skill.proficiency.strip().title(),
+          "level": proficiency_level(skill.proficiency),
         },
       )
 
   def merge_work_history() -> None:
     cypher = """
-      MATCH (p:Person {id: $person_name})
+      MATCH (p:Person {id: $person_id})
       MERGE (c:Company {id: $company_name})
       ON CREATE SET c.name = $company_name
 
@@ -52,7 +71,7 @@ def upsert_cv(cv: CVStructure) -> None:
       graph.query(
         cypher,
         params={
-          "person_name": cv.full_name,
+          "person_id": person_id,
           "company_name": company_name.strip().title(),
         },
       )
@@ -62,7 +81,7 @@ def upsert_cv(cv: CVStructure) -> None:
       return
 
     cypher = """
-      MATCH (p:Person {id: $person_name})
+      MATCH (p:Person {id: $person_id})
       MERGE (u:University {id: $uni_name})
       ON CREATE SET u.name = $uni_name
 
@@ -71,14 +90,14 @@ def upsert_cv(cv: CVStructure) -> None:
     graph.query(
       cypher,
       params={
-        "person_name": cv.full_name,
+        "person_id": person_id,
         "uni_name": cv.university_name.strip().title(),
       },
     )
 
   def merge_certifications() -> None:
     cypher = """
-      MATCH (p:Person {id: $person_name})
+      MATCH (p:Person {id: $person_id})
       MERGE (c:Certification {id: $cert_name})
       ON CREATE SET c.name = $cert_name
 
@@ -88,7 +107,7 @@ def upsert_cv(cv: CVStructure) -> None:
       graph.query(
         cypher,
         params={
-          "person_name": cv.full_name,
+          "person_id": person_id,
           "cert_name": cert_name.strip().title(),
         },
       )
@@ -98,7 +117,7 @@ def upsert_cv(cv: CVStructure) -> None:
       return
 
     cypher = """
-      MATCH (p:Person {id: $person_name})
+      MATCH (p:Person {id: $person_id})
       MERGE (l:Location {id: $location_name})
       ON CREATE SET l.name = $location_name
 
@@ -107,7 +126,7 @@ def upsert_cv(cv: CVStructure) -> None:
     graph.query(
       cypher,
       params={
-        "person_name": cv.full_name,
+        "person_id": person_id,
         "location_name": cv.location.strip().title(),
       },
     )
@@ -118,3 +137,6 @@ def upsert_cv(cv: CVStructure) -> None:
   merge_education()
   merge_certifications()
   merge_location()
+
+  rescore_matches(person_ids=[person_id])
+  return person_id
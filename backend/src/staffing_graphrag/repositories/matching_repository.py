@@ -1,139 +1,310 @@
 import logging
 from typing import Any
 
+from neo4j import ManagedTransaction
 from shared_types.matching_types import CandidateMatch, MatchResponse
 
-from services.neo4j_service import get_neo4j_graph
+from core.config import config
+from core.instrumentation import timed
+from core.scoring import PROFICIENCY_LEVELS, SCORING_PARAMS
+from services.graph_version import mutates_graph
+from services.neo4j_service import get_neo4j_graph, get_neo4j_session
+from services.query_profiler import run_query
 
 logger = logging.getLogger(__name__)
 
 
+# Scores every (r:RFP, p:Person) pair bound by the caller's MATCH clauses; run it
+# with SCORING_PARAMS
+SCORING_BODY = """
+  // One row per requirement, joined to the person's skill when they have it
+  OPTIONAL MATCH (r)-[req:NEEDS]->(s:Skill)
+  OPTIONAL MATCH (p)-[hs:HAS_SKILL]->(s)
+  // Otherwise, to their skills with a precomputed similarity to it
+  OPTIONAL MATCH (p)-[rhs:HAS_SKILL]->(:Skill)-[sim:SIMILAR_TO]->(s)
+  WHERE hs IS NULL
+
+  // Integer levels are written with the relationships; the gap tables come
+  // from core.scoring via SCORING_PARAMS
+  WITH r, p, s, req, hs, rhs, sim,
+       CASE WHEN req.mandatory THEN $mandatory_gap_points ELSE $optional_gap_points END
+         AS gap_points
+  WITH r, p, s, req, hs, gap_points,
+       max(
+         sim.weight
+         * gap_points[coalesce(rhs.level, 0) - coalesce(req.level, 0) + $gap_offset]
+       ) AS related_points
+  WITH r, p,
+       collect(
+         CASE WHEN s IS NOT NULL THEN {
+           id: s.id,
+           mandatory: req.mandatory,
+           held: hs IS NOT NULL,
+           points:
+             CASE
+               WHEN hs IS NOT NULL
+                 THEN gap_points[coalesce(hs.level, 0) - coalesce(req.level, 0) + $gap_offset]
+               ELSE round(coalesce(related_points, 0), 1)
+             END
+         } END
+       ) AS requirements
+
+  // SCORE CALCULATION
+  WITH r, p,
+  reduce(score = 0, item IN requirements | score + item.points) AS total_score,
+
+  // Missing skills
+  [item IN requirements WHERE item.mandatory AND NOT item.held | item.id]
+    AS missing_mandatory,
+  [item IN requirements WHERE NOT item.mandatory AND NOT item.held | item.id]
+    AS missing_optional,
+
+  // Max possible score
+  reduce(max_score = 0, item IN requirements |
+    max_score +
+    CASE
+      WHEN item.mandatory THEN $mandatory_gap_points[-1]
+      ELSE $optional_gap_points[-1]
+    END
+  ) AS max_score
+
+  WHERE total_score > 0
+
+  // AVAILABILITY & PROJECT CONTEXT
+  OPTIONAL MATCH (p)-[assign:ASSIGNED_TO]->(proj:Project)
+  WHERE proj.status IN ['active', 'planned']
+
+  WITH r, p, total_score, max_score,
+       missing_mandatory, missing_optional,
+       max(date(assign.end_date)) AS last_project_end,
+       head(collect(proj.title)) AS last_project_title,
+       coalesce(date(r.start_date), date(r.deadline)) AS rfp_start
+
+  WITH r, p, total_score, max_score,
+       missing_mandatory, missing_optional,
+       last_project_end, last_project_title, rfp_start,
+       CASE
+         WHEN last_project_end IS NULL THEN -999
+         ELSE duration.inDays(rfp_start, last_project_end).days
+       END AS delay_days
+"""
+
+FIND_CANDIDATES_QUERY = (
+  """
+  MATCH (r:RFP {id: $rfp_id})
+  MATCH (p:Person)
+"""
+  + SCORING_BODY
+  + """
+  RETURN {
+    id: p.id,
+    name: coalesce(p.name, p.id),
+    role: 'Developer',
+
+    total_score: total_score,
+    skill_match_percent:
+      CASE
+        WHEN max_score = 0 THEN 0
+        ELSE (toFloat(total_score) / toFloat(max_score)) * 100
+      END,
+
+    missing_mandatory: missing_mandatory,
+    missing_optional: missing_optional,
+
+    delay_days: delay_days,
+    last_end_date: toString(last_project_end),
+    last_project_title: last_project_title
+  } AS candidate
+  ORDER BY total_score DESC
+"""
+)
+
+# Precomputed match store: one MATCH_SCORE relationship per scored (Person, RFP)
+# pair, and `match_scored_at` on RFPs whose whole candidate list is stored.
+_SCOPE = """
+  MATCH (r:RFP)
+  WHERE $rfp_ids IS NULL OR r.id IN $rfp_ids
+  MATCH (p:Person)
+  WHERE $person_ids IS NULL OR p.id IN $person_ids
+"""
+
+CLEAR_SCORES_QUERY = (
+  _SCOPE
+  + """
+  MATCH (p)-[m:MATCH_SCORE]->(r)
+  DELETE m
+"""
+)
+
+RESCORE_QUERY = (
+  _SCOPE
+  + SCORING_BODY
+  + """
+  MERGE (p)-[m:MATCH_SCORE]->(r)
+  SET m.total_score = total_score,
+      m.max_score = max_score,
+      m.missing_mandatory = missing_mandatory,
+      m.missing_optional = missing_optional,
+      m.delay_days = delay_days,
+      m.last_end_date = toString(last_project_end),
+      m.last_project_title = last_project_title
+"""
+)
+
+MARK_SCORED_QUERY = """
+  MATCH (r:RFP) WHERE r.id IN $rfp_ids
+  SET r.match_scored_at = datetime()
+"""
+
+IS_SCORED_QUERY = """
+  MATCH (r:RFP {id: $rfp_id})
+  RETURN r.match_scored_at IS NOT NULL AS scored
+"""
+
+STORED_CANDIDATES_QUERY = """
+  MATCH (r:RFP {id: $rfp_id})<-[m:MATCH_SCORE]-(p:Person)
+  RETURN {
+    id: p.id,
+    name: coalesce(p.name, p.id),
+    role: 'Developer',
+    total_score: m.total_score,
+    skill_match_percent:
+      CASE
+        WHEN m.max_score = 0 THEN 0
+        ELSE (toFloat(m.total_score) / toFloat(m.max_score)) * 100
+      END,
+    missing_mandatory: m.missing_mandatory,
+    missing_optional: m.missing_optional,
+    delay_days: m.delay_days,
+    last_end_date: m.last_end_date,
+    last_project_title: m.last_project_title
+  } AS candidate
+  ORDER BY m.total_score DESC
+"""
+
+# Levels for skill relationships written before they carried one, in batches so
+# large graphs do not need one huge transaction
+BACKFILL_LEVELS_QUERY = """
+  MATCH ()-[rel:HAS_SKILL|NEEDS|REQUIRES]->()
+  WHERE rel.level IS NULL
+  CALL {
+    WITH rel
+    SET rel.level = coalesce(
+      $levels[toLower(trim(coalesce(rel.proficiency, rel.minimum_level, '')))], 0
+    )
+  } IN TRANSACTIONS OF 10000 ROWS
+  RETURN count(*) AS updated
+"""
+
+# The skills of a few just-written people, small enough for one transaction
+BACKFILL_PERSON_LEVELS_QUERY = """
+  MATCH (p:Person)-[rel:HAS_SKILL]->()
+  WHERE p.id IN $person_ids AND rel.level IS NULL
+  SET rel.level = coalesce($levels[toLower(trim(coalesce(rel.proficiency, '')))], 0)
+  RETURN count(*) AS updated
+"""
+
+
+def _rescore(
+  tx: ManagedTransaction, rfp_ids: list[str] | None, person_ids: list[str] | None
+) -> None:
+  params = {"rfp_ids": rfp_ids, "person_ids": person_ids}
+  tx.run(CLEAR_SCORES_QUERY, params)
+  tx.run(RESCORE_QUERY, {**params, **SCORING_PARAMS})
+  if rfp_ids is not None and person_ids is None:
+    tx.run(MARK_SCORED_QUERY, {"rfp_ids": rfp_ids})
+
+
+@timed("repository")
+def rescore_matches(
+  rfp_ids: list[str] | None = None, person_ids: list[str] | None = None
+) -> None:
+  """Recompute stored match scores for the given RFPs and/or people.
+
+  `None` means all of them, so `rescore_matches(rfp_ids=[id])` rescores one RFP
+  against everyone and `rescore_matches(person_ids=[id])` rescores one person
+  against every RFP. One transaction, so readers never see the scores cleared
+  but not yet rewritten. On failure the store is invalidated, so reads fall
+  back to a full rescore instead of serving stale ranks.
+  """
+  if not config.MATCH_STORE_ENABLED:
+    return
+
+  try:
+    with get_neo4j_session() as session:
+      session.execute_write(_rescore, rfp_ids, person_ids)
+  except Exception:
+    logger.exception("Rescoring matches failed; invalidating the match store.")
+    invalidate_match_store()
+
+
+def invalidate_match_store() -> None:
+  """Mark every RFP unscored, e.g. after writes that bypass the repositories."""
+  try:
+    get_neo4j_graph().query("MATCH (r:RFP) REMOVE r.match_scored_at")
+  except Exception:
+    logger.exception("Could not invalidate the match store.")
+
+
+@timed("repository")
+@mutates_graph
+def backfill_proficiency_levels(person_ids: list[str] | None = None) -> int:
+  """Set the integer `level` on skill relationships that only have a name.
+
+  `person_ids` limits it to those people's skills; `None` scans the whole
+  graph. Idempotent; returns how many relationships were updated.
+  """
+  levels = {name.lower(): level for name, level in PROFICIENCY_LEVELS.items()}
+  if person_ids is not None:
+    updated = get_neo4j_graph().query(
+      BACKFILL_PERSON_LEVELS_QUERY, params={"person_ids": person_ids, "levels": levels}
+    )[0]["updated"]
+  else:
+    # CALL ... IN TRANSACTIONS needs an auto-commit transaction
+    with get_neo4j_session() as session:
+      updated = session.run(BACKFILL_LEVELS_QUERY, {"levels": levels}).single()[
+        "updated"
+      ]
+
+  if updated:
+    invalidate_match_store()
+  return updated
+
+
 class MatchingRepository:
   def __init__(self) -> None:
     self.graph = get_neo4j_graph()
 
+  @timed("repository")
   def find_candidates(self, rfp_id: str, max_delay_months: int = 1) -> MatchResponse:
-    query = """
-      MATCH (r:RFP {id: $rfp_id})
-      MATCH (p:Person)
-
-      // COLLECT RFP REQUIREMENTS
-      OPTIONAL MATCH (r)-[req:NEEDS]->(s:Skill)
-      WITH r, p,
-           collect({
-             id: s.id,
-             mandatory: req.mandatory,
-             req_level:
-               CASE req.proficiency
-                 WHEN 'Beginner' THEN 1
-                 WHEN 'Intermediate' THEN 2
-                 WHEN 'Advanced' THEN 3
-                 WHEN 'Expert' THEN 4
-                 ELSE 0
-               END
-           }) AS requirements
-
-      // COLLECT PERSON SKILLS
-      OPTIONAL MATCH (p)-[hs:HAS_SKILL]->(ps:Skill)
-      WITH r, p, requirements,
-           collect({
-             id: ps.id,
-             person_level:
-               CASE hs.proficiency
-                 WHEN 'Beginner' THEN 1
-                 WHEN 'Intermediate' THEN 2
-                 WHEN 'Advanced' THEN 3
-                 WHEN 'Expert' THEN 4
-                 ELSE 0
-               END
-           }) AS person_skills
-
-      // SCORE CALCULATION
-      WITH r, p, requirements, person_skills,
-
-      // Total score
-      reduce(score = 0, req IN requirements |
-        score +
-        CASE
-          WHEN any(ps IN person_skills WHERE ps.id = req.id) THEN
-            CASE
-              WHEN req.mandatory THEN
-                CASE
-                  WHEN (head([ps IN person_skills WHERE ps.id = req.id]).person_level - req.req_level) >= 0 THEN 10
-                  WHEN (head([ps IN person_skills WHERE ps.id = req.id]).person_level - req.req_level) = -1 THEN 6
-                  ELSE 3
-                END
-              ELSE
-                CASE
-                  WHEN (head([ps IN person_skills WHERE ps.id = req.id]).person_level - req.req_level) >= 0 THEN 5
-                  WHEN (head([ps IN person_skills WHERE ps.id = req.id]).person_level - req.req_level) = -1 THEN 3
-                  ELSE 1
-                END
-            END
-          ELSE 0
-        END
-      ) AS total_score,
-
-      // Missing skills
-      [item IN requirements
-       WHERE item.mandatory
-         AND NOT any(ps IN person_skills WHERE ps.id = item.id)
-       | item.id] AS missing_mandatory,
-
-      [item IN requirements
-       WHERE NOT item.mandatory
-         AND NOT any(ps IN person_skills WHERE ps.id = item.id)
-       | item.id] AS missing_optional,
-
-      // Max possible score
-      reduce(max_score = 0, item IN requirements |
-        max_score + CASE WHEN item.mandatory THEN 10 ELSE 5 END
-      ) AS max_score
-
-      WHERE total_score > 0
-
-      // AVAILABILITY & PROJECT CONTEXT
-      OPTIONAL MATCH (p)-[assign:ASSIGNED_TO]->(proj:Project)
-      WHERE proj.status IN ['active', 'planned']
-
-      WITH r, p, total_score, max_score,
-           missing_mandatory, missing_optional,
-           max(date(assign.end_date)) AS last_project_end,
-           head(collect(proj.title)) AS last_project_title,
-           coalesce(date(r.start_date), date(r.deadline)) AS rfp_start
-
-      WITH r, p, total_score, max_score,
-           missing_mandatory, missing_optional,
-           last_project_end, last_project_title, rfp_start,
-           CASE
-             WHEN last_project_end IS NULL THEN -999
-             ELSE duration.inDays(rfp_start, last_project_end).days
-           END AS delay_days
-
-      RETURN {
-        id: p.id,
-        name: coalesce(p.name, p.id),
-        role: 'Developer',
-
-        total_score: total_score,
-        skill_match_percent:
-          CASE
-            WHEN max_score = 0 THEN 0
-            ELSE (toFloat(total_score) / toFloat(max_score)) * 100
-          END,
-
-        missing_mandatory: missing_mandatory,
-        missing_optional: missing_optional,
-
-        delay_days: delay_days,
-        last_end_date: toString(last_project_end),
-        last_project_title: last_project_title
-      } AS candidate
-      ORDER BY total_score DESC
-    """
-
-    results = self.graph.query(query, params={"rfp_id": rfp_id})
+    if config.MATCH_STORE_ENABLED:
+      return self.read_stored_candidates(rfp_id, max_delay_months)
+    return self.score_candidates(rfp_id, max_delay_months)
+
+  def score_candidates(self, rfp_id: str, max_delay_months: int = 1) -> MatchResponse:
+    """Score every person against the RFP from scratch."""
+    results = run_query(
+      "find_candidates", FIND_CANDIDATES_QUERY, {"rfp_id": rfp_id, **SCORING_PARAMS}
+    )
+    return self._build_response(rfp_id, results, max_delay_months)
+
+  def read_stored_candidates(
+    self, rfp_id: str, max_delay_months: int = 1
+  ) -> MatchResponse:
+    """Read precomputed ranks, scoring the RFP first if it has never been scored."""
+    scored = self.graph.query(IS_SCORED_QUERY, params={"rfp_id": rfp_id})
+    if scored and not scored[0]["scored"]:
+      rescore_matches(rfp_ids=[rfp_id])
+
+    results = run_query(
+      "find_candidates.stored", STORED_CANDIDATES_QUERY, {"rfp_id": rfp_id}
+    )
+    return self._build_response(rfp_id, results, max_delay_months)
 
+  @staticmethod
+  def _build_response(
+    rfp_id: str, results: list[dict[str, Any]], max_delay_months: int
+  ) -> MatchResponse:
     response = MatchResponse(rfp_id=rfp_id)
 
     for row in results:
@@ -187,6 +358,8 @@ class MatchingRepository:
 
     return response
 
+  @timed("repository")
+  @mutates_graph
   def convert_rfp_to_project(self, rfp_id: str, programmer_ids: list[str]) -> str:
     """Convert an RFP to a project.
 
@@ -216,6 +389,7 @@ class MatchingRepository:
         MATCH (r)-[needs:NEEDS]->(s:Skill)
         CREATE (p)-[req:REQUIRES]->(s)
         SET req.minimum_level = needs.proficiency,
+            req.level = needs.level,
             req.mandatory = needs.mandatory
 
         // Assign Selected Programmers
@@ -241,4 +415,7 @@ class MatchingRepository:
     if not result:
       raise ValueError(f"Failed to convert RFP {rfp_id}. It might not exist.")
 
+    # The RFP's scores went with it; the new assignments change availability
+    rescore_matches(person_ids=programmer_ids)
+
     return result[0]["new_project_id"]
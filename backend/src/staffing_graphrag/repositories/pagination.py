@@ -0,0 +1,61 @@
+import base64
+import json
+from collections.abc import Callable, Collection
+from typing import Any
+
+from pydantic import BaseModel
+
+
+def encode_cursor(*values: object) -> str:
+  """Encode the sort key of the last row of a page as an opaque cursor."""
+  raw = json.dumps(list(values), separators=(",", ":"))
+  return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str, size: int) -> list[Any]:
+  """Decode a cursor into its `size` sort key values; ValueError if malformed."""
+  try:
+    values = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+  except (ValueError, UnicodeError):
+    raise ValueError("Invalid cursor.") from None
+  if not isinstance(values, list) or len(values) != size:
+    raise ValueError("Invalid cursor.")
+  return values
+
+
+def select_fields(fields: str | None, model: type[BaseModel]) -> set[str]:
+  """Parse a comma-separated field projection; `id` is always included."""
+  available = set(model.model_fields)
+  if not fields:
+    return available
+  requested = {f.strip() for f in fields.split(",") if f.strip()}
+  unknown = requested - available
+  if unknown:
+    raise ValueError(
+      f"Unknown fields: {', '.join(sorted(unknown))}. "
+      f"Available: {', '.join(sorted(available))}."
+    )
+  return requested | {"id"}
+
+
+def project_map(expressions: dict[str, str], fields: Collection[str]) -> str:
+  """Build a Cypher map literal with only the selected fields."""
+  return (
+    "{"
+    + ", ".join(
+      f"{name}: {expr}" for name, expr in expressions.items() if name in fields
+    )
+    + "}"
+  )
+
+
+def paginate(
+  rows: list[dict[str, Any]],
+  limit: int,
+  sort_key: Callable[[dict[str, Any]], tuple],
+) -> tuple[list[dict[str, Any]], str | None]:
+  """Cut `limit + 1` fetched rows to a page; return its data and the next cursor."""
+  if len(rows) <= limit:
+    return [row["data"] for row in rows], None
+  rows = rows[:limit]
+  return [row["data"] for row in rows], encode_cursor(*sort_key(rows[-1]))
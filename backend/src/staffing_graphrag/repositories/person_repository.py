@@ -0,0 +1,250 @@
+import logging
+import threading
+from collections.abc import Iterable
+from typing import NamedTuple
+
+from neo4j import ManagedTransaction
+
+from core.config import config
+from core.instrumentation import timed
+from core.people import (
+  MAX_BLOCK_SIZE,
+  blocking_keys,
+  name_similarity,
+  new_person_id,
+  normalize_email,
+  normalize_name,
+)
+from repositories.matching_repository import rescore_matches
+from services.graph_version import mutates_graph
+from services.neo4j_service import get_neo4j_graph, get_neo4j_session
+
+logger = logging.getLogger(__name__)
+
+# Most connected first, so a duplicate folds into the busiest node
+PEOPLE_QUERY = """
+  MATCH (p:Person)
+  RETURN p.id AS id, coalesce(p.name, p.id) AS name, p.email AS email,
+         [(p)-[:WORKED_AT|LOCATED_IN]->(x) | coalesce(x.name, x.id)] AS context
+  ORDER BY COUNT { (p)--() } DESC, p.id
+"""
+
+PERSON_RELATIONSHIPS = (
+  "HAS_SKILL",
+  "WORKED_AT",
+  "STUDIED_AT",
+  "LOCATED_IN",
+  "WORKED_ON",
+  "EARNED",
+  "ASSIGNED_TO",
+)
+
+
+class _Person(NamedTuple):
+  name: str
+  email: str | None
+  # Normalized companies and locations, which corroborate a fuzzy name match
+  context: frozenset[str]
+
+
+def _normalize_context(context: Iterable[str | None]) -> frozenset[str]:
+  return frozenset(filter(None, (normalize_name(item) for item in context if item)))
+
+
+class PersonIndex:
+  """In-memory Person lookup by email, normalized name and blocking key.
+
+  A person resolves on the same email, the same normalized name, or a similar
+  name backed by a shared company or location. A similar name alone is only
+  logged for review, since "Jon Smith" and "John Smith" may be two people.
+
+  Loaded from the graph on first use and kept current by the writes made
+  through it, so bulk ingestion resolves people without a query per CV.
+  """
+
+  def __init__(self, *, load_from_graph: bool = True) -> None:
+    self._loaded = not load_from_graph
+    self._lock = threading.RLock()
+    self._people: dict[str, _Person] = {}
+    self._by_email: dict[str, str] = {}
+    self._by_name: dict[str, set[str]] = {}
+    self._by_block: dict[str, set[str]] = {}
+
+  def _ensure_loaded(self) -> None:
+    if self._loaded:
+      return
+    for row in get_neo4j_graph().query(PEOPLE_QUERY):
+      self._add(row["id"], row["name"], row["email"], row["context"])
+    self._loaded = True
+
+  def _add(
+    self,
+    person_id: str,
+    name: str,
+    email: str | None,
+    context: Iterable[str | None] = (),
+  ) -> None:
+    normalized = normalize_name(name)
+    known = self._people.get(person_id)
+    email = normalize_email(email) or (known.email if known else None)
+    context = _normalize_context(context) | (known.context if known else frozenset())
+    self._people[person_id] = _Person(normalized, email, context)
+    if email:
+      self._by_email.setdefault(email, person_id)
+    self._by_name.setdefault(normalized, set()).add(person_id)
+    for key in blocking_keys(normalized):
+      self._by_block.setdefault(key, set()).add(person_id)
+
+  def _resolve(
+    self, name: str, email: str | None, context: Iterable[str | None]
+  ) -> str | None:
+    email = normalize_email(email)
+    if email and email in self._by_email:
+      return self._by_email[email]
+
+    normalized = normalize_name(name)
+    context = _normalize_context(context)
+    blocks = (self._by_block.get(key, set()) for key in blocking_keys(normalized))
+    # The exact name is always a candidate; an oversized block only adds cost
+    candidates = set(self._by_name.get(normalized, ())).union(
+      *(block for block in blocks if len(block) <= MAX_BLOCK_SIZE)
+    )
+    best_id, best_rank = None, (False, 0.0)
+    for candidate_id in sorted(candidates):
+      candidate = self._people[candidate_id]
+      # Two people may share a name; different emails tell them apart
+      if email and candidate.email and email != candidate.email:
+        continue
+      score = name_similarity(
+        normalized, candidate.name, cutoff=config.PERSON_MATCH_THRESHOLD
+      )
+      if score < config.PERSON_MATCH_THRESHOLD:
+        continue
+      corroborated = bool(context & candidate.context)
+      if candidate.name != normalized and not corroborated:
+        logger.info(
+          "Not resolving %r to %s (%r): similar name, but no shared email, "
+          "company or location.",
+          name,
+          candidate_id,
+          candidate.name,
+        )
+        continue
+      if (corroborated, score) > best_rank:
+        best_id, best_rank = candidate_id, (corroborated, score)
+    return best_id
+
+  def resolve(
+    self, name: str, email: str | None = None, context: Iterable[str | None] = ()
+  ) -> str | None:
+    """Id of the known person this name/email most likely refers to, if any.
+
+    `context` holds the person's companies and locations.
+    """
+    with self._lock:
+      self._ensure_loaded()
+      return self._resolve(name, email, context)
+
+  def resolve_or_create(
+    self, name: str, email: str | None = None, context: Iterable[str | None] = ()
+  ) -> str:
+    """Resolve a person, reserving a new surrogate id when nobody matches."""
+    context = list(context)
+    with self._lock:
+      self._ensure_loaded()
+      person_id = self._resolve(name, email, context) or new_person_id()
+      self._add(person_id, name, email, context)
+      return person_id
+
+  def add(
+    self,
+    person_id: str,
+    name: str,
+    email: str | None = None,
+    context: Iterable[str | None] = (),
+  ) -> None:
+    with self._lock:
+      self._ensure_loaded()
+      self._add(person_id, name, email, context)
+
+  def invalidate(self) -> None:
+    """Reload from the graph on next use, after writes that bypass the index."""
+    with self._lock:
+      self._people.clear()
+      self._by_email.clear()
+      self._by_name.clear()
+      self._by_block.clear()
+      self._loaded = False
+
+
+person_index = PersonIndex()
+
+
+def _move_relationships_query(rel_type: str) -> str:
+  # When both nodes already have the relationship, the canonical one is kept,
+  # except that a higher skill level wins
+  return f"""
+    MATCH (dup:Person)-[old:{rel_type}]->(x)
+    WHERE dup.id IN $duplicates
+    MATCH (canon:Person {{id: $canonical}})
+    MERGE (canon)-[new:{rel_type}]->(x)
+    ON CREATE SET new = properties(old)
+    FOREACH (_ IN CASE WHEN coalesce(old.level, 0) > coalesce(new.level, 0)
+                  THEN [1] ELSE [] END |
+      SET new += properties(old)
+    )
+  """
+
+
+def _merge_group(tx: ManagedTransaction, canonical: str, duplicates: list[str]) -> None:
+  params = {"canonical": canonical, "duplicates": duplicates}
+  for rel_type in PERSON_RELATIONSHIPS:
+    tx.run(_move_relationships_query(rel_type), params)
+  # Fill the canonical node's missing properties from the duplicates
+  tx.run(
+    """
+    MATCH (canon:Person {id: $canonical})
+    MATCH (dup:Person) WHERE dup.id IN $duplicates
+    WITH canon, dup, properties(canon) AS own
+    SET canon += properties(dup)
+    SET canon += own
+    """,
+    params,
+  )
+  tx.run("MATCH (p:Person) WHERE p.id IN $duplicates DETACH DELETE p", params)
+
+
+def find_duplicate_people() -> dict[str, list[str]]:
+  """Group existing Person ids that resolve to the same person."""
+  index = PersonIndex(load_from_graph=False)
+  groups: dict[str, list[str]] = {}
+  for row in get_neo4j_graph().query(PEOPLE_QUERY):
+    match = index.resolve(row["name"], row["email"], row["context"])
+    if match is None:
+      index.add(row["id"], row["name"], row["email"], row["context"])
+    else:
+      groups.setdefault(match, []).append(row["id"])
+  return groups
+
+
+@timed("repository")
+@mutates_graph
+def merge_duplicate_people(*, dry_run: bool = False) -> dict[str, list[str]]:
+  """Collapse Person nodes that resolve to the same person into one node.
+
+  Relationships and missing properties move to the most connected node of
+  each group, the duplicates are deleted, one transaction per group, and the
+  merged people are rescored. Returns the groups found, merged or not.
+  """
+  groups = find_duplicate_people()
+  if dry_run or not groups:
+    return groups
+
+  with get_neo4j_session() as session:
+    for canonical, duplicates in groups.items():
+      session.execute_write(_merge_group, canonical, duplicates)
+      logger.info("Merged people %s into %s.", duplicates, canonical)
+
+  person_index.invalidate()
+  rescore_matches(person_ids=list(groups))
+  return groups
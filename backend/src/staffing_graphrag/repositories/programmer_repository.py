@@ -1,46 +1,88 @@
-from shared_types.programmer_types import ProgrammerRead
+from shared_types.programmer_types import (
+  ProgrammerPage,
+  ProgrammerQuery,
+  ProgrammerRead,
+)
 
-from services.neo4j_service import get_neo4j_graph
+from core.instrumentation import timed
+from core.skills import canonical_skill
+from repositories.pagination import decode_cursor, paginate, project_map, select_fields
+from services.query_profiler import run_query
 
+PROGRAMMER_EXPRESSIONS = {
+  "id": "p.id",
+  "name": "p.name",
+  "location": "head([(p)-[:LOCATED_IN]->(l:Location) | l.name])",
+  "skills": """{
+    Expert: [x IN raw_skills WHERE x.proficiency = 'Expert' | x.skill],
+    Advanced: [x IN raw_skills WHERE x.proficiency = 'Advanced' | x.skill],
+    Intermediate: [x IN raw_skills WHERE x.proficiency = 'Intermediate' | x.skill],
+    Beginner: [x IN raw_skills WHERE x.proficiency = 'Beginner' | x.skill]
+  }""",
+  "is_assigned": "size(active_projects) > 0",
+  "current_project": "head(active_projects)",
+}
 
-def get_programmers(status: str | None = None) -> list[ProgrammerRead]:
-  cypher = """
-    MATCH (p:Person)
 
-    OPTIONAL MATCH (p)-[hs:HAS_SKILL]->(s:Skill)
-    WITH p, collect({
-      skill: s.id,
-      proficiency: hs.proficiency
-    }) AS raw_skills
-
-    OPTIONAL MATCH (p)-[:ASSIGNED_TO]->(proj:Project)
-    WHERE proj.status IN ['active', 'planned']
-    WITH
-      p,
-      raw_skills,
-      collect(DISTINCT proj.title) AS active_projects
-
-    RETURN {
-      id: p.id,
-      name: p.name,
-      location: p.location,
-      skills: {
-        Expert: [x IN raw_skills WHERE x.proficiency = 'Expert' | x.skill],
-        Advanced: [x IN raw_skills WHERE x.proficiency = 'Advanced' | x.skill],
-        Intermediate: [x IN raw_skills WHERE x.proficiency = 'Intermediate' | x.skill],
-        Beginner: [x IN raw_skills WHERE x.proficiency = 'Beginner' | x.skill]
-      },
-      is_assigned: size(active_projects) > 0,
-      current_project: head(active_projects)
-    } AS data
+@timed("repository")
+def get_programmers(query: ProgrammerQuery | None = None) -> ProgrammerPage:
+  """Fetch programmers ordered by id, one keyset page at a time.
+
+  Filters run in Cypher and the page is cut before the per-person skill
+  collection, so its cost depends on the page size, not the headcount.
   """
+  query = query or ProgrammerQuery()
+  fields = select_fields(query.fields, ProgrammerRead)
+  (after_id,) = decode_cursor(query.cursor, 1) if query.cursor else (None,)
 
-  results = get_neo4j_graph().query(cypher)
-  parsed_results = [ProgrammerRead(**row["data"]) for row in results]
+  skills_clause = (
+    """
+    CALL {
+      WITH p
+      OPTIONAL MATCH (p)-[hs:HAS_SKILL]->(s:Skill)
+      RETURN collect({skill: s.id, proficiency: hs.proficiency}) AS raw_skills
+    }
+    """
+    if "skills" in fields
+    else ""
+  )
 
-  if status == "available":
-    return [p for p in parsed_results if not p.is_assigned]
-  if status == "assigned":
-    return [p for p in parsed_results if p.is_assigned]
+  cypher = f"""
+    MATCH (p:Person)
+    WHERE ($after_id IS NULL OR p.id > $after_id)
+      AND ($location IS NULL OR EXISTS {{
+        (p)-[:LOCATED_IN]->(l:Location)
+        WHERE toLower(l.name) CONTAINS toLower($location)
+      }})
+      AND ($skill IS NULL OR EXISTS {{ (p)-[:HAS_SKILL]->(:Skill {{id: $skill}}) }})
+    WITH p
+    ORDER BY p.id
+
+    CALL {{
+      WITH p
+      OPTIONAL MATCH (p)-[:ASSIGNED_TO]->(proj:Project)
+      WHERE proj.status IN ['active', 'planned']
+      RETURN collect(DISTINCT proj.title) AS active_projects
+    }}
+    WITH p, active_projects
+    WHERE $status IS NULL OR (size(active_projects) > 0) = ($status = 'assigned')
+    LIMIT $limit
+    {skills_clause}
+    RETURN {project_map(PROGRAMMER_EXPRESSIONS, fields)} AS data, p.id AS sort_id
+  """
 
-  return parsed_results
+  results = run_query(
+    "get_programmers",
+    cypher,
+    {
+      "after_id": after_id,
+      "status": query.status,
+      "skill": canonical_skill(query.skill) if query.skill else None,
+      "location": query.location,
+      "limit": query.limit + 1,
+    },
+  )
+  items, next_cursor = paginate(results, query.limit, lambda row: (row["sort_id"],))
+  return ProgrammerPage(
+    items=[ProgrammerRead(**item) for item in items], next_cursor=next_cursor
+  )
@@ -1,9 +1,19 @@
-from shared_types.project_types import ProjectRead
+from shared_types.project_types import ProjectPage, ProjectQuery, ProjectRead
 
+from core.instrumentation import timed
 from core.models.project_models import ProjectStatus, ProjectStructure
+from core.scoring import proficiency_level
+from core.skills import canonical_skill
+from repositories.matching_repository import rescore_matches
+from repositories.pagination import decode_cursor, paginate, project_map, select_fields
+from repositories.person_repository import person_index
+from services.graph_version import mutates_graph
 from services.neo4j_service import get_neo4j_graph
+from services.query_profiler import run_query
 
 
+@timed("repository")
+@mutates_graph
 def upsert_project(project: ProjectStructure) -> None:
   """Upsert a Project node and its relationships (Skills, People)."""
   graph = get_neo4j_graph()
@@ -30,6 +40,7 @@ def upsert_project(project: ProjectStructure) -> None:
 
     MERGE (p)-[r:REQUIRES]->(s)
     SET r.minimum_level = $min_proficiency,
+        r.level = $level,
         r.mandatory = $is_mandatory
     """
 
@@ -38,8 +49,9 @@ def upsert_project(project: ProjectStructure) -> None:
       cypher,
       params={
         "project_id": project.id,
-        "skill_name": req.skill_name,
+        "skill_name": canonical_skill(req.skill_name, learn=True),
         "min_proficiency": req.min_proficiency,
+        "level": proficiency_level(req.min_proficiency),
         "is_mandatory": req.is_mandatory,
       },
     )
@@ -51,53 +63,120 @@ def upsert_project(project: ProjectStructure) -> None:
 
   cypher = f"""
     MATCH (p:Project {{id: $project_id}})
-    MATCH (u:Person) WHERE u.id = $programmer_name OR u.name = $programmer_name
+    MATCH (u:Person {{id: $person_id}})
 
     MERGE (u)-[r:{rel_type}]->(p)
     SET r.start_date = $start_date,
         r.end_date = $end_date
     """
 
-  for person in project.assigned_programmers:
+  # Only a name is known here, so only an exact normalized name resolves;
+  # unresolved names are tried as ids, which older Person nodes still use
+  person_ids = [
+    person_index.resolve(person.programmer_name) or person.programmer_name
+    for person in project.assigned_programmers
+  ]
+  for person, person_id in zip(project.assigned_programmers, person_ids, strict=True):
     graph.query(
       cypher,
       params={
         "project_id": project.id,
-        "programmer_name": person.programmer_name,
+        "person_id": person_id,
         "start_date": person.assignment_start_date,
         "end_date": person.assignment_end_date,
       },
     )
 
+  # Assignments and project status decide the team's availability
+  if person_ids:
+    rescore_matches(person_ids=person_ids)
+
+
+PROJECT_EXPRESSIONS = {
+  "id": "p.id",
+  "title": "p.title",
+  "client": "p.client",
+  "status": "p.status",
+  "description": "p.description",
+  "required_skills": "req_skills",
+  "assigned_team": "team",
+}
 
-def get_projects() -> list[ProjectRead]:
-  """Fetch projects with requirements and team members."""
-  cypher = """
-    MATCH (p:Project)
 
-    OPTIONAL MATCH (p)-[:REQUIRES]->(s:Skill)
-
-    OPTIONAL MATCH (person:Person)-[r]->(p)
-    WHERE type(r) IN ['ASSIGNED_TO', 'WORKED_ON']
-
-    WITH p, collect(distinct s.id) as req_skills,
-         collect(distinct {
-            name: person.name,
-            id: person.id,
-            role: r.role
-         }) as team
-
-    RETURN {
-        id: p.id,
-        title: p.title,
-        client: p.client,
-        status: p.status,
-        description: p.description,
-        required_skills: req_skills,
-        assigned_team: team
-    } as data
-    ORDER BY p.start_date DESC
+@timed("repository")
+def get_projects(query: ProjectQuery | None = None) -> ProjectPage:
+  """Fetch projects with requirements and team members, newest first.
+
+  Keyset-paginated on (start_date DESC, id); requirements and team are only
+  collected for the rows of the page and only when those fields are selected.
+  """
+  query = query or ProjectQuery()
+  fields = select_fields(query.fields, ProjectRead)
+  after_date, after_id = (
+    decode_cursor(query.cursor, 2) if query.cursor else (None, None)
+  )
+
+  skills_clause = (
+    """
+    CALL {
+      WITH p
+      OPTIONAL MATCH (p)-[:REQUIRES]->(s:Skill)
+      RETURN collect(distinct s.id) as req_skills
+    }
+    """
+    if "required_skills" in fields
+    else ""
+  )
+  team_clause = (
+    """
+    CALL {
+      WITH p
+      OPTIONAL MATCH (person:Person)-[r]->(p)
+      WHERE type(r) IN ['ASSIGNED_TO', 'WORKED_ON']
+      RETURN collect(distinct {
+        name: person.name,
+        id: person.id,
+        role: r.role
+      }) as team
+    }
+    """
+    if "assigned_team" in fields
+    else ""
+  )
+
+  cypher = f"""
+    MATCH (p:Project)
+    WITH p, coalesce(p.start_date, '') AS sort_date
+    WHERE ($after_id IS NULL
+        OR sort_date < $after_date
+        OR (sort_date = $after_date AND p.id > $after_id))
+      AND ($status IS NULL OR p.status = $status)
+      AND ($client IS NULL OR toLower(p.client) CONTAINS toLower($client))
+      AND ($skill IS NULL OR EXISTS {{ (p)-[:REQUIRES]->(:Skill {{id: $skill}}) }})
+    WITH p, sort_date
+    ORDER BY sort_date DESC, p.id
+    LIMIT $limit
+    {skills_clause}
+    {team_clause}
+    RETURN {project_map(PROJECT_EXPRESSIONS, fields)} as data,
+           sort_date, p.id as sort_id
     """
 
-  results = get_neo4j_graph().query(cypher)
-  return [ProjectRead(**row["data"]) for row in results]
+  results = run_query(
+    "get_projects",
+    cypher,
+    {
+      "after_date": after_date,
+      "after_id": after_id,
+      "status": query.status,
+      "client": query.client,
+      "skill": canonical_skill(query.skill) if query.skill else None,
+      "limit": query.limit + 1,
+    },
+  )
+  items, next_cursor = paginate(
+    results, query.limit, lambda row: (row["sort_date"], row["sort_id"])
+  )
+  return ProjectPage(
+    items=[ProjectRead(**item) for item in items], next_cursor=next_cursor
+  )
@@ -1,42 +1,109 @@
 import logging
 
-from shared_types.rfp_types import RFPRead
+from neo4j import ManagedTransaction
+from shared_types.rfp_types import RFPPage, RFPQuery, RFPRead
 
+from core.instrumentation import timed
 from core.models.rfp_models import RFPStructure
-from services.neo4j_service import get_neo4j_graph
+from core.scoring import proficiency_level
+from core.skills import canonical_skill
+from repositories.matching_repository import rescore_matches
+from repositories.pagination import decode_cursor, paginate, project_map, select_fields
+from services.graph_version import mutates_graph
+from services.neo4j_service import get_neo4j_graph, get_neo4j_session
+from services.query_profiler import run_query
 
 logger = logging.getLogger(__name__)
 
 
-def get_rfps() -> list[RFPRead]:
-  """Fetch RFPs with needed skills."""
-  cypher = """
-    MATCH (r:RFP)
+EXISTING_RFPS_QUERY = """
+  MATCH (r:RFP)
+  WHERE r.id IN $ids
+  RETURN collect(r.id) AS ids
+"""
+
+# Every RFP and all of its NEEDS edges in one statement
+SAVE_RFPS_QUERY = """
+  UNWIND $rfps AS rfp
+  CREATE (r:RFP {id: rfp.id})
+  SET r.title = rfp.title,
+      r.description = rfp.description,
+      r.client = rfp.client,
+      r.budget = rfp.budget_range,
+      r.deadline = rfp.start_date,
+      r.location = rfp.location,
+      r.team_size = rfp.team_size
+  WITH r, rfp
+  UNWIND rfp.requirements AS req
+  MERGE (s:Skill {id: req.skill_name})
+  ON CREATE SET s.name = req.skill_name
+  MERGE (r)-[rel:NEEDS]->(s)
+  SET rel.proficiency = req.proficiency,
+      rel.level = req.level,
+      rel.mandatory = req.is_mandatory
+"""
+
+RFP_EXPRESSIONS = {
+  "id": "r.id",
+  "title": "r.title",
+  "client": "r.client",
+  "budget": "r.budget",
+  "needed_skills": "skills",
+}
+
+
+@timed("repository")
+def get_rfps(query: RFPQuery | None = None) -> RFPPage:
+  """Fetch RFPs with needed skills, keyset-paginated on id."""
+  query = query or RFPQuery()
+  fields = select_fields(query.fields, RFPRead)
+  (after_id,) = decode_cursor(query.cursor, 1) if query.cursor else (None,)
+
+  skills_clause = (
+    """
+    CALL {
+      WITH r
+      OPTIONAL MATCH (r)-[rel:NEEDS]->(s:Skill)
+      RETURN collect({
+        name: s.id,
+        level: rel.proficiency, // TODO: change level to proficiency
+        mandatory: rel.mandatory
+        }) as skills
+    }
+    """
+    if "needed_skills" in fields
+    else ""
+  )
 
-    OPTIONAL MATCH (r)-[rel:NEEDS]->(s:Skill)
-
-    WITH r, collect({
-      name: s.id,
-      level: rel.proficiency, // TODO: change level to proficiency
-      mandatory: rel.mandatory
-      }) as skills
-
-    RETURN {
-      id: r.id,
-      title: r.title,
-      client: r.client,
-      budget: r.budget,
-      needed_skills: skills
-      } as data
+  cypher = f"""
+    MATCH (r:RFP)
+    WHERE ($after_id IS NULL OR r.id > $after_id)
+      AND ($client IS NULL OR toLower(r.client) CONTAINS toLower($client))
+      AND ($skill IS NULL OR EXISTS {{ (r)-[:NEEDS]->(:Skill {{id: $skill}}) }})
+    WITH r
     ORDER BY r.id
+    LIMIT $limit
+    {skills_clause}
+    RETURN {project_map(RFP_EXPRESSIONS, fields)} as data, r.id as sort_id
   """
 
-  results = get_neo4j_graph().query(cypher)
-  return [RFPRead(**row["data"]) for row in results]
+  results = run_query(
+    "get_rfps",
+    cypher,
+    {
+      "after_id": after_id,
+      "client": query.client,
+      "skill": canonical_skill(query.skill) if query.skill else None,
+      "limit": query.limit + 1,
+    },
+  )
+  items, next_cursor = paginate(results, query.limit, lambda row: (row["sort_id"],))
+  return RFPPage(items=[RFPRead(**item) for item in items], next_cursor=next_cursor)
 
 
-def get_next_rfp_id() -> str:
-  """Get the next available RFP ID from Neo4j."""
+@timed("repository")
+def get_next_rfp_ids(count: int) -> list[str]:
+  """Get the next `count` available RFP IDs from Neo4j, e.g. for a batch save."""
   graph = get_neo4j_graph()
   result = graph.query("""
         MATCH (r:RFP)
@@ -44,67 +111,69 @@ def get_next_rfp_id() -> str:
         ORDER BY r.id DESC
         LIMIT 1
     """)
-  if not result:
-    return "RFP-001"
+  # e.g., "RFP-042"
+  start = int(result[0]["id"].split("-")[1]) + 1 if result else 1
+  return [f"RFP-{num:03d}" for num in range(start, start + count)]
 
-  last_id = result[0]["id"]  # e.g., "RFP-042"
-  num = int(last_id.split("-")[1]) + 1
-  return f"RFP-{num:03d}"
 
+def get_next_rfp_id() -> str:
+  """Get the next available RFP ID from Neo4j."""
+  return get_next_rfp_ids(1)[0]
 
-def save_rfp(rfp_data: RFPStructure) -> None:
-  """Create the RFP node and connects it to Skill nodes using the NEEDS relationship.
 
-  Fails if the RFP node already exists.
-  """
-  graph = get_neo4j_graph()
+def _rfp_params(rfp_data: RFPStructure) -> dict:
+  return {
+    **rfp_data.model_dump(exclude={"requirements"}),
+    "requirements": [
+      {
+        "skill_name": canonical_skill(req.skill_name, learn=True),
+        "proficiency": req.min_proficiency.strip().title(),
+        "level": proficiency_level(req.min_proficiency),
+        "is_mandatory": req.is_mandatory,
+      }
+      for req in rfp_data.requirements
+    ],
+  }
 
-  exists_cypher = """
-    MATCH (r:RFP {id: $id})
-    RETURN r.id AS id
-    LIMIT 1
-  """
-  if graph.query(exists_cypher, params={"id": rfp_data.id}):
-    raise ValueError(f"RFP with id '{rfp_data.id}' already exists.")
-    # TODO: provide a nice message
-
-  rfp_cypher = """
-    MERGE (r:RFP {id: $id})
-    SET r.title = $title,
-        r.description = $description,
-        r.client = $client,
-        r.budget = $budget_range,
-        r.deadline = $start_date,
-        r.location = $location,
-        r.team_size = $team_size
-  """
 
-  graph.query(rfp_cypher, params=rfp_data.model_dump())
+def _create_rfps(tx: ManagedTransaction, rfps: list[dict]) -> None:
+  ids = [rfp["id"] for rfp in rfps]
+  existing = tx.run(EXISTING_RFPS_QUERY, ids=ids).single(strict=True)["ids"]
+  if existing:
+    # Raising rolls the transaction back, so nothing of the batch is written
+    raise ValueError(f"RFP with id '{existing[0]}' already exists.")
+  tx.run(SAVE_RFPS_QUERY, rfps=rfps).consume()
 
-  # Create NEEDS relationships to Skills
-  skill_cypher = """
-    MATCH (r:RFP {id: $rfp_id})
-    MERGE (s:Skill {id: $skill_name})
-    ON CREATE SET s.name = $skill_name
 
-    MERGE (r)-[rel:NEEDS]->(s)
-    SET rel.proficiency = $proficiency,
-        rel.mandatory = $is_mandatory
-    """
+@timed("repository")
+@mutates_graph
+def save_rfps(rfps: list[RFPStructure]) -> None:
+  """Create RFP nodes and their NEEDS relationships to Skill nodes.
 
-  for req in rfp_data.requirements:
-    graph.query(
-      skill_cypher,
-      params={
-        "rfp_id": rfp_data.id,
-        "skill_name": req.skill_name.strip().title(),
-        "proficiency": req.min_proficiency.strip().title(),
-        "is_mandatory": req.is_mandatory,
-      },
-    )
+  The whole batch is written in one transaction: if any RFP id already exists,
+  none of them is saved.
+  """
+  if not rfps:
+    return
+  ids = [rfp.id for rfp in rfps]
+  if len(set(ids)) != len(ids):
+    raise ValueError("RFP ids in a batch must be unique.")
+
+  with get_neo4j_session() as session:
+    session.execute_write(_create_rfps, [_rfp_params(rfp) for rfp in rfps])
+
+  rescore_matches(rfp_ids=ids)
 
   logger.info(
-    "Saved RFP %s to Neo4j with %s skill requirements",
-    rfp_data.id,
-    len(rfp_data.requirements),
+    "Saved %s RFPs to Neo4j with %s skill requirements",
+    len(rfps),
+    sum(len(rfp.requirements) for rfp in rfps),
   )
+
+
+def save_rfp(rfp_data: RFPStructure) -> None:
+  """Create the RFP node and connects it to Skill nodes using the NEEDS relationship.
+
+  Fails if the RFP node already exists.
+  """
+  save_rfps([rfp_data])
@@ -0,0 +1,164 @@
+import logging
+
+from neo4j import ManagedTransaction
+
+from core.config import config
+from core.instrumentation import timed
+from core.skills import SKILL_RELATIONS, similarity_matrix, skill_canonicalizer
+from repositories.matching_repository import invalidate_match_store
+from services.graph_version import mutates_graph
+from services.neo4j_service import get_neo4j_graph, get_neo4j_session
+
+logger = logging.getLogger(__name__)
+
+SKILL_RELATIONSHIPS = ("HAS_SKILL", "NEEDS", "REQUIRES")
+
+# Most connected first, so that an unaliased spelling keeps its busiest variant
+SKILL_IDS_QUERY = """
+  MATCH (s:Skill)
+  RETURN s.id AS id
+  ORDER BY COUNT { (s)--() } DESC, s.id
+"""
+
+# Only links skills someone already has or needs, so the taxonomy adds no nodes
+SYNC_RELATIONS_QUERY = """
+  UNWIND $relations AS relation
+  MATCH (a:Skill {id: relation.a})
+  MATCH (b:Skill {id: relation.b})
+  MERGE (a)-[rel:RELATED_TO]->(b)
+  SET rel.weight = relation.weight
+  RETURN count(rel) AS linked
+"""
+
+RELATED_SKILLS_QUERY = """
+  MATCH (a:Skill)-[rel:RELATED_TO]->(b:Skill)
+  RETURN a.id AS a, b.id AS b, coalesce(rel.weight, 0.0) AS weight
+"""
+
+# SIMILAR_TO materializes the similarity matrix, one directed edge per
+# non-negligible cell, so scoring looks a pair up in one relationship hop
+WRITE_SIMILARITIES_QUERY = """
+  MATCH ()-[old:SIMILAR_TO]->()
+  DELETE old
+  WITH count(*) AS deleted
+  UNWIND $pairs AS pair
+  MATCH (a:Skill {id: pair.a})
+  MATCH (b:Skill {id: pair.b})
+  CREATE (a)-[:SIMILAR_TO {weight: pair.weight}]->(b)
+"""
+
+
+def _move_relationships_query(rel_type: str) -> str:
+  # When both nodes are already linked, the relationship with the higher level wins
+  return f"""
+    MATCH (x)-[old:{rel_type}]->(dup:Skill)
+    WHERE dup.id IN $duplicates
+    MATCH (canon:Skill {{id: $canonical}})
+    MERGE (x)-[new:{rel_type}]->(canon)
+    ON CREATE SET new = properties(old)
+    FOREACH (_ IN CASE WHEN coalesce(old.level, 0) > coalesce(new.level, 0)
+                  THEN [1] ELSE [] END |
+      SET new += properties(old)
+    )
+  """
+
+
+def _merge_group(tx: ManagedTransaction, canonical: str, duplicates: list[str]) -> None:
+  params = {"canonical": canonical, "duplicates": duplicates}
+  tx.run("MERGE (s:Skill {id: $canonical}) ON CREATE SET s.name = $canonical", params)
+  for rel_type in SKILL_RELATIONSHIPS:
+    tx.run(_move_relationships_query(rel_type), params)
+  tx.run("MATCH (s:Skill) WHERE s.id IN $duplicates DETACH DELETE s", params)
+
+
+def learn_existing_skills() -> int:
+  """Teach the shared canonicalizer the Skill ids already in the graph.
+
+  New spellings then fold into existing skills, not only into the aliases.
+  Returns the number of ids learned; 0 if the graph is unreachable.
+  """
+  try:
+    ids = [row["id"] for row in get_neo4j_graph().query(SKILL_IDS_QUERY)]
+  except Exception:
+    logger.warning("Could not load existing skills.", exc_info=True)
+    return 0
+  skill_canonicalizer.learn(ids)
+  return len(ids)
+
+
+def find_duplicate_skills() -> dict[str, list[str]]:
+  """Group existing Skill ids by canonical id; only groups with variants are kept.
+
+  Uses the shared canonicalizer, so merging folds exactly what ingest folds.
+  """
+  ids = [row["id"] for row in get_neo4j_graph().query(SKILL_IDS_QUERY)]
+  skill_canonicalizer.learn(ids)
+  groups: dict[str, list[str]] = {}
+  for skill_id in ids:
+    canonical = skill_canonicalizer.canonicalize(skill_id)
+    if skill_id != canonical:
+      groups.setdefault(canonical, []).append(skill_id)
+  return groups
+
+
+@timed("repository")
+@mutates_graph
+def merge_duplicate_skills(*, dry_run: bool = False) -> dict[str, list[str]]:
+  """Collapse Skill nodes that are spellings of one skill into the canonical node.
+
+  Relationships move to the canonical node and the variants are deleted, one
+  transaction per group. Returns the groups found, merged or not.
+  """
+  groups = find_duplicate_skills()
+  if dry_run or not groups:
+    return groups
+
+  with get_neo4j_session() as session:
+    for canonical, duplicates in groups.items():
+      session.execute_write(_merge_group, canonical, duplicates)
+      logger.info("Merged skills %s into %s.", duplicates, canonical)
+
+  learn_existing_skills()
+  invalidate_match_store()
+  return groups
+
+
+@timed("repository")
+@mutates_graph
+def sync_skill_relations() -> int:
+  """Write the built-in SKILL_RELATIONS taxonomy as RELATED_TO edges.
+
+  Pairs with a skill missing from the graph are skipped. Returns the number
+  of edges written.
+  """
+  relations = [{"a": a, "b": b, "weight": weight} for a, b, weight in SKILL_RELATIONS]
+  return get_neo4j_graph().query(SYNC_RELATIONS_QUERY, params={"relations": relations})[
+    0
+  ]["linked"]
+
+
+@timed("repository")
+@mutates_graph
+def rebuild_skill_similarity() -> int:
+  """Recompute the skill similarity matrix from every RELATED_TO edge.
+
+  Edges added by hand in Neo4j count as much as the built-in taxonomy.
+  Returns the number of SIMILAR_TO edges written.
+  """
+  graph = get_neo4j_graph()
+  relations = [
+    (row["a"], row["b"], row["weight"]) for row in graph.query(RELATED_SKILLS_QUERY)
+  ]
+  skills, matrix = similarity_matrix(relations)
+  pairs = [
+    {"a": a, "b": b, "weight": weight}
+    for a, row in zip(skills, matrix, strict=True)
+    for b, weight in zip(skills, row, strict=True)
+    if weight >= config.SKILL_SIMILARITY_MIN_WEIGHT
+  ]
+
+  with get_neo4j_session() as session:
+    session.execute_write(lambda tx: tx.run(WRITE_SIMILARITIES_QUERY, pairs=pairs))
+
+  invalidate_match_store()
+  return len(pairs)
@@ -1,65 +1,96 @@
 import logging
+import threading
+import time
 from typing import Any
 
+from core import constants
+from core.config import config
+from core.instrumentation import timed
+from services.graph_version import graph_version
 from services.neo4j_service import get_neo4j_graph
+from services.query_profiler import run_query
 
 logger = logging.getLogger(__name__)
 
 
-def get_graph_metadata() -> dict[str, Any]:
-  """Retrieve graph metadata.
+# Label-only and type-only patterns are answered from the count store, not a scan
+KEY_PATTERNS = {
+  "Person -> Skill": "MATCH (:Person)-[:HAS_SKILL]->() RETURN count(*) as count",
+  "Person -> Company": "MATCH (:Person)-[:WORKED_AT]->() RETURN count(*) as count",
+  "Person -> Project": "MATCH (:Person)-[:WORKED_ON]->() RETURN count(*) as count",
+}
 
-  Returns comprehensive statistics, schema details, and validation warnings
-  about the current state of the Knowledge Graph.
-  """
-  graph = get_neo4j_graph()
 
+def _quote(token: str) -> str:
+  return "`" + token.replace("`", "``") + "`"
+
+
+def _count_store_breakdown(
+  name: str, tokens: list[str], pattern: str
+) -> dict[str, int]:
+  """Count each label/type with one UNION ALL of count-store lookups."""
+  if not tokens:
+    return {}
+  query = "\nUNION ALL\n".join(
+    f"MATCH {pattern.format(_quote(token))} RETURN $tokens[{i}] as key, count(*) as count"
+    for i, token in enumerate(tokens)
+  )
+  results = run_query(name, query, {"tokens": tokens})
+  return {row["key"]: row["count"] for row in results}
+
+
+def _collect_graph_metadata() -> dict[str, Any]:
   try:
-    total_nodes = graph.query("MATCH (n) RETURN count(n) as count")[0]["count"]
-    total_relationships = graph.query("MATCH ()-[r]->() RETURN count(r) as count")[0][
-      "count"
-    ]
+    total_nodes = run_query(
+      "graph_metadata.total_nodes", "MATCH (n) RETURN count(n) as count"
+    )[0]["count"]
+    total_relationships = run_query(
+      "graph_metadata.total_relationships", "MATCH ()-[r]->() RETURN count(r) as count"
+    )[0]["count"]
   except Exception:
     logger.exception("Failed to get basic counts.")
     return {"error": "Could not connect to database"}
 
   node_breakdown = {}
   try:
-    query = """
-      MATCH (n)
-      UNWIND labels(n) as label
-      WITH label, count(n) as count
-      WHERE label <> '__Entity__'
-      RETURN label, count ORDER BY label
-    """
-    results = graph.query(query)
-    node_breakdown = {row["label"]: row["count"] for row in results}
+    labels = run_query(
+      "graph_metadata.labels",
+      "CALL db.labels() YIELD label RETURN label ORDER BY label",
+    )
+    node_breakdown = _count_store_breakdown(
+      "graph_metadata.node_breakdown",
+      [row["label"] for row in labels if row["label"] != "__Entity__"],
+      "(:{})",
+    )
   except Exception:
     logger.exception("Failed to get node breakdown.")
 
   relationship_type_breakdown = {}
   try:
-    query = """
-      MATCH ()-[r]->()
-      RETURN type(r) as type, count(r) as count
-      ORDER BY count DESC
-    """
-    results = graph.query(query)
-    relationship_type_breakdown = {row["type"]: row["count"] for row in results}
+    types = run_query(
+      "graph_metadata.relationship_types",
+      "CALL db.relationshipTypes() YIELD relationshipType RETURN relationshipType",
+    )
+    counts = _count_store_breakdown(
+      "graph_metadata.relationship_breakdown",
+      [row["relationshipType"] for row in types],
+      "()-[:{}]->()",
+    )
+    # Derived relationships are not domain data, so they are left out of the
+    # breakdown and the total
+    for rel_type in constants.DERIVED_RELATIONSHIPS:
+      total_relationships -= counts.pop(rel_type, 0)
+    relationship_type_breakdown = dict(
+      sorted(counts.items(), key=lambda item: item[1], reverse=True)
+    )
   except Exception:
     logger.exception("Failed to get relationship breakdown.")
 
   # Checks if the specific connections we care about actually exist
-  key_patterns = {
-    "Person -> Skill": "MATCH (p:Person)-[:HAS_SKILL]->(s:Skill) RETURN count(*) as count",
-    "Person -> Company": "MATCH (p:Person)-[:WORKED_AT]->(c:Company) RETURN count(*) as count",
-    "Person -> Project": "MATCH (p:Person)-[:WORKED_ON]->(pr:Project) RETURN count(*) as count",
-  }
-
   domain_stats = {}
-  for name, query in key_patterns.items():
+  for name, query in KEY_PATTERNS.items():
     try:
-      res = graph.query(query)
+      res = run_query(f"graph_metadata.domain_stats.{name}", query)
       count = res[0]["count"] if res else 0
       if count > 0:
         domain_stats[name] = count
@@ -88,6 +119,79 @@ def get_graph_metadata() -> dict[str, Any]:
   }
 
 
+class GraphStatsSnapshot:
+  """Graph metadata refreshed in the background once older than its TTL.
+
+  A write (graph version bump) also makes the snapshot stale.
+
+  Readers always get the last snapshot immediately (stale-while-revalidate);
+  only the very first call, or one after invalidate(), waits for the database.
+  """
+
+  def __init__(self, ttl_seconds: float) -> None:
+    self._ttl_seconds = ttl_seconds
+    self._data: dict[str, Any] | None = None
+    self._refreshed_at = 0.0
+    self._version = ""
+    self._lock = threading.Lock()
+    self._refreshing = False
+
+  def _refresh(self) -> dict[str, Any]:
+    try:
+      version = graph_version.current
+      data = _collect_graph_metadata()
+      with self._lock:
+        # Keep serving the previous snapshot if the database is unreachable
+        if "error" not in data or self._data is None:
+          self._data = data
+          self._refreshed_at = time.monotonic()
+          self._version = version
+        return self._data
+    finally:
+      with self._lock:
+        self._refreshing = False
+
+  def get(self) -> dict[str, Any]:
+    with self._lock:
+      data = self._data
+      stale = (
+        time.monotonic() - self._refreshed_at > self._ttl_seconds
+        or self._version != graph_version.current
+      )
+      start_refresh = data is not None and stale and not self._refreshing
+      if start_refresh or data is None:
+        self._refreshing = True
+
+    if data is None:
+      data = self._refresh()
+    elif start_refresh:
+      threading.Thread(target=self._refresh, name="graph-stats", daemon=True).start()
+
+    age = time.monotonic() - self._refreshed_at
+    return (
+      {**data, "snapshot_age_seconds": round(age, 1)} if "error" not in data else data
+    )
+
+  def invalidate(self) -> None:
+    with self._lock:
+      self._data = None
+
+
+graph_stats_snapshot = GraphStatsSnapshot(config.GRAPH_STATS_TTL_SECONDS)
+
+
+@timed("repository")
+def get_graph_metadata() -> dict[str, Any]:
+  """Retrieve graph metadata.
+
+  Returns comprehensive statistics, schema details, and validation warnings
+  about the current state of the Knowledge Graph. Counts come from the count
+  store and are served from a snapshot at most GRAPH_STATS_TTL_SECONDS old.
+  """
+  return graph_stats_snapshot.get()
+
+
+@timed("repository")
 def get_node_sample(label: str, limit: int = 5) -> list[dict[str, Any]]:
   """Fetch a few sample nodes of a specific type to verify content."""
   graph = get_neo4j_graph()
@@ -1,10 +1,14 @@
 import logging
 
+from repositories.person_repository import person_index
+from repositories.system_repository import graph_stats_snapshot
+from services.graph_version import mutates_graph
 from services.neo4j_service import get_neo4j_graph
 
 logger = logging.getLogger(__name__)
 
 
+@mutates_graph
 def reset_database() -> dict:
   """Perform a complete cleanup of the Neo4j database.
 
@@ -42,6 +46,9 @@ def reset_database() -> dict:
     node_count = graph.query("MATCH (n) RETURN count(n) as count")[0]["count"]
     rel_count = graph.query("MATCH ()-[r]->() RETURN count(r) as count")[0]["count"]
 
+    graph_stats_snapshot.invalidate()
+    person_index.invalidate()
+
     if node_count == 0 and rel_count == 0:
       return {"status": "success", "message": "Database completely cleared"}
     return {
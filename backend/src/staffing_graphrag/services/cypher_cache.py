@@ -0,0 +1,65 @@
+import hashlib
+import logging
+import re
+import threading
+from collections import OrderedDict
+
+from core.config import config
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_question(question: str) -> str:
+  """Normalize a question so trivial variations share a cache entry."""
+  return _WHITESPACE_RE.sub(" ", question).strip().rstrip("?.!").strip().lower()
+
+
+def schema_fingerprint(schema: str) -> str:
+  return hashlib.sha256(schema.encode("utf-8")).hexdigest()[:16]
+
+
+class CypherCache:
+  """Bounded LRU cache for the question -> Cypher generation step.
+
+  Only the generated Cypher is stored, never the query results, so a hit still
+  reads fresh data from the graph. Entries are keyed by the normalized question
+  and a fingerprint of the graph schema, so a schema change invalidates them.
+  """
+
+  def __init__(self, max_size: int) -> None:
+    self._max_size = max_size
+    self._entries: OrderedDict[tuple[str, str], str] = OrderedDict()
+    self._lock = threading.Lock()
+
+  @staticmethod
+  def make_key(question: str, schema: str) -> tuple[str, str]:
+    return normalize_question(question), schema_fingerprint(schema)
+
+  def get(self, key: tuple[str, str]) -> str | None:
+    with self._lock:
+      cypher = self._entries.get(key)
+      if cypher is not None:
+        self._entries.move_to_end(key)
+      return cypher
+
+  def set(self, key: tuple[str, str], cypher: str) -> None:
+    if self._max_size <= 0 or not cypher.strip():
+      return
+    with self._lock:
+      self._entries[key] = cypher
+      self._entries.move_to_end(key)
+      while len(self._entries) > self._max_size:
+        self._entries.popitem(last=False)
+
+  def invalidate(self, key: tuple[str, str]) -> None:
+    with self._lock:
+      self._entries.pop(key, None)
+
+  def clear(self) -> None:
+    with self._lock:
+      self._entries.clear()
+
+
+cypher_cache = CypherCache(config.CYPHER_CACHE_MAX_SIZE)
@@ -0,0 +1,98 @@
+import json
+import logging
+import re
+from typing import Any
+
+from neo4j import Query
+
+from core.config import config
+from core.instrumentation import span
+from services.neo4j_service import get_neo4j_session
+from services.query_profiler import walk_plan
+
+logger = logging.getLogger(__name__)
+
+_TRAILING_LIMIT_RE = re.compile(r"\bLIMIT\s+(\d+)\s*$", re.IGNORECASE)
+
+
+class CypherRejectedError(ValueError):
+  """Generated Cypher that the guard refused to execute."""
+
+
+def _bound_limit(cypher: str) -> str:
+  """Append a LIMIT to the statement, or lower an existing trailing one."""
+  max_rows = config.CYPHER_GUARD_MAX_ROWS
+  match = _TRAILING_LIMIT_RE.search(cypher)
+  if match is None:
+    return f"{cypher}\nLIMIT {max_rows}"
+  if int(match.group(1)) > max_rows:
+    return f"{cypher[: match.start()]}LIMIT {max_rows}"
+  return cypher
+
+
+def check_cypher(cypher: str) -> str:
+  """Validate generated Cypher with EXPLAIN and return the bounded statement.
+
+  Rejects anything that is not read-only, and queries whose planner estimate
+  exceeds CYPHER_GUARD_MAX_ESTIMATED_ROWS (typically cartesian products).
+  """
+  statement = cypher.strip().rstrip(";").strip()
+  if not statement:
+    raise CypherRejectedError("Empty Cypher statement.")
+  statement = _bound_limit(statement)
+
+  with span("neo4j", "guard.explain"), get_neo4j_session() as session:
+    summary = session.run(
+      Query(f"EXPLAIN {statement}", timeout=config.CYPHER_GUARD_TIMEOUT_SECONDS)
+    ).consume()
+
+  if summary.query_type != "r":
+    raise CypherRejectedError("Only read-only queries are allowed.")
+
+  operators = list(walk_plan(summary.plan or {}))
+  estimated_rows = max(
+    (op.get("args", {}).get("EstimatedRows", 0) for op in operators), default=0
+  )
+  if estimated_rows > config.CYPHER_GUARD_MAX_ESTIMATED_ROWS:
+    cartesian = any(
+      op.get("operatorType", "").startswith("CartesianProduct") for op in operators
+    )
+    raise CypherRejectedError(
+      f"Estimated {estimated_rows:.0f} rows exceeds the limit of "
+      f"{config.CYPHER_GUARD_MAX_ESTIMATED_ROWS}"
+      + (" (the plan contains a cartesian product)." if cartesian else ".")
+    )
+
+  return statement
+
+
+def run_guarded_cypher(cypher: str) -> tuple[str, list[dict[str, Any]]]:
+  """Check generated Cypher and run it with a transaction timeout and row cap.
+
+  Returns the statement that was actually executed and its rows.
+  """
+  statement = check_cypher(cypher)
+
+  rows: list[dict[str, Any]] = []
+  with span("neo4j", "guard.run"), get_neo4j_session() as session:
+    result = session.run(Query(statement, timeout=config.CYPHER_GUARD_TIMEOUT_SECONDS))
+    for record in result:
+      rows.append(record.data())
+      if len(rows) >= config.CYPHER_GUARD_MAX_ROWS:
+        logger.warning("Generated Cypher hit the row cap of %s.", len(rows))
+        break
+
+  return statement, rows
+
+
+def cap_context(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+  """Keep leading rows while their JSON size stays within QA_CONTEXT_MAX_BYTES."""
+  capped = []
+  size = 2  # enclosing brackets
+  for row in rows:
+    size += len(json.dumps(row, default=str)) + 2
+    if size > config.QA_CONTEXT_MAX_BYTES:
+      logger.info("QA context truncated to %s of %s rows.", len(capped), len(rows))
+      break
+    capped.append(row)
+  return capped
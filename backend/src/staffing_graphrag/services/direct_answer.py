@@ -0,0 +1,55 @@
+import re
+from typing import Any
+
+from core.config import config
+
+_CAMEL_BOUNDARY_RE = re.compile(r"(?<=[a-z0-9])(?=[A-Z])")
+
+EMPTY_RESULT_ANSWER = "I don't know the answer based on the current database."
+
+
+def _is_scalar(value: object) -> bool:
+  return value is None or isinstance(value, (str, int, float, bool))
+
+
+def _humanize(column: str) -> str:
+  """Turn a Cypher column alias into a label, e.g. `pythonProgrammers` -> `Python programmers`."""
+  words = _CAMEL_BOUNDARY_RE.sub(" ", column.rsplit(".", maxsplit=1)[-1]).replace(
+    "_", " "
+  )
+  words = words.strip().lower()
+  return words[:1].upper() + words[1:] if words else column
+
+
+def _format_value(value: object) -> str:
+  if isinstance(value, float):
+    return f"{value:g}"
+  return "none" if value is None else str(value)
+
+
+def render_direct_answer(rows: list[dict[str, Any]]) -> str | None:
+  """Render an answer for small, structured Cypher results without an LLM.
+
+  Handles an empty result, a single row of scalars (e.g. a count) and a short
+  single-column list (e.g. names). Returns None for anything else, so the caller
+  falls back to QA synthesis.
+  """
+  if not rows:
+    return EMPTY_RESULT_ANSWER
+
+  if len(rows) > config.QUERY_DIRECT_ANSWER_MAX_ROWS:
+    return None
+  if not all(row and all(_is_scalar(v) for v in row.values()) for row in rows):
+    return None
+
+  if len(rows) == 1:
+    row = rows[0]
+    parts = [f"{_humanize(column)}: {_format_value(v)}" for column, v in row.items()]
+    return "; ".join(parts) + "."
+
+  columns = list(rows[0])
+  if len(columns) != 1 or any(list(row) != columns for row in rows):
+    return None
+
+  values = [_format_value(row[columns[0]]) for row in rows]
+  return f"{_humanize(columns[0])} ({len(values)}): {', '.join(values)}."
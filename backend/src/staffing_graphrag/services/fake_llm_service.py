@@ -0,0 +1,221 @@
+import asyncio
+import re
+import time
+from collections.abc import Sequence
+from typing import Any
+
+from langchain_core.callbacks import (
+  AsyncCallbackManagerForLLMRun,
+  CallbackManagerForLLMRun,
+)
+from langchain_core.language_models import BaseChatModel, LanguageModelInput
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.prompt_values import PromptValue
+from langchain_core.runnables import Runnable, RunnableLambda
+from pydantic import BaseModel
+
+from core.models.cv_models import CVSkill, CVStructure
+from core.models.rfp_models import RFPStructure, SkillRequirement
+
+_LEVELS = "Beginner|Intermediate|Advanced|Expert"
+_EMAIL_RE = re.compile(r"[\w.+-]+@[\w-]+\.[\w.-]+")
+_SKILL_LEVEL_RE = re.compile(
+  rf"([A-Za-z][\w.+#/ ]{{0,40}}?)\s*(?:\(|:|-)\s*({_LEVELS})\b", re.IGNORECASE
+)
+_REQUIREMENT_RE = re.compile(
+  rf"\b(REQUIRED|Mandatory|Preferred|Nice-to-have)\s*:\s*(.+?)\s*-\s*({_LEVELS})\b",
+  re.IGNORECASE,
+)
+_FIELD_RE_TEMPLATE = r"^[\s*#-]*{label}\s*\**\s*:\s*\**\s*(.+)$"
+_DATE_RE = re.compile(r"\b\d{4}-\d{2}-\d{2}\b")
+_NUMBER_RE = re.compile(r"\d+")
+
+
+def _prompt_text(prompt: LanguageModelInput | Sequence[BaseMessage]) -> str:
+  if isinstance(prompt, str):
+    return prompt
+  if isinstance(prompt, PromptValue):
+    return prompt.to_string()
+  if isinstance(prompt, Sequence) and prompt:
+    last = prompt[-1]
+    return last.content if isinstance(last.content, str) else str(last.content)
+  return str(prompt)
+
+
+def _field(text: str, *labels: str) -> str | None:
+  for label in labels:
+    pattern = _FIELD_RE_TEMPLATE.format(label=re.escape(label))
+    match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
+    if match:
+      return match.group(1).strip().strip("*").strip()
+  return None
+
+
+def _first_heading(text: str) -> str | None:
+  for line in text.splitlines():
+    stripped = line.strip().lstrip("#").strip().strip("*").strip()
+    if stripped:
+      return stripped
+  return None
+
+
+def _document_text(prompt: str) -> str:
+  """Strip the extraction instructions that precede the document text."""
+  _, marker, text = prompt.partition("Text:\n")
+  return text if marker else prompt
+
+
+def fake_cv_structure(prompt: str) -> CVStructure:
+  text = _document_text(prompt)
+  email = _EMAIL_RE.search(text)
+
+  skills: dict[str, CVSkill] = {}
+  for name, level in _SKILL_LEVEL_RE.findall(text):
+    skill_name = name.strip(" -*:")
+    if skill_name and skill_name.lower() not in skills:
+      skills[skill_name.lower()] = CVSkill(
+        skill_name=skill_name,
+        proficiency=level.title(),  # type: ignore[arg-type]
+      )
+
+  return CVStructure(
+    full_name=_field(text, "Name") or _first_heading(text) or "Unknown Candidate",
+    email=email.group(0) if email else None,
+    location=_field(text, "Location"),
+    summary=_field(text, "Summary"),
+    university_name=_field(text, "University", "Education"),
+    skills=list(skills.values()),
+  )
+
+
+def fake_rfp_structure(prompt: str) -> RFPStructure:
+  text = _document_text(prompt)
+
+  def number(*labels: str, default: int) -> int:
+    value = _field(text, *labels)
+    match = _NUMBER_RE.search(value) if value else None
+    return int(match.group(0)) if match else default
+
+  start_date = _field(text, "Start Date")
+  date_match = _DATE_RE.search(start_date) if start_date else None
+  remote = (_field(text, "Remote Work", "Remote") or "").lower()
+
+  return RFPStructure(
+    title=_field(text, "Project", "Title") or _first_heading(text) or "Untitled RFP",
+    client=_field(text, "Client") or "Unknown Client",
+    description=_field(text, "Description") or "",
+    project_type=_field(text, "Project Type") or "Software Development",
+    duration_months=number("Duration", default=6),
+    team_size=number("Team Size", default=3),
+    budget_range=_field(text, "Budget Range", "Budget") or "",
+    start_date=date_match.group(0) if date_match else "2026-01-01",
+    location=_field(text, "Location") or "Remote",
+    remote_allowed=remote.startswith(("allowed", "yes", "true")),
+    requirements=[
+      SkillRequirement(
+        skill_name=skill.strip(),
+        min_proficiency=level.title(),
+        is_mandatory=kind.lower() in {"required", "mandatory"},
+      )
+      for kind, skill, level in _REQUIREMENT_RE.findall(text)
+    ],
+  )
+
+
+def fake_cypher(prompt: str) -> str:
+  """Derive a simple Cypher statement from the question of a generation prompt."""
+  _, _, question = prompt.rpartition("The question is:")
+  question = question.strip()
+  words = [w.strip("?,.!'\"") for w in question.split()]
+  skills = [w for w in words[1:] if w[:1].isupper()]
+
+  if skills:
+    match = (
+      "MATCH (p:Person)-[:HAS_SKILL]->(s:Skill)\n"
+      f'WHERE toLower(s.id) = toLower("{skills[0]}")'
+    )
+  else:
+    match = "MATCH (p:Person)"
+
+  if question.lower().startswith("how many"):
+    return f"{match}\nRETURN count(DISTINCT p) AS count"
+  return f"{match}\nRETURN DISTINCT p.name AS name"
+
+
+def fake_answer(prompt: str) -> str:
+  """Restate the information section of a QA prompt."""
+  _, marker, rest = prompt.partition("Information:")
+  if not marker:
+    return "OK"
+  information, _, _ = rest.partition("Question:")
+  information = information.strip()
+  if information in {"", "[]"}:
+    return "I don't know the answer based on the current database."
+  return f"Based on the knowledge graph: {information}"
+
+
+_STRUCTURED_BUILDERS: dict[type[BaseModel], Any] = {
+  CVStructure: fake_cv_structure,
+  RFPStructure: fake_rfp_structure,
+}
+
+
+class FakeChatModel(BaseChatModel):
+  """Deterministic, offline stand-in for ChatOpenAI.
+
+  Answers the prompts this service sends with rule-derived output (Cypher,
+  QA answers, CVStructure and RFPStructure) after a configurable delay, so the
+  surrounding pipeline can be profiled and load-tested without network access.
+  """
+
+  latency_ms: float = 0
+
+  @property
+  def _llm_type(self) -> str:
+    return "fake-chat"
+
+  def _respond(self, messages: list[BaseMessage]) -> ChatResult:
+    prompt = _prompt_text(messages)
+    if "Generate Cypher statement" in prompt:
+      content = fake_cypher(prompt)
+    else:
+      content = fake_answer(prompt)
+    return ChatResult(generations=[ChatGeneration(message=AIMessage(content=content))])
+
+  def _generate(
+    self,
+    messages: list[BaseMessage],
+    stop: list[str] | None = None,
+    run_manager: CallbackManagerForLLMRun | None = None,
+    **kwargs: object,
+  ) -> ChatResult:
+    time.sleep(self.latency_ms / 1000)
+    return self._respond(messages)
+
+  async def _agenerate(
+    self,
+    messages: list[BaseMessage],
+    stop: list[str] | None = None,
+    run_manager: AsyncCallbackManagerForLLMRun | None = None,
+    **kwargs: object,
+  ) -> ChatResult:
+    await asyncio.sleep(self.latency_ms / 1000)
+    return self._respond(messages)
+
+  def with_structured_output(  # type: ignore[override]
+    self, schema: type[BaseModel], **kwargs: object
+  ) -> Runnable[LanguageModelInput, BaseModel]:
+    builder = _STRUCTURED_BUILDERS.get(schema)
+    if builder is None:
+      raise TypeError(f"FakeChatModel cannot produce {schema.__name__}")
+
+    def build(prompt: LanguageModelInput) -> BaseModel:
+      time.sleep(self.latency_ms / 1000)
+      return builder(_prompt_text(prompt))
+
+    async def abuild(prompt: LanguageModelInput) -> BaseModel:
+      await asyncio.sleep(self.latency_ms / 1000)
+      return builder(_prompt_text(prompt))
+
+    return RunnableLambda(build, afunc=abuild)
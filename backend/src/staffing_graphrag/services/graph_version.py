@@ -0,0 +1,62 @@
+import functools
+import secrets
+import threading
+from collections.abc import Callable
+from typing import ParamSpec, TypeVar
+
+from core.config import config
+from services.job_queue import JobQueue, ingest_queue
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+class GraphVersion:
+  """Counter bumped by every write path, used to derive ETags.
+
+  Without a store the counter lives in this process, and the boot id keeps
+  tags from a previous process (whose counter restarted at zero) from ever
+  matching the current one. With a store it is shared by every process using
+  that file and read on each check, as writes may happen in another process.
+  """
+
+  def __init__(self, store: JobQueue | None = None) -> None:
+    self._store = store
+    self._boot_id = secrets.token_hex(4)
+    self._version = 0
+    self._lock = threading.Lock()
+
+  @property
+  def current(self) -> str:
+    if self._store is not None:
+      return self._store.graph_version()
+    return f"{self._boot_id}-{self._version}"
+
+  def bump(self) -> str:
+    if self._store is not None:
+      return self._store.bump_graph_version()
+    with self._lock:
+      self._version += 1
+      return f"{self._boot_id}-{self._version}"
+
+  def etag(self) -> str:
+    return f'"{self.current}"'
+
+
+# Split roles and queue workers write from other processes than the readers
+graph_version = GraphVersion(
+  ingest_queue if config.SERVER_ROLE != "all" or config.INGEST_MODE == "queue" else None
+)
+
+
+def mutates_graph(func: Callable[P, R]) -> Callable[P, R]:
+  """Bump the graph version after the call, even a failed one (writes may be partial)."""
+
+  @functools.wraps(func)
+  def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+    try:
+      return func(*args, **kwargs)
+    finally:
+      graph_version.bump()
+
+  return wrapper
@@ -1,19 +1,29 @@
 import asyncio
 import logging
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from langchain_core.documents import Document
-from langchain_experimental.graph_transformers import LLMGraphTransformer
 from result import Err
 
 from core import constants
 from core.config import config
 from core.models.cv_models import CVStructure
-from core.utils import extract_text_from_pdf
+from core.skills import canonical_skill
+from core.utils import aextract_text_from_pdf
 from repositories.cv_repository import upsert_cv
+from repositories.matching_repository import (
+  backfill_proficiency_levels,
+  invalidate_match_store,
+)
+from repositories.person_repository import person_index
+from services.graph_version import graph_version
+from services.llm_service import get_chat_model
 from services.neo4j_service import get_neo4j_graph
-from services.openai_service import get_openai_chat
+
+if TYPE_CHECKING:
+  from langchain_experimental.graph_transformers import LLMGraphTransformer
+  from langchain_neo4j.graphs.graph_document import GraphDocument
 
 logger = logging.getLogger(__name__)
 
@@ -53,7 +63,7 @@ async def ingest_cv(path: Path) -> list[dict[str, Any]]:
 async def _process_single_cv(pdf_path: Path) -> dict[str, Any]:
   logger.info("Processing CV: %s", pdf_path.name)
 
-  text_content = extract_text_from_pdf(pdf_path)
+  text_content = await aextract_text_from_pdf(pdf_path)
   if not text_content.strip():
     return {"status": "warning", "message": f"No text extracted from {pdf_path.name}"}
 
@@ -65,7 +75,7 @@ async def _process_single_cv(pdf_path: Path) -> dict[str, Any]:
 async def _ingest_via_structured_output(pdf_path: Path, text: str) -> dict[str, Any]:
   """Ingest a CV via structured output."""
   try:
-    llm_result = get_openai_chat(temperature=0)
+    llm_result = get_chat_model(temperature=0)
     if isinstance(llm_result, Err):
       assert False  # TODO: propagate further # noqa: B011, PT015, S101, RUF100
 
@@ -84,13 +94,14 @@ async def _ingest_via_structured_output(pdf_path: Path, text: str) -> dict[str,
       result if isinstance(result, CVStructure) else CVStructure.model_validate(result)
     )
 
-    upsert_cv(cv_data)
+    person_id = upsert_cv(cv_data)
 
     return {
       "status": "success",
       "method": "structured_output",
       "filename": pdf_path.name,
       "candidate": cv_data.full_name,
+      "person_id": person_id,
       "skills_found": len(cv_data.skills),
     }
 
@@ -113,12 +124,23 @@ async def _ingest_via_transformer(pdf_path: Path, text: str) -> dict[str, Any]:
     if not graph_documents:
       return {"status": "warning", "message": "LLM failed to extract graph data"}
 
+    _normalize_graph_documents(graph_documents)
+    _resolve_people(graph_documents)
+
     graph = get_neo4j_graph()
     graph.add_graph_documents(
       graph_documents,  # type: ignore[arg-type]
       baseEntityLabel=False,
       include_source=False,
     )
+    graph_version.bump()
+    # The transformer only writes proficiency names, so the new skills get
+    # their levels here; it writes arbitrary nodes, so every stored score may
+    # be stale
+    backfill_proficiency_levels(
+      [node.id for node in graph_documents[0].nodes if node.type == "Person"]
+    )
+    invalidate_match_store()
 
     return {
       "status": "success",
@@ -132,9 +154,63 @@ async def _ingest_via_transformer(pdf_path: Path, text: str) -> dict[str, Any]:
     return {"status": "error", "message": str(e)}
 
 
-def _get_llm_transformer() -> LLMGraphTransformer:
+def _normalize_graph_documents(graph_documents: list["GraphDocument"]) -> None:
+  """Give transformer output the ids and names the other write paths use."""
+  for document in graph_documents:
+    endpoints = [
+      node
+      for relationship in document.relationships
+      for node in (relationship.source, relationship.target)
+    ]
+    for node in [*document.nodes, *endpoints]:
+      if node.type == "Skill":
+        node.id = canonical_skill(node.id, learn=True)
+    for node in document.nodes:
+      # The transformer keys people by name; queries read it from `name`
+      if node.type in ("Person", "Skill"):
+        node.properties.setdefault("name", node.id)
+
+
+def _resolve_people(graph_documents: list["GraphDocument"]) -> None:
+  """Swap the transformer's name-based Person ids for resolved surrogate ids.
+
+  People resolve through the shared index like structured-output CVs, with
+  the companies and locations the document links them to as context.
+  """
+  for document in graph_documents:
+    context: dict[str, list[str]] = {}
+    for relationship in document.relationships:
+      if relationship.source.type == "Person" and relationship.type in (
+        "WORKED_AT",
+        "LOCATED_IN",
+      ):
+        context.setdefault(relationship.source.id, []).append(relationship.target.id)
+
+    person_ids = {
+      node.id: person_index.resolve_or_create(
+        node.properties.get("name", node.id), None, context.get(node.id, ())
+      )
+      for node in document.nodes
+      if node.type == "Person"
+    }
+    endpoints = [
+      node
+      for relationship in document.relationships
+      for node in (relationship.source, relationship.target)
+    ]
+    for node in [*document.nodes, *endpoints]:
+      if node.type == "Person" and node.id in person_ids:
+        node.id = person_ids[node.id]
+
+
+def _get_llm_transformer() -> "LLMGraphTransformer":
   """Initialize the LLMGraphTransformer with the specific CV ontology."""
-  llm_resulta = get_openai_chat(config.OPENAI_DEFAULT_MODEL)
+  # Deferred: only the transformer ingest path needs langchain_experimental
+  from langchain_experimental.graph_transformers import (  # noqa: PLC0415
+    LLMGraphTransformer,
+  )
+
+  llm_resulta = get_chat_model(config.OPENAI_DEFAULT_MODEL)
   if isinstance(llm_resulta, Err):
     assert False  # TODO: propagate further # noqa: B011, PT015, S101, RUF100
 
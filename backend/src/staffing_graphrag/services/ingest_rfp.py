@@ -7,16 +7,16 @@ from result import Err
 
 from core.constants import RFP_JSON_FILE, RFP_STORAGE_DIR
 from core.models.rfp_models import RFPStructure
-from core.utils import extract_text_from_pdf
-from repositories.rfp_repository import get_next_rfp_id, save_rfp
-from services.openai_service import get_openai_chat
+from core.utils import aextract_text_from_pdf
+from repositories.rfp_repository import get_next_rfp_ids, save_rfps
+from services.llm_service import get_chat_model
 
 logger = logging.getLogger(__name__)
 
 
 async def _extract_rfp_data(text: str) -> RFPStructure:
   """Use OpenAI Structured Output to parse raw text into the RFP Pydantic model."""
-  openai_chat_result = get_openai_chat(temperature=0)
+  openai_chat_result = get_chat_model(temperature=0)
   if isinstance(openai_chat_result, Err):
     assert False  # TODO: propagate further # noqa: B011, PT015, S101, RUF100
 
@@ -71,36 +71,54 @@ def _save_to_json_file(rfp_data: RFPStructure) -> None:
     json.dump(current_data, f, indent=2)
 
 
-async def _process_rfp(pdf_path: Path) -> dict:
+async def _parse_rfp(pdf_path: Path) -> RFPStructure | dict:
+  """Structure one RFP PDF, or return the error result when it has no text."""
   logger.info("Processing RFP: %s", pdf_path.name)
 
-  text_content = extract_text_from_pdf(pdf_path)
+  text_content = await aextract_text_from_pdf(pdf_path)
   if not text_content.strip():
     return {"status": "error", "message": f"No text extracted from {pdf_path.name}"}
 
-  rfp_structure = await _extract_rfp_data(text_content)
-  rfp_structure.id = get_next_rfp_id()
-  _save_to_json_file(rfp_structure)
+  return await _extract_rfp_data(text_content)
+
+
+def _save_rfps(rfps: list[RFPStructure]) -> list[dict]:
+  """Assign ids, then save to JSON and to Neo4j, the graph in one transaction."""
+  if not rfps:
+    return []
+
+  for rfp_id, rfp_structure in zip(get_next_rfp_ids(len(rfps)), rfps, strict=True):
+    rfp_structure.id = rfp_id
+    _save_to_json_file(rfp_structure)
 
   try:
-    save_rfp(rfp_structure)
+    save_rfps(rfps)
   except Exception:
     logger.exception("Neo4j ingestion failed.")
-    return {
-      "status": "partial_success",
-      "message": "Saved to JSON but failed to sync to Graph",
+    return [
+      {
+        "status": "partial_success",
+        "message": "Saved to JSON but failed to sync to Graph",
+        "data": rfp_structure.model_dump(),
+      }
+      for rfp_structure in rfps
+    ]
+
+  return [
+    {
+      "status": "success",
+      "message": f"RFP {rfp_structure.id} processed successfully",
       "data": rfp_structure.model_dump(),
     }
-
-  return {
-    "status": "success",
-    "message": f"RFP {rfp_structure.id} processed successfully",
-    "data": rfp_structure.model_dump(),
-  }
+    for rfp_structure in rfps
+  ]
 
 
 async def ingest_rfp(path: Path) -> list[dict]:
-  """Ingest an RFP: PDF -> Text -> Pydantic -> JSON and Neo4j."""
+  """Ingest an RFP: PDF -> Text -> Pydantic -> JSON and Neo4j.
+
+  A directory is parsed concurrently and its RFPs are saved as one batch.
+  """
   if not path.exists():
     raise FileNotFoundError(f"File not found: {path}")
 
@@ -109,17 +127,19 @@ async def ingest_rfp(path: Path) -> list[dict]:
     if not pdf_files:
       raise ValueError("Directory contains no PDF files")
 
-    results = await asyncio.gather(
-      *[_process_rfp(pdf) for pdf in pdf_files],
+    parsed = await asyncio.gather(
+      *[_parse_rfp(pdf) for pdf in pdf_files],
       return_exceptions=True,
     )
-
-    return [
-      (r if isinstance(r, dict) else {"status": "error", "message": str(r)})
-      for r in results
-    ]
-
-  if not path.suffix.lower() == ".pdf":
-    raise ValueError("Provided file is not a PDF")
-
-  return [await _process_rfp(path)]
+  else:
+    if not path.suffix.lower() == ".pdf":
+      raise ValueError("Provided file is not a PDF")
+    parsed = [await _parse_rfp(path)]
+
+  saved = iter(_save_rfps([p for p in parsed if isinstance(p, RFPStructure)]))
+  return [
+    next(saved)
+    if isinstance(p, RFPStructure)
+    else (p if isinstance(p, dict) else {"status": "error", "message": str(p)})
+    for p in parsed
+  ]
@@ -0,0 +1,67 @@
+import asyncio
+import logging
+import threading
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+from core.config import config
+from repositories.skill_repository import learn_existing_skills
+from services.ingest_cv import ingest_cv
+from services.ingest_projects import process_projects_json
+from services.ingest_rfp import ingest_rfp
+from services.job_queue import IngestJob, JobQueue, ingest_queue
+
+logger = logging.getLogger(__name__)
+
+JOB_HANDLERS: dict[str, Callable[[Path], Awaitable[object]]] = {
+  "cv": ingest_cv,
+  "rfp": ingest_rfp,
+  "projects": process_projects_json,
+}
+
+
+def run_job(job: IngestJob, runner: asyncio.Runner) -> object:
+  """Run one job; spooled uploads are deleted once handled."""
+  path = Path(job.payload["path"])
+  try:
+    return runner.run(JOB_HANDLERS[job.kind](path))
+  finally:
+    if job.payload.get("delete_after"):
+      path.unlink(missing_ok=True)
+
+
+def run_worker(stop: threading.Event, queue: JobQueue = ingest_queue) -> None:
+  """Claim and run jobs until `stop` is set, polling while the queue is empty."""
+  queue.requeue_stale(config.INGEST_JOB_TIMEOUT_SECONDS)
+  # One loop for the thread's lifetime: cached LLM clients keep connections
+  # bound to the loop they were first used on
+  with asyncio.Runner() as runner:
+    while not stop.is_set():
+      job = queue.claim()
+      if job is None:
+        stop.wait(config.INGEST_POLL_INTERVAL_SECONDS)
+        continue
+
+      logger.info("Running %s ingest job %s.", job.kind, job.id)
+      try:
+        queue.complete(job.id, run_job(job, runner))
+      except Exception as e:
+        logger.exception("Ingest job %s failed.", job.id)
+        queue.fail(job.id, str(e))
+
+
+def start_workers(count: int) -> threading.Event:
+  """Run `count` worker threads in this process; set the event to stop them."""
+  stop = threading.Event()
+  for i in range(count):
+    threading.Thread(
+      target=run_worker, args=(stop,), name=f"ingest-worker-{i}", daemon=True
+    ).start()
+  return stop
+
+
+if __name__ == "__main__":
+  # Standalone worker, so ingestion scales apart from the API processes
+  logging.basicConfig(level=logging.INFO)
+  learn_existing_skills()
+  run_worker(threading.Event())
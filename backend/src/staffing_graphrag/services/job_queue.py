@@ -0,0 +1,177 @@
+import json
+import sqlite3
+import time
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Literal
+
+from pydantic import BaseModel
+
+from core.config import config
+
+JobStatus = Literal["queued", "running", "done", "failed"]
+
+SCHEMA = """
+  CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL,
+    result TEXT,
+    error TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL
+  );
+  CREATE INDEX IF NOT EXISTS jobs_status_created ON jobs (status, created_at);
+  CREATE TABLE IF NOT EXISTS graph_version (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    store_id TEXT NOT NULL,
+    version INTEGER NOT NULL
+  );
+  INSERT OR IGNORE INTO graph_version VALUES (1, lower(hex(randomblob(4))), 0);
+"""
+
+
+class IngestJob(BaseModel):
+  id: str
+  kind: str
+  payload: dict[str, Any]
+  status: JobStatus
+  result: Any = None
+  error: str | None = None
+  attempts: int = 0
+  created_at: float
+  started_at: float | None = None
+  finished_at: float | None = None
+
+  @classmethod
+  def from_row(cls, row: sqlite3.Row) -> "IngestJob":
+    data = dict(row)
+    data["payload"] = json.loads(data["payload"])
+    data["result"] = json.loads(data["result"]) if data["result"] else None
+    return cls(**data)
+
+
+class JobQueue:
+  """Durable FIFO of ingestion jobs in a local SQLite file.
+
+  API processes enqueue and ingest workers claim, possibly from other
+  processes on the same host; SQLite's write lock makes a claim atomic.
+
+  The file also holds the graph version, so that a write in any of those
+  processes reaches the caches of all of them.
+  """
+
+  def __init__(self, path: Path) -> None:
+    self.path = path
+    self._initialized = False
+
+  @contextmanager
+  def _connect(self) -> Iterator[sqlite3.Connection]:
+    # A connection per call: sqlite3 connections must not cross threads
+    if not self._initialized:
+      self.path.parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+    connection.row_factory = sqlite3.Row
+    try:
+      if not self._initialized:
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.executescript(SCHEMA)
+        self._initialized = True
+      yield connection
+    finally:
+      connection.close()
+
+  def enqueue(self, kind: str, payload: dict[str, Any]) -> IngestJob:
+    job = IngestJob(
+      id=uuid.uuid4().hex,
+      kind=kind,
+      payload=payload,
+      status="queued",
+      created_at=time.time(),
+    )
+    with self._connect() as connection:
+      connection.execute(
+        "INSERT INTO jobs (id, kind, payload, status, created_at) "
+        "VALUES (?, ?, ?, ?, ?)",
+        (job.id, job.kind, json.dumps(job.payload), job.status, job.created_at),
+      )
+    return job
+
+  def claim(self) -> IngestJob | None:
+    """Mark the oldest queued job running and return it, or None if idle."""
+    with self._connect() as connection:
+      connection.execute("BEGIN IMMEDIATE")
+      try:
+        row = connection.execute(
+          "SELECT * FROM jobs WHERE status = 'queued' ORDER BY created_at LIMIT 1"
+        ).fetchone()
+        if row is None:
+          connection.execute("COMMIT")
+          return None
+        connection.execute(
+          "UPDATE jobs SET status = 'running', started_at = ?, "
+          "attempts = attempts + 1 WHERE id = ?",
+          (time.time(), row["id"]),
+        )
+        connection.execute("COMMIT")
+      except Exception:
+        connection.execute("ROLLBACK")
+        raise
+    return self.get(row["id"])
+
+  def complete(self, job_id: str, result: object) -> None:
+    self._finish(job_id, "done", result=json.dumps(result, default=str))
+
+  def fail(self, job_id: str, error: str) -> None:
+    self._finish(job_id, "failed", error=error)
+
+  def _finish(
+    self,
+    job_id: str,
+    status: JobStatus,
+    result: str | None = None,
+    error: str | None = None,
+  ) -> None:
+    with self._connect() as connection:
+      connection.execute(
+        "UPDATE jobs SET status = ?, result = ?, error = ?, finished_at = ? "
+        "WHERE id = ?",
+        (status, result, error, time.time(), job_id),
+      )
+
+  def requeue_stale(self, timeout_seconds: float) -> int:
+    """Put back jobs left running longer than the timeout, e.g. by a dead worker."""
+    with self._connect() as connection:
+      cursor = connection.execute(
+        "UPDATE jobs SET status = 'queued' WHERE status = 'running' AND started_at < ?",
+        (time.time() - timeout_seconds,),
+      )
+      return cursor.rowcount
+
+  def graph_version(self) -> str:
+    with self._connect() as connection:
+      row = connection.execute(
+        "SELECT store_id, version FROM graph_version WHERE id = 1"
+      ).fetchone()
+    return f"{row['store_id']}-{row['version']}"
+
+  def bump_graph_version(self) -> str:
+    with self._connect() as connection:
+      row = connection.execute(
+        "UPDATE graph_version SET version = version + 1 WHERE id = 1 "
+        "RETURNING store_id, version"
+      ).fetchone()
+    return f"{row['store_id']}-{row['version']}"
+
+  def get(self, job_id: str) -> IngestJob | None:
+    with self._connect() as connection:
+      row = connection.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+    return IngestJob.from_row(row) if row else None
+
+
+ingest_queue = JobQueue(config.INGEST_QUEUE_PATH)
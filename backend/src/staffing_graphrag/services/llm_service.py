@@ -0,0 +1,26 @@
+from functools import lru_cache
+
+from langchain_core.language_models import BaseChatModel
+from result import Ok, Result
+
+from core.config import config
+from core.instrumentation import LLMTimingCallback
+from services.fake_llm_service import FakeChatModel
+from services.openai_service import get_openai_chat
+
+
+@lru_cache(maxsize=1)
+def _get_fake_chat() -> FakeChatModel:
+  return FakeChatModel(
+    latency_ms=config.FAKE_LLM_LATENCY_MS, callbacks=[LLMTimingCallback("fake")]
+  )
+
+
+def get_chat_model(
+  model_name: str = config.OPENAI_DEFAULT_MODEL,
+  temperature: float = config.OPENAI_DEFAULT_TEMPERATURE,
+) -> Result[BaseChatModel, str]:
+  """Return the chat model of the backend selected by LLM_BACKEND."""
+  if config.LLM_BACKEND == "fake":
+    return Ok(_get_fake_chat())
+  return get_openai_chat(model_name, temperature)
@@ -1,14 +1,43 @@
 from functools import lru_cache
+from typing import Any
 
 from langchain_neo4j import Neo4jGraph
+from neo4j import Driver, GraphDatabase, Session
 
 from core.config import config
+from core.instrumentation import span
+
+
+class InstrumentedNeo4jGraph(Neo4jGraph):
+  """Neo4jGraph that records every query as a `neo4j` span."""
+
+  def query(self, *args: object, **kwargs: object) -> list[dict[str, Any]]:
+    with span("neo4j", "graph.query"):
+      return super().query(*args, **kwargs)
+
+
+def _neo4j_password() -> str | None:
+  return config.NEO4J_PASSWORD.get_secret_value() if config.NEO4J_PASSWORD else None
 
 
 @lru_cache(maxsize=1)
 def get_neo4j_graph() -> Neo4jGraph:
-  password = config.NEO4J_PASSWORD.get_secret_value() if config.NEO4J_PASSWORD else None
+  return InstrumentedNeo4jGraph(
+    url=config.NEO4J_URI, username=config.NEO4J_USERNAME, password=_neo4j_password()
+  )
 
-  return Neo4jGraph(
-    url=config.NEO4J_URI, username=config.NEO4J_USERNAME, password=password
+
+@lru_cache(maxsize=1)
+def _get_neo4j_driver() -> Driver:
+  return GraphDatabase.driver(
+    config.NEO4J_URI, auth=(config.NEO4J_USERNAME, _neo4j_password())
   )
+
+
+def get_neo4j_session() -> Session:
+  """Open a session on the default database.
+
+  For queries that need explicit transactions, transaction config or result
+  summaries, which Neo4jGraph.query does not expose.
+  """
+  return _get_neo4j_driver().session()
@@ -1,24 +1,48 @@
+import threading
 from functools import lru_cache
+from typing import TYPE_CHECKING
 
-from langchain_openai import ChatOpenAI
 from pydantic import SecretStr
 from result import Err, Ok, Result
 
 from core.config import config
+from core.instrumentation import LLMTimingCallback
 
+if TYPE_CHECKING:
+  from langchain_openai import ChatOpenAI
 
-@lru_cache(maxsize=1)
-def get_openai_chat(
-  model_name: str = config.OPENAI_DEFAULT_MODEL,
-  temperature: float = config.OPENAI_DEFAULT_TEMPERATURE,
-) -> Result[ChatOpenAI, str]:
+
+@lru_cache(maxsize=32)
+def _get_openai_chat(
+  model_name: str, temperature: float, _thread_id: int
+) -> Result["ChatOpenAI", str]:
   if not config.OPENAI_API_KEY:
     return Err("OpenAI api key is missing.")
 
+  # Deferred: langchain_openai pulls in openai and tiktoken, which workers that
+  # never call the LLM should not load at boot
+  import httpx  # noqa: PLC0415
+  from langchain_openai import ChatOpenAI  # noqa: PLC0415
+
   return Ok(
     ChatOpenAI(
       model=model_name,
       temperature=temperature,
       api_key=SecretStr(config.OPENAI_API_KEY.get_secret_value()),
+      callbacks=[LLMTimingCallback(model_name)],
+      # Not langchain_openai's process-wide default client, see get_openai_chat
+      http_async_client=httpx.AsyncClient(),
     )
   )
+
+
+def get_openai_chat(
+  model_name: str = config.OPENAI_DEFAULT_MODEL,
+  temperature: float = config.OPENAI_DEFAULT_TEMPERATURE,
+) -> Result["ChatOpenAI", str]:
+  """Chat model cached per thread.
+
+  Its async HTTP client keeps connections bound to the event loop that opened
+  them, and each ingest worker thread runs its own loop beside the server's.
+  """
+  return _get_openai_chat(model_name, temperature, threading.get_ident())
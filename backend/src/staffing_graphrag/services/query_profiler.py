@@ -0,0 +1,124 @@
+import logging
+import threading
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from typing import Any
+
+from core.config import config
+from core.instrumentation import span
+from services.neo4j_service import get_neo4j_graph, get_neo4j_session
+
+logger = logging.getLogger(__name__)
+
+# Operators that usually mean a missing index or a plan that buffers everything
+SUSPICIOUS_OPERATORS = ("AllNodesScan", "NodeByLabelScan", "Eager", "CartesianProduct")
+
+
+def walk_plan(plan: dict[str, Any]) -> Iterator[dict[str, Any]]:
+  """Yield every operator of an EXPLAIN/PROFILE plan, depth first."""
+  yield plan
+  for child in plan.get("children", []):
+    yield from walk_plan(child)
+
+
+def summarize_profile(profile: dict[str, Any]) -> dict[str, Any]:
+  """Flatten a PROFILE plan into totals, per-operator stats and plan warnings."""
+  operators = [
+    {
+      "operator": op.get("operatorType", ""),
+      "details": op.get("args", {}).get("Details"),
+      "db_hits": op.get("dbHits", 0),
+      "rows": op.get("rows", 0),
+      "estimated_rows": op.get("args", {}).get("EstimatedRows"),
+      "page_cache_hits": op.get("pageCacheHits", 0),
+      "page_cache_misses": op.get("pageCacheMisses", 0),
+    }
+    for op in walk_plan(profile)
+  ]
+
+  warnings = sorted(
+    {
+      kind
+      for op in operators
+      for kind in SUSPICIOUS_OPERATORS
+      if op["operator"].startswith(kind)
+    }
+  )
+
+  return {
+    "db_hits": sum(op["db_hits"] for op in operators),
+    "page_cache_hits": sum(op["page_cache_hits"] for op in operators),
+    "page_cache_misses": sum(op["page_cache_misses"] for op in operators),
+    "warnings": warnings,
+    "operators": operators,
+  }
+
+
+class ProfileStore:
+  """Latest PROFILE summary per repository query name."""
+
+  def __init__(self) -> None:
+    self._profiles: dict[str, dict[str, Any]] = {}
+    self._lock = threading.Lock()
+
+  def record(self, name: str, profile: dict[str, Any]) -> None:
+    with self._lock:
+      self._profiles[name] = profile
+
+  def get(self, name: str) -> dict[str, Any] | None:
+    with self._lock:
+      return self._profiles.get(name)
+
+  def all(self) -> dict[str, dict[str, Any]]:
+    with self._lock:
+      return dict(self._profiles)
+
+  def clear(self) -> None:
+    with self._lock:
+      self._profiles.clear()
+
+
+profile_store = ProfileStore()
+
+
+def _profile_query(
+  name: str, cypher: str, params: dict[str, Any]
+) -> list[dict[str, Any]]:
+  with span("neo4j", "graph.profile"), get_neo4j_session() as session:
+    result = session.run(f"PROFILE {cypher}", params)
+    rows = [record.data() for record in result]
+    summary = result.consume()
+
+  profile = summarize_profile(summary.profile or {})
+  profile_store.record(
+    name,
+    {
+      "name": name,
+      "profiled_at": datetime.now(UTC).isoformat(),
+      "params": params,
+      "result_rows": len(rows),
+      "elapsed_ms": (summary.result_available_after or 0)
+      + (summary.result_consumed_after or 0),
+      **profile,
+    },
+  )
+  if profile["warnings"]:
+    logger.info("Query %s plan contains %s.", name, ", ".join(profile["warnings"]))
+  return rows
+
+
+def run_query(
+  name: str, cypher: str, params: dict[str, Any] | None = None
+) -> list[dict[str, Any]]:
+  """Run a named repository query, under PROFILE when QUERY_PROFILING_ENABLED.
+
+  Profiling failures never fail the caller; the query is re-run without it.
+  """
+  params = params or {}
+  if config.QUERY_PROFILING_ENABLED:
+    try:
+      return _profile_query(name, cypher, params)
+    except Exception:
+      logger.exception("Profiling query %s failed, running it unprofiled.", name)
+
+  return get_neo4j_graph().query(cypher, params=params)
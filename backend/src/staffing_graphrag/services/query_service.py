@@ -1,12 +1,18 @@
+import asyncio
 import logging
+from collections.abc import AsyncIterator
 from typing import Any
 
 from langchain_neo4j import GraphCypherQAChain
+from langchain_neo4j.chains.graph_qa.cypher import extract_cypher
 
-from core import prompts
+from core import constants, prompts
 from core.config import config
+from services.cypher_cache import cypher_cache
+from services.cypher_guard import CypherRejectedError, cap_context, run_guarded_cypher
+from services.direct_answer import render_direct_answer
+from services.llm_service import get_chat_model
 from services.neo4j_service import get_neo4j_graph
-from services.openai_service import get_openai_chat
 
 logger = logging.getLogger(__name__)
 
@@ -14,7 +20,7 @@ logger = logging.getLogger(__name__)
 def _get_qa_chain() -> GraphCypherQAChain:
   graph = get_neo4j_graph()
 
-  openai_chat_resulta = get_openai_chat(config.OPENAI_GRAPH_QUERY_MODEL)
+  openai_chat_resulta = get_chat_model(config.OPENAI_GRAPH_QUERY_MODEL)
   if openai_chat_resulta.err():
     assert False  # TODO: propagate further # noqa: B011, PT015, S101, RUF100
 
@@ -27,37 +33,130 @@ def _get_qa_chain() -> GraphCypherQAChain:
     return_intermediate_steps=True,
     allow_dangerous_requests=True,
     validate_cypher=True,
+    exclude_types=constants.DERIVED_RELATIONSHIPS,
   )
 
 
-async def process_query(question: str) -> dict[str, Any]:
-  """Execute a natural language query against the Knowledge Graph."""
+async def _generate_cypher(chain: GraphCypherQAChain, question: str) -> str:
+  """Run only the question -> Cypher step of the chain."""
+  generated = await chain.cypher_generation_chain.ainvoke(
+    {"question": question, "schema": chain.graph_schema}
+  )
+  cypher_query = extract_cypher(generated)
+  if chain.cypher_query_corrector:
+    cypher_query = chain.cypher_query_corrector(cypher_query)
+  return cypher_query
+
+
+async def _run_cypher(cypher_query: str) -> list[dict]:
+  _, rows = await asyncio.to_thread(run_guarded_cypher, cypher_query)
+  return rows
+
+
+async def stream_query(
+  question: str, full_answer: bool = False
+) -> AsyncIterator[dict[str, Any]]:
+  """Execute a natural language query, yielding progress events as they happen.
+
+  Runs the GraphCypherQAChain steps explicitly:
+  1. Generate Cypher, or reuse the cached Cypher for this question and schema.
+  2. Check it with the query guard and execute it against the current graph
+     data, bounded by a LIMIT, a transaction timeout and a row cap.
+  3. Render small, structured results from a template, unless `full_answer`
+     is requested or direct answers are disabled; otherwise stream the answer
+     synthesized with the QA prompt, capped to QA_CONTEXT_MAX_BYTES of rows.
+
+  Events: `cypher`, `rows`, one or more `token`, then `done`. Generated Cypher
+  refused by the guard ends with `rejected`; failures end with `error`.
+  """
   try:
     chain = _get_qa_chain()
+    cache_key = cypher_cache.make_key(question, chain.graph_schema)
+
+    cypher_query = cypher_cache.get(cache_key) if config.CYPHER_CACHE_ENABLED else None
+    rows: list[dict] | None = None
+    if cypher_query is not None:
+      yield {"event": "cypher", "cypher_query": cypher_query, "cached": True}
+      try:
+        rows = await _run_cypher(cypher_query)
+      except Exception:
+        logger.warning("Cached Cypher failed, regenerating it.", exc_info=True)
+        cypher_cache.invalidate(cache_key)
 
-    result: dict[str, Any] = await chain.ainvoke({"query": question})
+    if rows is None:
+      cypher_query = await _generate_cypher(chain, question)
+      yield {"event": "cypher", "cypher_query": cypher_query, "cached": False}
+      try:
+        rows = await _run_cypher(cypher_query)
+      except CypherRejectedError as e:
+        logger.warning("Generated Cypher rejected: %s", e)
+        yield {"event": "rejected", "cypher_query": cypher_query, "reason": str(e)}
+        return
+      if config.CYPHER_CACHE_ENABLED:
+        cypher_cache.set(cache_key, cypher_query)
 
-    # Extract intermediate step (the actual Cypher query generated)
-    cypher_query = ""
-    steps = result.get("intermediate_steps", [])
-    if steps and isinstance(steps[0], dict):
-      cypher_query = steps[0].get("query", "")
+    yield {"event": "rows", "row_count": len(rows)}
 
-    return {
-      "question": question,
-      "answer": result.get("result", "No answer generated"),
-      "cypher_query": cypher_query,
-      "success": True,
-    }
+    answer = None
+    if config.QUERY_DIRECT_ANSWER_ENABLED and not full_answer:
+      answer = render_direct_answer(rows)
+
+    if answer is not None:
+      yield {"event": "token", "token": answer}
+    else:
+      async for token in chain.qa_chain.astream(
+        {"question": question, "context": cap_context(rows[: chain.top_k])}
+      ):
+        if token:
+          yield {"event": "token", "token": token}
+
+    yield {"event": "done", "direct_answer": answer is not None}
 
   except Exception as e:
     logger.exception("Graph QA failed.")
-    return {
-      "question": question,
-      "answer": "I encountered an error processing your query.",
-      "error": str(e),
-      "success": False,
-    }
+    yield {"event": "error", "error": str(e)}
+
+
+async def process_query(question: str, full_answer: bool = False) -> dict[str, Any]:
+  """Execute a natural language query against the Knowledge Graph.
+
+  Collects the events of `stream_query` into a single response.
+  """
+  response: dict[str, Any] = {
+    "question": question,
+    "answer": "",
+    "cypher_query": "",
+    "direct_answer": False,
+    "success": False,
+  }
+
+  async for event in stream_query(question, full_answer):
+    match event["event"]:
+      case "cypher":
+        response["cypher_query"] = event["cypher_query"]
+      case "token":
+        response["answer"] += event["token"]
+      case "done":
+        response["direct_answer"] = event["direct_answer"]
+        response["success"] = True
+      case "rejected":
+        return {
+          "question": question,
+          "answer": "The generated query was rejected by the query guard.",
+          "cypher_query": event["cypher_query"],
+          "error": event["reason"],
+          "success": False,
+        }
+      case "error":
+        return {
+          "question": question,
+          "answer": "I encountered an error processing your query.",
+          "error": event["error"],
+          "success": False,
+        }
+
+  response["answer"] = response["answer"] or "No answer generated"
+  return response
 
 
 def get_example_queries_list() -> dict[str, list[str]]:
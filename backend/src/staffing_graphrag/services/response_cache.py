@@ -0,0 +1,41 @@
+import threading
+from collections import OrderedDict
+
+from core.config import config
+
+
+class ResponseCache:
+  """Bounded LRU of serialized response bodies, each tagged with its ETag.
+
+  An entry only hits while the graph version it was rendered at is current;
+  stale entries are simply overwritten or evicted.
+  """
+
+  def __init__(self, max_size: int) -> None:
+    self._max_size = max_size
+    self._entries: OrderedDict[str, tuple[str, bytes]] = OrderedDict()
+    self._lock = threading.Lock()
+
+  def get(self, key: str, etag: str) -> bytes | None:
+    with self._lock:
+      entry = self._entries.get(key)
+      if entry is None or entry[0] != etag:
+        return None
+      self._entries.move_to_end(key)
+      return entry[1]
+
+  def set(self, key: str, etag: str, body: bytes) -> None:
+    if self._max_size <= 0:
+      return
+    with self._lock:
+      self._entries[key] = (etag, body)
+      self._entries.move_to_end(key)
+      while len(self._entries) > self._max_size:
+        self._entries.popitem(last=False)
+
+  def clear(self) -> None:
+    with self._lock:
+      self._entries.clear()
+
+
+response_cache = ResponseCache(config.RESPONSE_CACHE_MAX_SIZE)
@@ -1,99 +1,356 @@
+import asyncio
+import importlib.util
+import json
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterator
+from functools import lru_cache
+from typing import Any
+
 import httpx
+import streamlit as st
 
-from config import API_BASE_URL
+from config import API_BASE_URL, INGEST_API_BASE_URL
 
-TIMEOUT = 60.0  # PDF processing can take time
+# Per-endpoint timeouts: listings should fail fast, LLM and PDF work may not
+READ_TIMEOUT = httpx.Timeout(15.0, connect=3.0)
+MATCH_TIMEOUT = httpx.Timeout(30.0, connect=3.0)
+QUERY_TIMEOUT = httpx.Timeout(90.0, connect=3.0)
+UPLOAD_TIMEOUT = httpx.Timeout(180.0, connect=3.0)  # PDF processing can take time
 
+PAGE_SIZE = 25
 
-def get_programmers(status: str | None = None) -> list[dict]:
-  params = {"status": status} if status else {}
-  with httpx.Client(timeout=TIMEOUT) as client:
-    response = client.get(f"{API_BASE_URL}/entities/programmers", params=params)
-    response.raise_for_status()
-    return response.json()
+# How long an upload the backend queued (202) is polled before giving up
+INGEST_JOB_WAIT_SECONDS = 600
+INGEST_JOB_POLL_SECONDS = 1.0
 
+RETRY_ATTEMPTS = 3
+RETRY_BACKOFF_SECONDS = 0.25
+RETRY_STATUS_CODES = {502, 503, 504}
 
-def get_projects() -> list[dict]:
-  with httpx.Client(timeout=TIMEOUT) as client:
-    response = client.get(f"{API_BASE_URL}/entities/projects")
-    response.raise_for_status()
-    return response.json()
+# Client-side cache TTLs; writes made through this module invalidate earlier
+ENTITY_TTL_SECONDS = 60
+STATS_TTL_SECONDS = 30
+MATCH_TTL_SECONDS = 30
+EXAMPLES_TTL_SECONDS = 3600
+ETAG_CACHE_MAX_SIZE = 256
 
+# HTTP/2 needs the optional h2 package; fall back to HTTP/1.1 keep-alive without it
+HTTP2 = importlib.util.find_spec("h2") is not None
+LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10)
 
-def get_rfps() -> list[dict]:
-  with httpx.Client(timeout=TIMEOUT) as client:
-    response = client.get(f"{API_BASE_URL}/entities/rfps")
-    response.raise_for_status()
-    return response.json()
 
+@lru_cache(maxsize=1)
+def _get_client() -> httpx.Client:
+  """Process-wide client, so Streamlit reruns and sessions share its pool."""
+  return httpx.Client(
+    base_url=API_BASE_URL, http2=HTTP2, limits=LIMITS, timeout=READ_TIMEOUT
+  )
 
-def upload_cv(filename: str, content: bytes) -> dict:
-  with httpx.Client(timeout=TIMEOUT) as client:
-    files = {"file": (filename, content, "application/pdf")}
-    response = client.post(f"{API_BASE_URL}/ingest/cv/upload", files=files)
-    response.raise_for_status()
-    return response.json()
 
+class _ETagCache:
+  """Last body seen per URL with its ETag, for If-None-Match revalidation."""
 
-def upload_rfp(filename: str, content: bytes) -> dict:
-  with httpx.Client(timeout=TIMEOUT) as client:
-    files = {"file": (filename, content, "application/pdf")}
-    response = client.post(f"{API_BASE_URL}/ingest/rfp/upload", files=files)
-    response.raise_for_status()
-    return response.json()
+  def __init__(self, max_size: int) -> None:
+    self._max_size = max_size
+    self._entries: OrderedDict[str, tuple[str, Any]] = OrderedDict()
+    self._lock = threading.Lock()
 
+  def get(self, key: str) -> tuple[str, Any] | None:
+    with self._lock:
+      entry = self._entries.get(key)
+      if entry is not None:
+        self._entries.move_to_end(key)
+      return entry
 
-def upload_projects(filename: str, content: bytes) -> dict:
-  with httpx.Client(timeout=TIMEOUT) as client:
-    files = {"file": (filename, content, "application/json")}
-    response = client.post(f"{API_BASE_URL}/ingest/projects/upload", files=files)
-    response.raise_for_status()
-    return response.json()
+  def set(self, key: str, etag: str, body: Any) -> None:
+    with self._lock:
+      self._entries[key] = (etag, body)
+      self._entries.move_to_end(key)
+      while len(self._entries) > self._max_size:
+        self._entries.popitem(last=False)
 
 
-def get_graph_stats() -> dict:
-  with httpx.Client(timeout=TIMEOUT) as client:
-    response = client.get(f"{API_BASE_URL}/info/stats")
-    response.raise_for_status()
-    return response.json()
+_etag_cache = _ETagCache(ETAG_CACHE_MAX_SIZE)
+
+
+def _get(
+  path: str, params: dict | None = None, timeout: httpx.Timeout = READ_TIMEOUT
+) -> Any:
+  """GET with retry and exponential backoff on transport errors and 502/503/504.
+
+  Responses carrying an ETag are revalidated with If-None-Match next time, so
+  an unchanged resource comes back as an empty 304.
+  """
+  client = _get_client()
+  key = str(client.build_request("GET", path, params=params).url)
+  cached = _etag_cache.get(key)
+  headers = {"If-None-Match": cached[0]} if cached else {}
+
+  for attempt in range(RETRY_ATTEMPTS):
+    try:
+      response = client.get(path, params=params, headers=headers, timeout=timeout)
+      if response.status_code not in RETRY_STATUS_CODES:
+        break
+    except httpx.TransportError:
+      if attempt == RETRY_ATTEMPTS - 1:
+        raise
+    if attempt < RETRY_ATTEMPTS - 1:
+      time.sleep(RETRY_BACKOFF_SECONDS * 2**attempt)
+
+  if response.status_code == httpx.codes.NOT_MODIFIED and cached:
+    return cached[1]
+  response.raise_for_status()
+  body = response.json()
+  if etag := response.headers.get("ETag"):
+    _etag_cache.set(key, etag, body)
+  return body
+
+
+def _post(path: str, timeout: httpx.Timeout, **kwargs: Any) -> Any:
+  """POST without retries, since it is not idempotent."""
+  response = _get_client().post(path, timeout=timeout, **kwargs)
+  response.raise_for_status()
+  return response.json()
+
+
+def _page_params(**params: object) -> dict:
+  return {key: value for key, value in params.items() if value not in (None, "")}
+
+
+@st.cache_data(ttl=ENTITY_TTL_SECONDS, show_spinner=False)
+def get_programmers(
+  status: str | None = None,
+  skill: str | None = None,
+  location: str | None = None,
+  cursor: str | None = None,
+  limit: int = PAGE_SIZE,
+) -> dict:
+  """Fetch one page of programmers: `{"items": [...], "next_cursor": ...}`."""
+  params = _page_params(
+    status=status, skill=skill, location=location, cursor=cursor, limit=limit
+  )
+  return _get("/entities/programmers", params)
+
+
+@st.cache_data(ttl=ENTITY_TTL_SECONDS, show_spinner=False)
+def get_projects(
+  status: str | None = None,
+  client_name: str | None = None,
+  skill: str | None = None,
+  cursor: str | None = None,
+  limit: int = PAGE_SIZE,
+) -> dict:
+  """Fetch one page of projects: `{"items": [...], "next_cursor": ...}`."""
+  params = _page_params(
+    status=status, client=client_name, skill=skill, cursor=cursor, limit=limit
+  )
+  return _get("/entities/projects", params)
+
+
+@st.cache_data(ttl=ENTITY_TTL_SECONDS, show_spinner=False)
+def get_rfps(
+  client_name: str | None = None,
+  skill: str | None = None,
+  cursor: str | None = None,
+  limit: int = PAGE_SIZE,
+) -> dict:
+  """Fetch one page of RFPs: `{"items": [...], "next_cursor": ...}`."""
+  params = _page_params(client=client_name, skill=skill, cursor=cursor, limit=limit)
+  return _get("/entities/rfps", params)
+
+
+def invalidate_graph_caches() -> None:
+  """Drop every cached read derived from the graph, after a write through this client."""
+  for cached in (
+    get_programmers,
+    get_projects,
+    get_rfps,
+    get_graph_stats,
+    _get_node_samples,
+    find_matches,
+  ):
+    cached.clear()
+
+
+class IngestJobError(RuntimeError):
+  """A queued ingestion failed, or did not finish while we waited."""
+
+
+def get_ingest_job(job_id: str) -> dict:
+  """Status of an upload the backend queued (202) instead of ingesting inline."""
+  response = _get_client().get(f"{INGEST_API_BASE_URL}/ingest/jobs/{job_id}")
+  response.raise_for_status()
+  return response.json()
+
 
+def _wait_for_ingest_job(job_id: str) -> dict:
+  deadline = time.monotonic() + INGEST_JOB_WAIT_SECONDS
+  while True:
+    job = get_ingest_job(job_id)
+    if job["status"] in ("done", "failed"):
+      return job
+    if time.monotonic() > deadline:
+      raise IngestJobError(f"Ingest job {job_id} is still {job['status']}.")
+    time.sleep(INGEST_JOB_POLL_SECONDS)
 
-def get_node_sample(label: str) -> list[dict]:
-  with httpx.Client(timeout=TIMEOUT) as client:
-    response = client.get(f"{API_BASE_URL}/info/sample", params={"label": label})
+
+def _upload(path: str, files: dict) -> Any:
+  """POST an upload; a queued one is polled until the worker has written it."""
+  response = _get_client().post(
+    f"{INGEST_API_BASE_URL}{path}", files=files, timeout=UPLOAD_TIMEOUT
+  )
+  if response.status_code != httpx.codes.ACCEPTED:
+    invalidate_graph_caches()
     response.raise_for_status()
     return response.json()
 
+  job = _wait_for_ingest_job(response.json()["id"])
+  # Only now has the graph changed, so earlier invalidation would re-cache stale data
+  invalidate_graph_caches()
+  if job["status"] == "failed":
+    raise IngestJobError(job["error"] or f"Ingest job {job['id']} failed.")
+  return job["result"]
+
+
+def upload_cv(filename: str, content: bytes) -> Any:
+  return _upload("/ingest/cv/upload", {"file": (filename, content, "application/pdf")})
+
+
+def upload_rfp(filename: str, content: bytes) -> Any:
+  return _upload("/ingest/rfp/upload", {"file": (filename, content, "application/pdf")})
+
+
+def upload_projects(filename: str, content: bytes) -> Any:
+  return _upload(
+    "/ingest/projects/upload", {"file": (filename, content, "application/json")}
+  )
+
+
+@st.cache_data(ttl=STATS_TTL_SECONDS, show_spinner=False)
+def get_graph_stats() -> dict:
+  return _get("/info/stats")
 
-def query_knowledge_graph(question: str) -> dict:
-  with httpx.Client(timeout=TIMEOUT) as client:
-    response = client.post(f"{API_BASE_URL}/query/", json={"question": question})
+
+def stream_query(question: str, full_answer: bool = False) -> Iterator[dict]:
+  """Yield the Server-Sent Events of a streaming query as `{"event": ..., **data}`.
+
+  `full_answer` asks for the LLM-written answer even when the backend could
+  render the rows directly.
+  """
+  with _get_client().stream(
+    "POST",
+    "/query/stream",
+    json={"question": question, "full_answer": full_answer},
+    timeout=QUERY_TIMEOUT,
+  ) as response:
+    if response.is_error:
+      # Read the error body, or the caller cannot access e.response.json()
+      response.read()
     response.raise_for_status()
-    return response.json()
+    event_name = "message"
+    for line in response.iter_lines():
+      if line.startswith("event:"):
+        event_name = line.removeprefix("event:").strip()
+      elif line.startswith("data:"):
+        data = json.loads(line.removeprefix("data:").strip())
+        yield {"event": event_name, **data}
+        event_name = "message"
 
 
+@st.cache_data(ttl=EXAMPLES_TTL_SECONDS, show_spinner=False)
 def get_example_queries() -> dict[str, list[str]]:
-  with httpx.Client(timeout=TIMEOUT) as client:
-    response = client.get(f"{API_BASE_URL}/query/examples")
-    response.raise_for_status()
-    return response.json()
+  return _get("/query/examples")
 
 
+@st.cache_data(ttl=MATCH_TTL_SECONDS, show_spinner=False)
 def find_matches(rfp_id: str, threshold_months: int = 1) -> dict:
-  with httpx.Client(timeout=TIMEOUT) as client:
-    response = client.get(
-      f"{API_BASE_URL}/match/{rfp_id}",
-      params={"threshold_months": threshold_months},
-    )
-    response.raise_for_status()
-    return response.json()
+  return _get(f"/match/{rfp_id}", {"threshold_months": threshold_months}, MATCH_TIMEOUT)
 
 
 def confirm_assignment(rfp_id: str, programmer_ids: list[str]) -> dict:
-  with httpx.Client(timeout=TIMEOUT) as client:
-    response = client.post(
-      f"{API_BASE_URL}/match/{rfp_id}/confirm",
+  try:
+    return _post(
+      f"/match/{rfp_id}/confirm",
+      MATCH_TIMEOUT,
       json={"programmer_ids": programmer_ids},
     )
-    response.raise_for_status()
-    return response.json()
+  finally:
+    invalidate_graph_caches()
+
+
+# Async variant. An AsyncClient is bound to the event loop it was created on and
+# Streamlit runs each rerun without one, so each batch gets its own client.
+
+
+def _async_client() -> httpx.AsyncClient:
+  return httpx.AsyncClient(
+    base_url=API_BASE_URL, http2=HTTP2, limits=LIMITS, timeout=READ_TIMEOUT
+  )
+
+
+async def _aget(
+  client: httpx.AsyncClient,
+  path: str,
+  params: dict | None = None,
+  timeout: httpx.Timeout = READ_TIMEOUT,
+) -> Any:
+  """Async counterpart of `_get`, with the same retry policy and ETag cache."""
+  key = str(client.build_request("GET", path, params=params).url)
+  cached = _etag_cache.get(key)
+  headers = {"If-None-Match": cached[0]} if cached else {}
+
+  for attempt in range(RETRY_ATTEMPTS):
+    try:
+      response = await client.get(path, params=params, headers=headers, timeout=timeout)
+      if response.status_code not in RETRY_STATUS_CODES:
+        break
+    except httpx.TransportError:
+      if attempt == RETRY_ATTEMPTS - 1:
+        raise
+    if attempt < RETRY_ATTEMPTS - 1:
+      await asyncio.sleep(RETRY_BACKOFF_SECONDS * 2**attempt)
+
+  if response.status_code == httpx.codes.NOT_MODIFIED and cached:
+    return cached[1]
+  response.raise_for_status()
+  body = response.json()
+  if etag := response.headers.get("ETag"):
+    _etag_cache.set(key, etag, body)
+  return body
+
+
+async def aget_node_sample(client: httpx.AsyncClient, label: str) -> list[dict]:
+  return await _aget(client, "/info/sample", {"label": label})
+
+
+class _PartialSamples(Exception):
+  """Raised past st.cache_data so a batch with failed labels is not cached."""
+
+  def __init__(self, results: dict[str, list[dict] | BaseException]) -> None:
+    super().__init__("Some node samples could not be fetched.")
+    self.results = results
+
+
+@st.cache_data(ttl=ENTITY_TTL_SECONDS, show_spinner=False)
+def _get_node_samples(labels: tuple[str, ...]) -> dict[str, list[dict]]:
+  async def fetch_all() -> list[list[dict] | BaseException]:
+    async with _async_client() as client:
+      return await asyncio.gather(
+        *(aget_node_sample(client, label) for label in labels),
+        return_exceptions=True,
+      )
+
+  results = dict(zip(labels, asyncio.run(fetch_all()), strict=True))
+  if any(isinstance(result, BaseException) for result in results.values()):
+    raise _PartialSamples(results)
+  return results  # type: ignore[return-value]
+
+
+def get_node_samples(labels: list[str]) -> dict[str, list[dict] | BaseException]:
+  """Fetch samples for several labels concurrently; failures are returned per label."""
+  try:
+    return _get_node_samples(tuple(labels))
+  except _PartialSamples as e:
+    return e.results
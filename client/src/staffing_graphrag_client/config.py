@@ -5,3 +5,5 @@ from dotenv import load_dotenv
 load_dotenv()
 
 API_BASE_URL = f"http://localhost:{os.getenv('SERVER_PORT', '8032')}/api/v1"
+# Ingestion may be served by separate replicas (backend SERVER_ROLE=ingest)
+INGEST_API_BASE_URL = os.getenv("INGEST_API_BASE_URL", API_BASE_URL)
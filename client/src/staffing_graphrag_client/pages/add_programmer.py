@@ -1,7 +1,7 @@
 import httpx
 import streamlit as st
 
-from api.client import upload_cv
+from api.client import IngestJobError, upload_cv
 from utils.utils import set_backgroud
 
 
@@ -38,6 +38,8 @@ def render():
           st.code(detail)
         except httpx.RequestError as e:
           st.error(f"Connection error: {e}")
+        except IngestJobError as e:
+          st.error(f"Ingestion failed: {e}")
 
 
 render()
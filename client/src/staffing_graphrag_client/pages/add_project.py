@@ -1,7 +1,7 @@
 import httpx
 import streamlit as st
 
-from api.client import upload_projects
+from api.client import IngestJobError, upload_projects
 from utils.utils import set_backgroud
 
 
@@ -47,6 +47,8 @@ def render():
           st.code(detail)
         except httpx.RequestError as e:
           st.error(f"Connection error: {e}")
+        except IngestJobError as e:
+          st.error(f"Ingestion failed: {e}")
 
 
 render()
@@ -2,7 +2,7 @@ import httpx
 import streamlit as st
 
 from api.client import confirm_assignment, find_matches, get_rfps
-from utils.utils import set_backgroud
+from utils.utils import page_cursor, render_pager, set_backgroud
 
 if "matching_rfp" not in st.session_state:
   st.session_state.matching_rfp = None
@@ -57,8 +57,9 @@ def render_rfp_selection():
   """Show list of RFPs to select from."""
   st.markdown("Select an RFP to find matching programmers.")
 
+  cursor = page_cursor("matching_rfps", ())
   try:
-    rfps = get_rfps()
+    page = get_rfps(cursor=cursor)
   except httpx.HTTPStatusError as e:
     st.error(f"API Error: {e.response.status_code}")
     return
@@ -66,6 +67,7 @@ def render_rfp_selection():
     st.error(f"Connection error: {e}")
     return
 
+  rfps = page["items"]
   if not rfps:
     st.info("No RFPs available. Import some RFPs first.")
     return
@@ -73,6 +75,8 @@ def render_rfp_selection():
   for rfp in rfps:
     render_rfp_card(rfp)
 
+  render_pager("matching_rfps", page.get("next_cursor"))
+
 
 def render_rfp_card(rfp: dict, find_matches_action: bool = True, boarder: bool = True):
   """Render a single RFP card with match button."""
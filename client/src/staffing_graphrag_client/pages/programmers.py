@@ -1,31 +1,41 @@
 import streamlit as st
 
 from api.client import get_programmers
-from utils.utils import set_backgroud
+from utils.utils import page_cursor, render_pager, set_backgroud
 
 
 def render():
   set_backgroud()
   st.title("💻 Programmers")
 
-  status_filter = st.selectbox(
-    "Filter by status",
-    options=[None, "available", "assigned"],
-    format_func=lambda x: "All" if x is None else x.capitalize(),
-  )
-
+  col_status, col_skill, col_location = st.columns(3)
+  with col_status:
+    status_filter = st.selectbox(
+      "Filter by status",
+      options=[None, "available", "assigned"],
+      format_func=lambda x: "All" if x is None else x.capitalize(),
+    )
+  with col_skill:
+    skill_filter = st.text_input("Skill", placeholder="e.g. Python").strip().title()
+  with col_location:
+    location_filter = st.text_input("Location").strip()
+
+  cursor = page_cursor("programmers", (status_filter, skill_filter, location_filter))
   try:
-    programmers = get_programmers(status_filter)
+    page = get_programmers(status_filter, skill_filter, location_filter, cursor)
   except Exception as e:
     st.error(f"Failed to fetch programmers: {e}")
     return
 
+  programmers = page["items"]
   if not programmers:
     st.info("No programmers found.")
     return
 
   n_programmers = len(programmers)
-  st.markdown(f"**{n_programmers}** programmer{'s' if n_programmers > 1 else ''} found")
+  st.markdown(
+    f"**{n_programmers}** programmer{'s' if n_programmers > 1 else ''} on this page"
+  )
 
   for prog in programmers:
     print(prog)
@@ -46,6 +56,8 @@ def render():
         else:
           st.warning("Available")
 
+  render_pager("programmers", page.get("next_cursor"))
+
 
 def _format_skills(skills: dict[str, list[str]]) -> str:
   order = ["Expert", "Advanced", "Intermediate", "Beginner"]
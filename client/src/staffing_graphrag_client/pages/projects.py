@@ -1,7 +1,7 @@
 import streamlit as st
 
 from api.client import get_projects
-from utils.utils import set_backgroud
+from utils.utils import page_cursor, render_pager, set_backgroud
 
 
 def _status_color(status: str | None) -> str:
@@ -16,17 +16,31 @@ def render():
   set_backgroud()
   st.title("📁 Projects")
 
+  col_status, col_client, col_skill = st.columns(3)
+  with col_status:
+    status_filter = st.selectbox(
+      "Filter by status",
+      options=[None, "active", "planned", "completed"],
+      format_func=lambda x: "All" if x is None else x.capitalize(),
+    )
+  with col_client:
+    client_filter = st.text_input("Client").strip()
+  with col_skill:
+    skill_filter = st.text_input("Skill", placeholder="e.g. Python").strip().title()
+
+  cursor = page_cursor("projects", (status_filter, client_filter, skill_filter))
   try:
-    projects = get_projects()
+    page = get_projects(status_filter, client_filter, skill_filter, cursor)
   except Exception as e:
     st.error(f"Failed to fetch projects: {e}")
     return
 
+  projects = page["items"]
   if not projects:
     st.info("No projects found.")
     return
 
-  st.markdown(f"**{len(projects)}** project(s) found")
+  st.markdown(f"**{len(projects)}** project(s) on this page")
 
   for proj in projects:
     with st.container(border=True):
@@ -55,5 +69,7 @@ def render():
       if team_ids:
         st.markdown("**Team:** " + ", ".join(team_ids))
 
+  render_pager("projects", page.get("next_cursor"))
+
 
 render()
@@ -1,7 +1,7 @@
 import httpx
 import streamlit as st
 
-from api.client import get_example_queries, query_knowledge_graph
+from api.client import get_example_queries, stream_query
 from utils.utils import set_backgroud
 
 if "query_history" not in st.session_state:
@@ -10,43 +10,65 @@ if "query_history" not in st.session_state:
 if "pending_query" not in st.session_state:
   st.session_state.pending_query = None
 
+if "full_answer" not in st.session_state:
+  st.session_state.full_answer = False
+
 
 def execute_query(question: str):
   st.session_state.query_history.append({"role": "user", "content": question})
+  with st.chat_message("user"):
+    st.markdown(question)
+
+  message = {
+    "role": "assistant",
+    "content": "",
+    "cypher": "",
+    "success": False,
+    "error": None,
+  }
+
+  with st.chat_message("assistant"):
+    cypher_slot = st.empty()
+    rows_slot = st.empty()
+    answer_slot = st.empty()
+    answer_slot.markdown("_Generating Cypher..._")
 
-  try:
-    result = query_knowledge_graph(question)
-    st.session_state.query_history.append(
-      {
-        "role": "assistant",
-        "content": result.get("answer", "No answer returned."),
-        "cypher": result.get("cypher_query", ""),
-        "success": result.get("success", False),
-        "error": result.get("error"),
-      }
-    )
-  except httpx.HTTPStatusError as e:
     try:
-      detail = e.response.json().get("detail", str(e))
-    except Exception:
-      detail = e.response.text
-    st.session_state.query_history.append(
-      {
-        "role": "assistant",
-        "content": f"API Error: {e.response.status_code}",
-        "error": detail,
-        "success": False,
-      }
-    )
-  except httpx.RequestError as e:
-    st.session_state.query_history.append(
-      {
-        "role": "assistant",
-        "content": "Connection error",
-        "error": str(e),
-        "success": False,
-      }
-    )
+      for event in stream_query(question, st.session_state.full_answer):
+        match event["event"]:
+          case "cypher":
+            message["cypher"] = event.get("cypher_query", "")
+            with cypher_slot.expander("🔧 Cypher Query"):
+              st.code(message["cypher"], language="cypher")
+            answer_slot.markdown("_Querying the graph..._")
+          case "rows":
+            rows_slot.caption(f"{event.get('row_count', 0)} row(s) returned")
+          case "token":
+            message["content"] += event.get("token", "")
+            answer_slot.markdown(message["content"])
+          case "done":
+            message["success"] = True
+            message["direct_answer"] = event.get("direct_answer", False)
+          case "rejected":
+            message["content"] = "The generated query was rejected by the query guard."
+            message["error"] = event.get("reason")
+          case "error":
+            message["content"] = "I encountered an error processing your query."
+            message["error"] = event.get("error")
+    except httpx.HTTPStatusError as e:
+      try:
+        detail = e.response.json().get("detail", str(e))
+      except Exception:
+        detail = e.response.text
+      message["content"] = f"API Error: {e.response.status_code}"
+      message["error"] = detail
+    except httpx.RequestError as e:
+      message["content"] = "Connection error"
+      message["error"] = str(e)
+
+  if message["success"] and not message["content"]:
+    message["content"] = "No answer returned."
+  st.session_state.query_history.append(message)
 
 
 def render():
@@ -54,6 +76,12 @@ def render():
   st.title("🔍 Query Knowledge Graph")
 
   with st.sidebar:
+    st.toggle(
+      "Always write the answer with the LLM",
+      key="full_answer",
+      help="Small tabular results are otherwise rendered directly, without the "
+      "slower answer-writing LLM call",
+    )
     render_examples_sidebar()
 
   render_chat_history()
@@ -101,6 +129,8 @@ def render_chat_history():
           st.code(msg["error"])
         else:
           st.markdown(msg["content"])
+          if msg.get("direct_answer"):
+            st.caption("Rendered from the query results without the LLM")
 
           cypher = msg.get("cypher", "")
           if cypher:
@@ -1,7 +1,7 @@
 import streamlit as st
 
 from api.client import get_rfps
-from utils.utils import set_backgroud
+from utils.utils import page_cursor, render_pager, set_backgroud
 
 
 def _skill_badge(skill: dict) -> str:
@@ -16,17 +16,25 @@ def render():
   set_backgroud()
   st.title("📋 RFPs")
 
+  col_client, col_skill = st.columns(2)
+  with col_client:
+    client_filter = st.text_input("Client").strip()
+  with col_skill:
+    skill_filter = st.text_input("Skill", placeholder="e.g. Python").strip().title()
+
+  cursor = page_cursor("rfps", (client_filter, skill_filter))
   try:
-    rfps = get_rfps()
+    page = get_rfps(client_filter, skill_filter, cursor)
   except Exception as e:
     st.error(f"Failed to fetch RFPs: {e}")
     return
 
+  rfps = page["items"]
   if not rfps:
     st.info("No RFPs found.")
     return
 
-  st.markdown(f"**{len(rfps)}** RFP(s) found")
+  st.markdown(f"**{len(rfps)}** RFP(s) on this page")
 
   for rfp in rfps:
     with st.container(border=True):
@@ -53,5 +61,7 @@ def render():
         if optional:
           st.markdown("Optional: " + " • ".join(_skill_badge(s) for s in optional))
 
+  render_pager("rfps", page.get("next_cursor"))
+
 
 render()
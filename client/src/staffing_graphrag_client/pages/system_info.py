@@ -1,7 +1,7 @@
 import httpx
 import streamlit as st
 
-from api.client import get_graph_stats, get_node_sample
+from api.client import get_graph_stats, get_node_samples
 from utils.utils import set_backgroud
 
 
@@ -20,6 +20,7 @@ def render():
 
 def render_stats():
   if st.button("🔄 Refresh", key="refresh_stats"):
+    get_graph_stats.clear()
     st.rerun()
 
   with st.spinner("Fetching statistics..."):
@@ -95,49 +96,59 @@ def render_stats():
 
 
 def render_samples():
-  st.markdown("View sample records for a specific node type to inspect data quality.")
+  st.markdown("View sample records for specific node types to inspect data quality.")
 
   common_labels = ["Person", "Project", "RFP", "Skill", "Company"]
 
-  label = st.selectbox(
-    "Select Node Label",
+  labels = st.multiselect(
+    "Select Node Labels",
     options=common_labels,
-    index=0,
-    help="Select a node label to fetch samples",
+    default=common_labels[:1],
+    help="Samples for all selected labels are fetched concurrently",
   )
 
   custom_label = st.text_input(
-    "Or enter custom label",
+    "Or add a custom label",
     placeholder="e.g., Certification",
   )
 
-  selected_label = custom_label.strip() if custom_label.strip() else label
+  selected_labels = list(dict.fromkeys([*labels, custom_label.strip()]))
+  selected_labels = [label for label in selected_labels if label]
 
-  if st.button("Fetch Samples", type="primary"):
-    with st.spinner(f"Fetching samples for '{selected_label}'..."):
-      try:
-        samples = get_node_sample(selected_label)
-      except httpx.HTTPStatusError as e:
-        st.error(f"API Error: {e.response.status_code}")
-        try:
-          detail = e.response.json().get("detail", str(e))
-        except Exception:
-          detail = e.response.text
-        st.code(detail)
-        return
-      except httpx.RequestError as e:
-        st.error(f"Connection error: {e}")
-        return
-
-      if not samples:
-        st.warning(f"No samples found for label '{selected_label}'.")
-        return
-
-      st.success(f"Found {len(samples)} sample(s)")
-
-      for i, sample in enumerate(samples):
-        with st.expander(f"Sample {i + 1}", expanded=(i == 0)):
-          st.json(sample)
+  if st.button("Fetch Samples", type="primary", disabled=not selected_labels):
+    with st.spinner(f"Fetching samples for {', '.join(selected_labels)}..."):
+      results = get_node_samples(selected_labels)
+
+    for selected_label, samples in results.items():
+      st.markdown(f"### {selected_label}")
+      render_label_samples(selected_label, samples)
+
+
+def render_label_samples(selected_label: str, samples: list[dict] | BaseException):
+  if isinstance(samples, httpx.HTTPStatusError):
+    st.error(f"API Error: {samples.response.status_code}")
+    try:
+      detail = samples.response.json().get("detail", str(samples))
+    except Exception:
+      detail = samples.response.text
+    st.code(detail)
+    return
+  if isinstance(samples, httpx.RequestError):
+    st.error(f"Connection error: {samples}")
+    return
+  if isinstance(samples, BaseException):
+    st.error(f"Failed to fetch samples: {samples}")
+    return
+
+  if not samples:
+    st.warning(f"No samples found for label '{selected_label}'.")
+    return
+
+  st.success(f"Found {len(samples)} sample(s)")
+
+  for i, sample in enumerate(samples):
+    with st.expander(f"Sample {i + 1}", expanded=(i == 0)):
+      st.json(sample)
 
 
 render()
@@ -31,3 +31,28 @@ def _get_page_bg_data() -> str:
 
 def set_backgroud() -> None:
   st.markdown(_get_page_bg_data(), unsafe_allow_html=True)
+
+
+def page_cursor(key: str, filters: tuple) -> str | None:
+  """Cursor of the page to show; back to the first page when filters change."""
+  if st.session_state.get(f"{key}_filters") != filters:
+    st.session_state[f"{key}_filters"] = filters
+    st.session_state[f"{key}_cursors"] = [None]
+  return st.session_state[f"{key}_cursors"][-1]
+
+
+def render_pager(key: str, next_cursor: str | None) -> None:
+  """Previous / Next buttons over the cursor stack kept in session state."""
+  cursors = st.session_state[f"{key}_cursors"]
+  col_prev, col_page, col_next = st.columns([1, 2, 1])
+
+  with col_prev:
+    if st.button("← Previous", key=f"{key}_prev", disabled=len(cursors) == 1):
+      cursors.pop()
+      st.rerun()
+  with col_page:
+    st.caption(f"Page {len(cursors)}")
+  with col_next:
+    if st.button("Next →", key=f"{key}_next", disabled=next_cursor is None):
+      cursors.append(next_cursor)
+      st.rerun()
@@ -0,0 +1,17 @@
+from pydantic import BaseModel, Field
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+class PageQuery(BaseModel):
+  limit: int = Field(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Page size")
+  cursor: str | None = Field(None, description="`next_cursor` of the previous page")
+  fields: str | None = Field(
+    None, description="Comma-separated fields to return, e.g. `id,name`"
+  )
+
+
+class PageMeta(BaseModel):
+  # Opaque keyset cursor for the next page, None on the last page
+  next_cursor: str | None = None
@@ -1,5 +1,9 @@
+from typing import Literal
+
 from pydantic import BaseModel, Field
 
+from shared_types.pagination_types import PageMeta, PageQuery
+
 
 class ProgrammerRead(BaseModel):
   id: str
@@ -16,3 +20,15 @@ class ProgrammerRead(BaseModel):
       "Beginner": [],
     }
   )
+
+
+class ProgrammerQuery(PageQuery):
+  status: Literal["available", "assigned"] | None = Field(
+    None, description="Filter by assignment status"
+  )
+  skill: str | None = Field(None, description="Only programmers with this skill id")
+  location: str | None = Field(None, description="Case-insensitive substring")
+
+
+class ProgrammerPage(PageMeta):
+  items: list[ProgrammerRead] = Field(default_factory=list)
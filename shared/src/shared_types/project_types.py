@@ -2,6 +2,8 @@ from typing import Any
 
 from pydantic import BaseModel, Field
 
+from shared_types.pagination_types import PageMeta, PageQuery
+
 
 class ProjectRead(BaseModel):
   id: str
@@ -15,3 +17,13 @@ class ProjectRead(BaseModel):
 
 class ProjectAssignmentRequest(BaseModel):
   programmer_ids: list[str]
+
+
+class ProjectQuery(PageQuery):
+  status: str | None = Field(None, description="e.g. active, planned, completed")
+  client: str | None = Field(None, description="Case-insensitive substring")
+  skill: str | None = Field(None, description="Only projects requiring this skill id")
+
+
+class ProjectPage(PageMeta):
+  items: list[ProjectRead] = Field(default_factory=list)
@@ -2,6 +2,8 @@ from typing import Literal
 
 from pydantic import BaseModel, Field
 
+from shared_types.pagination_types import PageMeta, PageQuery
+
 
 class _RFPSkillRequirement(BaseModel):
   name: str
@@ -15,3 +17,12 @@ class RFPRead(BaseModel):
   client: str | None = None
   budget: str | None = None
   needed_skills: list[_RFPSkillRequirement] = Field(default_factory=list)
+
+
+class RFPQuery(PageQuery):
+  client: str | None = Field(None, description="Case-insensitive substring")
+  skill: str | None = Field(None, description="Only RFPs needing this skill id")
+
+
+class RFPPage(PageMeta):
+  items: list[RFPRead] = Field(default_factory=list)